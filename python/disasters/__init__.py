@@ -26,6 +26,7 @@ Usage:
 """
 
 import logging
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import List, Optional
@@ -38,16 +39,22 @@ from .models import (
     WildfireResult,
     Location,
     LocationResults,
+    serialize,
     HurricaneCategory,
     TornadoScale,
     WildfireSize,
 )
-from .hurricanes import get_hurricanes_near_location, fetch_active_hurricanes
+from .hurricanes import (
+    get_hurricanes_near_location,
+    get_hurricanes_near_locations,
+    fetch_active_hurricanes,
+)
 from .tornadoes import get_tornadoes_near_location, fetch_recent_tornadoes
 from .wildfires import get_wildfires_near_location, fetch_active_wildfires
 from .utils import (
     validate_coordinates,
     load_locations_from_csv,
+    load_locations_frame,
     configure_logging,
     haversine,
     haversine_vectorized,
@@ -69,12 +76,14 @@ __all__ = [
     'WildfireResult',
     'Location',
     'LocationResults',
+    'serialize',
     # Severity enums
     'HurricaneCategory',
     'TornadoScale',
     'WildfireSize',
     # Individual fetchers
     'get_hurricanes_near_location',
+    'get_hurricanes_near_locations',
     'get_tornadoes_near_location',
     'get_wildfires_near_location',
     'fetch_active_hurricanes',
@@ -83,12 +92,37 @@ __all__ = [
     # Utilities
     'validate_coordinates',
     'load_locations_from_csv',
+    'load_locations_frame',
     'configure_logging',
     'haversine',
 ]
 
 __version__ = '0.1.0'
 
+# Per-type fetchers and the LocationResults field each one fills
+_QUERIES = {
+    DisasterType.HURRICANE: ('hurricanes', get_hurricanes_near_location),
+    DisasterType.TORNADO: ('tornadoes', get_tornadoes_near_location),
+    DisasterType.WILDFIRE: ('wildfires', get_wildfires_near_location),
+}
+
+# Types whose fetchers can evaluate all CSV locations in one vectorized call
+_BATCH_QUERIES = {
+    DisasterType.HURRICANE: ('hurricanes', get_hurricanes_near_locations),
+}
+
+# Maximum number of CSV locations queried concurrently
+MAX_LOCATION_WORKERS = 16
+
+# The fetchers are network-bound against independent hosts, so they run
+# concurrently. The pool is shared across calls so batch queries don't pay
+# thread start-up cost per location, and is sized so every concurrently
+# processed location can have all of its types in flight at once.
+_executor = ThreadPoolExecutor(
+    max_workers=len(_QUERIES) * MAX_LOCATION_WORKERS,
+    thread_name_prefix='disaster-query'
+)
+
 
 def get_nearby_disasters(
     latitude: float,
@@ -147,42 +181,27 @@ def get_nearby_disasters(
         query_time=datetime.now()
     )
     
-    # Query each disaster type
-    if DisasterType.HURRICANE in disaster_types:
-        logger.info("Querying hurricanes...")
-        try:
-            results.hurricanes = get_hurricanes_near_location(
-                latitude, longitude, radius_miles
-            )
-        except Exception as e:
-            logger.error(f"Error fetching hurricanes: {e}")
-            results.hurricanes = []
-    
-    if DisasterType.TORNADO in disaster_types:
-        logger.info("Querying tornadoes...")
-        try:
-            results.tornadoes = get_tornadoes_near_location(
-                latitude, longitude, radius_miles
+    # Query each disaster type concurrently
+    futures = {}
+    for disaster_type, (field_name, fetcher) in _QUERIES.items():
+        if disaster_type in disaster_types:
+            logger.info(f"Querying {field_name}...")
+            futures[field_name] = _executor.submit(
+                fetcher, latitude, longitude, radius_miles
             )
-        except Exception as e:
-            logger.error(f"Error fetching tornadoes: {e}")
-            results.tornadoes = []
     
-    if DisasterType.WILDFIRE in disaster_types:
-        logger.info("Querying wildfires...")
+    for field_name, future in futures.items():
         try:
-            results.wildfires = get_wildfires_near_location(
-                latitude, longitude, radius_miles
-            )
+            setattr(results, field_name, future.result())
         except Exception as e:
-            logger.error(f"Error fetching wildfires: {e}")
-            results.wildfires = []
+            logger.error(f"Error fetching {field_name}: {e}")
+            setattr(results, field_name, [])
     
-    logger.info(
-        f"Query complete: {len(results.hurricanes)} hurricanes, "
-        f"{len(results.tornadoes)} tornadoes, "
-        f"{len(results.wildfires)} wildfires"
+    # Only report the types queried here; CSV batch queries fill the rest
+    counts = ', '.join(
+        f"{len(getattr(results, field_name))} {field_name}" for field_name in futures
     )
+    logger.info(f"Query complete: {counts or 'no disaster types queried'}")
     
     return results
 
@@ -215,8 +234,9 @@ def query_locations_from_csv(
         >>> for r in results:
         ...     print(f"{r.location.name}: {r.total_disasters} disasters found")
     """
-    # Load locations from CSV
-    locations = load_locations_from_csv(csv_path)
+    # Load locations from CSV as columns, so batch fetchers get arrays
+    frame = load_locations_frame(csv_path)
+    locations = frame.to_dict('records')
     
     if not locations:
         logger.warning("No valid locations found in CSV")
@@ -224,34 +244,135 @@ def query_locations_from_csv(
     
     logger.info(f"Querying {len(locations)} locations from {csv_path}")
     
-    all_results = []
+    # Default to all disaster types
+    if disaster_types is None:
+        disaster_types = list(DisasterType)
     
-    for i, loc_data in enumerate(locations, 1):
-        logger.info(f"Processing location {i}/{len(locations)}: {loc_data['name']}")
-        
-        try:
-            results = get_nearby_disasters(
-                latitude=loc_data['latitude'],
-                longitude=loc_data['longitude'],
-                radius_miles=radius_miles,
-                disaster_types=disaster_types,
-                name=loc_data['name']
+    # Types with a batch fetcher compute every location in one call
+    lats = frame['latitude'].to_numpy()
+    lons = frame['longitude'].to_numpy()
+    batch_futures = {}
+    for disaster_type, (field_name, fetcher) in _BATCH_QUERIES.items():
+        if disaster_type in disaster_types:
+            logger.info(f"Querying {field_name} for all locations...")
+            batch_futures[disaster_type] = _executor.submit(
+                fetcher, lats, lons, radius_miles
             )
-            all_results.append(results)
-            
-        except Exception as e:
-            logger.error(f"Error processing {loc_data['name']}: {e}")
-            # Create empty results for failed location
-            location = Location(
-                name=loc_data['name'],
-                latitude=loc_data['latitude'],
-                longitude=loc_data['longitude']
+    per_location_types = [t for t in disaster_types if t not in _BATCH_QUERIES]
+    
+    # Locations are independent and network-bound, so query them on a
+    # bounded pool; futures are collected in submission order to keep
+    # results aligned with the CSV rows
+    max_workers = min(MAX_LOCATION_WORKERS, len(locations))
+    with ThreadPoolExecutor(
+        max_workers=max_workers,
+        thread_name_prefix='location-query'
+    ) as pool:
+        futures = [
+            pool.submit(
+                _query_location, loc_data, i, len(locations),
+                radius_miles, per_location_types
             )
-            all_results.append(LocationResults(
-                location=location,
-                radius_miles=radius_miles,
-                query_time=datetime.now()
-            ))
+            for i, loc_data in enumerate(locations, 1)
+        ]
+        all_results = [future.result() for future in futures]
+    
+    for disaster_type, future in batch_futures.items():
+        _merge_batch_results(disaster_type, future, all_results, radius_miles)
+    
+    for results in all_results:
+        logger.info(
+            f"Query complete for {results.location.name}: "
+            f"{len(results.hurricanes)} hurricanes, "
+            f"{len(results.tornadoes)} tornadoes, "
+            f"{len(results.wildfires)} wildfires"
+        )
     
     return all_results
 
+
+def _merge_batch_results(
+    disaster_type: DisasterType,
+    future: Future,
+    all_results: List[LocationResults],
+    radius_miles: float
+) -> None:
+    """
+    Attach a batch fetcher's per-location results to each LocationResults.
+    
+    If the batch call fails, each location is retried with the single-location
+    fetcher so one bad input doesn't blank the type for every location, and
+    any remaining failure is logged against the location it belongs to.
+    
+    Args:
+        disaster_type: Disaster type the batch fetcher queried
+        future: Future holding the batch fetcher's result
+        all_results: LocationResults aligned with the batch inputs
+        radius_miles: Search radius in miles
+    """
+    field_name = _BATCH_QUERIES[disaster_type][0]
+    try:
+        for results, found in zip(all_results, future.result()):
+            setattr(results, field_name, found)
+        return
+    except Exception as e:
+        logger.error(f"Error fetching {field_name} for all locations, retrying per location: {e}")
+    
+    fetcher = _QUERIES[disaster_type][1]
+    retries = [
+        _executor.submit(
+            fetcher, results.location.latitude, results.location.longitude, radius_miles
+        )
+        for results in all_results
+    ]
+    for results, retry in zip(all_results, retries):
+        try:
+            setattr(results, field_name, retry.result())
+        except Exception as e:
+            logger.error(f"Error fetching {field_name} for {results.location.name}: {e}")
+
+
+def _query_location(
+    loc_data: dict,
+    index: int,
+    total: int,
+    radius_miles: float,
+    disaster_types: Optional[List[DisasterType]]
+) -> LocationResults:
+    """
+    Query disasters for one CSV location, returning empty results on failure.
+    
+    Args:
+        loc_data: Location record from load_locations_frame
+        index: 1-based position of the location in the CSV (for logging)
+        total: Total number of locations being processed (for logging)
+        radius_miles: Search radius in miles
+        disaster_types: List of DisasterType to query, or None for all
+        
+    Returns:
+        LocationResults for the location
+    """
+    logger.info(f"Processing location {index}/{total}: {loc_data['name']}")
+    
+    try:
+        return get_nearby_disasters(
+            latitude=loc_data['latitude'],
+            longitude=loc_data['longitude'],
+            radius_miles=radius_miles,
+            disaster_types=disaster_types,
+            name=loc_data['name']
+        )
+        
+    except Exception as e:
+        logger.error(f"Error processing {loc_data['name']}: {e}")
+        # Create empty results for failed location
+        location = Location(
+            name=loc_data['name'],
+            latitude=loc_data['latitude'],
+            longitude=loc_data['longitude']
+        )
+        return LocationResults(
+            location=location,
+            radius_miles=radius_miles,
+            query_time=datetime.now()
+        )
@@ -8,21 +8,25 @@ This module provides functions to:
 """
 
 import json
-import time
 import logging
 from datetime import datetime
-from typing import List, Optional, Tuple
+from operator import attrgetter
+from typing import Dict, List, Optional, Sequence, Tuple
 
 import numpy as np
 import pandas as pd
 
 from .models import HurricaneResult, HurricaneCategory
 from .utils import (
-    haversine,
     haversine_vectorized,
-    is_point_in_polygon_vectorized,
-    create_retry_session,
-    EARTH_RADIUS_MILES
+    polygon_distances,
+    bbox_candidates,
+    get_shared_session,
+    fetch_arcgis_layers,
+    features_to_dataframe,
+    ttl_cache,
+    EARTH_RADIUS_MILES,
+    STALE_IF_ERROR_SECONDS
 )
 
 # Configure module logger
@@ -33,13 +37,27 @@ HURRICANE_BASE_URL = 'https://services9.arcgis.com/RHVPKKiFTONKtxq3/ArcGIS/rest/
 CONE_LAYER = 4      # Forecast cones (polygons)
 DETAILS_LAYER = 0   # Detailed forecast points
 
+# Forecast point fields read when building results
+_POSITION_FIELDS = ['MAXWIND', 'SSNUM', 'LAT', 'LON', 'STORMTYPE', 'GUST', 'TCDIR', 'TCSPD', 'MSLP']
 
+# Cap on (location, vertex) pairs evaluated at once in batch distance queries
+_MAX_PAIRWISE_ELEMENTS = 1_000_000
+
+
+def _fetch_succeeded(result: Tuple[Optional[pd.DataFrame], Optional[pd.DataFrame]]) -> bool:
+    """Whether a fetch_active_hurricanes result should be cached."""
+    return result[0] is not None
+
+
+@ttl_cache(cache_if=_fetch_succeeded, stale_if_error=STALE_IF_ERROR_SECONDS)
 def fetch_active_hurricanes(max_retries: int = 5) -> Tuple[Optional[pd.DataFrame], Optional[pd.DataFrame]]:
     """
     Fetch all active hurricane data from NOAA/NHC.
     
     Retrieves both forecast cone polygons and detailed forecast points
-    from the ArcGIS services.
+    from the ArcGIS services. Successful results are cached for 10 minutes
+    (advisories update every few hours), so batch queries fetch once. If a
+    refresh fails, the last successful result is returned for up to an hour.
     
     Args:
         max_retries: Maximum number of retry attempts for API calls
@@ -65,58 +83,11 @@ def fetch_active_hurricanes(max_retries: int = 5) -> Tuple[Optional[pd.DataFrame
         'resultRecordCount': 2000
     }
     
-    def fetch_layer(url: str) -> Optional[List[dict]]:
-        """Fetch all features from a single layer with pagination."""
-        all_features = []
-        offset = 0
-        session = create_retry_session(retries=max_retries)
-        
-        while True:
-            params['resultOffset'] = offset
-            logger.debug(f"Fetching from {url} with offset: {offset}")
-            
-            try:
-                response = session.get(url, params=params, timeout=30)
-                data = response.json()
-                
-                if 'error' in data:
-                    error = data['error']
-                    logger.error(f"API error: {error}")
-                    
-                    # Handle rate limiting
-                    if error.get('code') == 429:
-                        details = error.get('details', ['wait 60 seconds'])
-                        try:
-                            retry_after = int(details[0].split()[-2])
-                        except (IndexError, ValueError):
-                            retry_after = 60
-                        logger.info(f"Rate limited. Waiting {retry_after} seconds...")
-                        time.sleep(retry_after)
-                        continue
-                    return None
-                
-                if 'features' not in data:
-                    logger.warning("No features in response")
-                    return [] if offset == 0 else all_features
-                
-                features = data['features']
-                logger.debug(f"Fetched {len(features)} features")
-                all_features.extend(features)
-                
-                if len(features) < params['resultRecordCount']:
-                    break
-                    
-                offset += len(features)
-                
-            except Exception as e:
-                logger.error(f"Request error: {str(e)}")
-                return None
-        
-        return all_features
-    
-    # Fetch both layers
-    cone_features = fetch_layer(cone_url)
-    detailed_features = fetch_layer(detailed_url)
+    # Both layers and all of their pages are fetched concurrently
+    session = get_shared_session(retries=max_retries)
+    cone_features, detailed_features = fetch_arcgis_layers(
+        session, [cone_url, detailed_url], params
+    )
     
     if cone_features is None:
         logger.error("Failed to fetch cone data")
@@ -132,10 +103,17 @@ def fetch_active_hurricanes(max_retries: int = 5) -> Tuple[Optional[pd.DataFrame
     
     # Convert to DataFrames
     if cone_features:
-        cone_df = pd.DataFrame([
-            {**feature['attributes'], 'geometry': json.dumps(feature.get('geometry', {}))}
-            for feature in cone_features
-        ])
+        cone_df = features_to_dataframe(cone_features)
+        # Geometry stays a parsed dict; no JSON round-trip before use
+        cone_df['geometry'] = [feature.get('geometry', {}) for feature in cone_features]
+        
+        # Parse each cone's outer ring once here, so cached data is ready
+        # for the per-query polygon math
+        cone_df['ring'] = pd.Series(
+            [_outer_ring(geometry) for geometry in cone_df['geometry']],
+            index=cone_df.index,
+            dtype=object
+        )
         
         # Process date columns
         if 'ADVDATE' in cone_df.columns:
@@ -146,7 +124,7 @@ def fetch_active_hurricanes(max_retries: int = 5) -> Tuple[Optional[pd.DataFrame
         cone_df = pd.DataFrame()
     
     if detailed_features:
-        detailed_df = pd.DataFrame([feature['attributes'] for feature in detailed_features])
+        detailed_df = features_to_dataframe(detailed_features)
     else:
         detailed_df = pd.DataFrame()
     
@@ -178,29 +156,88 @@ def get_hurricanes_near_location(
         >>> for h in hurricanes:
         ...     print(f"{h.name}: {h.distance_miles:.1f} miles")
     """
-    results = []
+    return get_hurricanes_near_locations([lat], [lon], radius_miles)[0]
+
+
+def get_hurricanes_near_locations(
+    lats: Sequence[float],
+    lons: Sequence[float],
+    radius_miles: float = 100.0
+) -> List[List[HurricaneResult]]:
+    """
+    Get all hurricanes within a specified radius of each of several locations.
+    
+    Batch version of get_hurricanes_near_location: the hurricane data is
+    fetched once and the distances from every location to every cone vertex
+    are computed as one broadcast (locations x vertices) array operation.
+    
+    Args:
+        lats: Latitudes of the query locations (decimal degrees)
+        lons: Longitudes of the query locations (decimal degrees)
+        radius_miles: Maximum distance in miles to include (default: 100)
+        
+    Returns:
+        One list of HurricaneResult objects per location, each sorted by
+        distance (closest first)
+        
+    Example:
+        >>> per_location = get_hurricanes_near_locations(
+        ...     [29.7604, 25.7617], [-95.3698, -80.1918]
+        ... )
+        >>> houston, miami = per_location
+    """
+    lats = np.asarray(lats, dtype=float)
+    lons = np.asarray(lons, dtype=float)
     
     cone_df, detailed_df = fetch_active_hurricanes()
     
     if cone_df is None or cone_df.empty:
         logger.info("No active hurricanes to process")
-        return results
+        return [[] for _ in range(len(lats))]
     
     # Get the latest position data for each storm from detailed_df
     storm_positions = {}
     if detailed_df is not None and not detailed_df.empty:
-        # Group by storm and get current position (TAU=0 or lowest TAU)
-        for _, row in detailed_df.iterrows():
-            storm_key = (row.get('STORMNAME'), row.get('STORMNUM'))
-            tau = row.get('TAU', 999)
-            
-            if storm_key not in storm_positions or tau < storm_positions[storm_key].get('TAU', 999):
-                storm_positions[storm_key] = row.to_dict()
+        storm_positions = _latest_storm_positions(detailed_df)
+    
+    # Distances from every location to all cones in one vectorized pass
+    cones = cone_df.to_dict('records')
+    cone_distances, cones_inside = _calculate_distances_to_cones(
+        lats, lons, cones, radius_miles
+    )
+    
+    return [
+        _build_hurricane_results(cones, distances, inside, storm_positions, radius_miles)
+        for distances, inside in zip(cone_distances, cones_inside)
+    ]
+
+
+def _build_hurricane_results(
+    cones: List[dict],
+    cone_distances: List[float],
+    cones_inside: List[bool],
+    storm_positions: Dict[tuple, dict],
+    radius_miles: float
+) -> List[HurricaneResult]:
+    """
+    Build the hurricane results for one location from its cone distances.
+    
+    Args:
+        cones: Cone records (DataFrame rows as dicts)
+        cone_distances: Distance in miles from the location to each cone
+        cones_inside: Whether the location is inside each cone
+        storm_positions: Current position record per (STORMNAME, STORMNUM)
+        radius_miles: Maximum distance in miles to include
+        
+    Returns:
+        List of HurricaneResult objects sorted by distance (closest first)
+    """
+    results = []
     
     # Process each forecast cone
     processed_storms = set()
     
-    for _, cone in cone_df.iterrows():
+    for cone, distance, inside_cone in zip(cones, cone_distances, cones_inside):
         storm_name = cone.get('STORMNAME', 'Unknown')
         storm_num = cone.get('STORMNUM')
         storm_key = (storm_name, storm_num)
@@ -211,9 +248,6 @@ def get_hurricanes_near_location(
             continue
         
         try:
-            # Calculate distance to cone
-            distance, inside_cone = _calculate_distance_to_cone(lat, lon, cone)
-            
             # Check if within radius
             if distance > radius_miles and not inside_cone:
                 continue
@@ -276,68 +310,177 @@ def get_hurricanes_near_location(
             continue
     
     # Sort by distance
-    results.sort(key=lambda x: x.distance_miles)
+    results.sort(key=attrgetter('distance_miles'))
     
     logger.info(f"Found {len(results)} hurricanes within {radius_miles} miles")
     return results
 
 
-def _calculate_distance_to_cone(
-    user_lat: float,
-    user_lon: float,
-    cone: pd.Series
-) -> Tuple[float, bool]:
+def _latest_storm_positions(detailed_df: pd.DataFrame) -> Dict[tuple, dict]:
     """
-    Calculate distance from a point to a hurricane forecast cone.
+    Get the current position record for each storm.
+    
+    The current position is the forecast point with the lowest TAU (hours
+    from the advisory time); records without a TAU are only used when a
+    storm has no other points.
     
     Args:
-        user_lat: User's latitude
-        user_lon: User's longitude
-        cone: DataFrame row containing cone geometry
+        detailed_df: DataFrame of detailed forecast points
         
     Returns:
-        Tuple of (distance_miles, is_inside_cone)
+        Dictionary mapping (STORMNAME, STORMNUM) to the position record,
+        limited to the fields in _POSITION_FIELDS
     """
-    try:
-        geometry_str = cone.get('geometry', '{}')
-        geometry = json.loads(geometry_str) if isinstance(geometry_str, str) else geometry_str
-        
-        if not geometry or 'rings' not in geometry:
-            # No polygon geometry, use point distance if available
-            cone_lat = cone.get('LAT')
-            cone_lon = cone.get('LON')
-            if cone_lat and cone_lon:
-                distance = haversine(user_lon, user_lat, float(cone_lon), float(cone_lat))
-                return distance, False
-            return float('inf'), False
-        
-        # Get the outer ring of the polygon
-        polygon = np.array(geometry['rings'][0])
-        
-        # Check if point is inside the cone
-        inside = is_point_in_polygon_vectorized(
-            np.array([user_lon]),
-            np.array([user_lat]),
-            polygon
-        )
-        
-        if inside[0]:
-            return 0.0, True
+    key_columns = ['STORMNAME', 'STORMNUM']
+    positions = detailed_df.assign(
+        **{col: None for col in key_columns if col not in detailed_df.columns}
+    )
+    
+    # Stable sort keeps the first record among equal TAUs; NaNs sort last
+    if 'TAU' in positions.columns:
+        tau = pd.to_numeric(positions['TAU'], errors='coerce').to_numpy(dtype=float)
+        positions = positions.iloc[np.argsort(tau, kind='stable')]
+    
+    latest = positions.drop_duplicates(subset=key_columns, keep='first')
+    keys = zip(latest['STORMNAME'], latest['STORMNUM'])
+    
+    # Only materialize the fields results are built from
+    fields = [col for col in _POSITION_FIELDS if col in latest.columns]
+    return dict(zip(keys, latest[fields].to_dict('records')))
+
+
+def _calculate_distances_to_cones(
+    user_lats: np.ndarray,
+    user_lons: np.ndarray,
+    cones: List[dict],
+    max_miles: float = np.inf
+) -> Tuple[List[List[float]], List[List[bool]]]:
+    """
+    Calculate distances from each query point to every hurricane forecast cone.
+    
+    Points and cones whose bounding boxes rule out any pair within
+    max_miles skip the polygon math; the remaining polygon cones are handled
+    in one vectorized pass by _polygon_distances. The candidate pairs come
+    from a latitude-sorted bounding-box index, so large CSV batches don't
+    test every point against every cone.
+    
+    Args:
+        user_lats: Latitudes of the query points
+        user_lons: Longitudes of the query points
+        cones: Cone records (DataFrame rows as dicts) with a parsed 'ring'
+            from fetch_active_hurricanes, or a geometry dict / JSON string
+        max_miles: Polygon cone distances beyond this may be reported as inf
+            (default: no limit)
         
-        # Calculate minimum distance to polygon boundary
-        distances = haversine_vectorized(
-            user_lon,
-            user_lat,
-            polygon[:, 0],
-            polygon[:, 1]
-        )
+    Returns:
+        Tuple of (distance_miles, is_inside_cone) nested lists, one row per
+        query point with one entry per cone
+    """
+    distances = np.full((len(user_lats), len(cones)), np.inf)
+    inside = np.zeros((len(user_lats), len(cones)), dtype=bool)
+    polygons = []
+    polygon_cones = []
+    
+    for i, cone in enumerate(cones):
+        try:
+            polygon = cone['ring'] if 'ring' in cone else _outer_ring(cone.get('geometry'))
+            
+            if polygon is None:
+                # No polygon geometry, use point distance if available
+                cone_lat = cone.get('LAT')
+                cone_lon = cone.get('LON')
+                if cone_lat and cone_lon:
+                    distances[:, i] = haversine_vectorized(
+                        user_lons, user_lats, float(cone_lon), float(cone_lat)
+                    )
+                continue
+            
+            if len(polygon) == 0:
+                continue
+            
+            polygons.append(polygon)
+            polygon_cones.append(i)
+            
+        except Exception as e:
+            logger.error(f"Error calculating cone distance: {str(e)}")
+    
+    if polygons:
+        # Cheap bounding-box reject: only points that could be within
+        # max_miles of some cone, and cones that could be within max_miles of
+        # some point, go through the polygon math
+        bboxes = np.array([
+            [*polygon.min(axis=0), *polygon.max(axis=0)] for polygon in polygons
+        ])
+        near_points, near_boxes = bbox_candidates(user_lons, user_lats, bboxes, max_miles)
+        point_rows = np.unique(near_points)
+        near_polygons = np.unique(near_boxes)
         
-        min_distance = float(np.min(distances))
-        return min_distance, False
+        if len(point_rows):
+            _polygon_distances(
+                user_lats[point_rows],
+                user_lons[point_rows],
+                [polygons[k] for k in near_polygons],
+                max_miles,
+                distances,
+                inside,
+                point_rows,
+                np.array(polygon_cones)[near_polygons]
+            )
+    
+    distances[inside] = 0.0
+    return distances.tolist(), inside.tolist()
+
+
+def _outer_ring(geometry) -> Optional[np.ndarray]:
+    """
+    Extract a cone's outer ring as an (n, 2) lon/lat array.
+    
+    Args:
+        geometry: ArcGIS polygon geometry dict (or JSON string)
         
+    Returns:
+        The outer ring (possibly empty), or None if there is no polygon geometry
+    """
+    try:
+        if isinstance(geometry, str):
+            geometry = json.loads(geometry)
+        if not geometry or 'rings' not in geometry:
+            return None
+        ring = np.array(geometry['rings'][0], dtype=float)
+        return ring[:, :2] if len(ring) else np.empty((0, 2))
     except Exception as e:
-        logger.error(f"Error calculating cone distance: {str(e)}")
-        return float('inf'), False
+        logger.error(f"Error parsing cone geometry: {str(e)}")
+        return np.empty((0, 2))
+
+
+def _polygon_distances(
+    user_lats: np.ndarray,
+    user_lons: np.ndarray,
+    polygons: List[np.ndarray],
+    max_miles: float,
+    distances: np.ndarray,
+    inside: np.ndarray,
+    rows: np.ndarray,
+    columns: np.ndarray
+) -> None:
+    """
+    Fill distances/inside at (rows, columns) for points against polygon cones.
+    
+    All polygons are concatenated into one vertex array, so the containment
+    test and the vertex distances run as a single pass over every
+    (point, vertex) pair. Points are processed in chunks to bound the size of
+    the pairwise arrays.
+    """
+    vertices = np.concatenate(polygons)
+    starts = np.cumsum([0] + [len(polygon) for polygon in polygons[:-1]])
+    chunk = max(1, _MAX_PAIRWISE_ELEMENTS // len(vertices))
+    
+    for lo in range(0, len(user_lats), chunk):
+        cells = np.ix_(rows[lo:lo + chunk], columns)
+        distances[cells], inside[cells] = polygon_distances(
+            user_lons[lo:lo + chunk], user_lats[lo:lo + chunk],
+            vertices[:, 0], vertices[:, 1], starts, max_miles
+        )
 
 
 def _format_direction(degrees: Optional[float]) -> Optional[str]:
@@ -7,10 +7,22 @@ This module defines all data structures used throughout the application:
 - Serialization methods for JSON output
 """
 
+import json
+import math
+from bisect import bisect_right
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Optional, Dict, Any, List
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+import numpy as np
+
+# orjson is optional; without it serialize() falls back to stdlib json
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 
 # =============================================================================
@@ -45,20 +57,13 @@ class HurricaneCategory(Enum):
     @classmethod
     def from_wind_speed(cls, wind_mph: float) -> 'HurricaneCategory':
         """Determine category from maximum sustained wind speed."""
-        if wind_mph < 39:
-            return cls.TROPICAL_DEPRESSION
-        elif wind_mph < 74:
-            return cls.TROPICAL_STORM
-        elif wind_mph < 96:
-            return cls.CATEGORY_1
-        elif wind_mph < 111:
-            return cls.CATEGORY_2
-        elif wind_mph < 130:
-            return cls.CATEGORY_3
-        elif wind_mph < 157:
-            return cls.CATEGORY_4
-        else:
-            return cls.CATEGORY_5
+        return _WIND_CATEGORIES[bisect_right(_WIND_THRESHOLDS_MPH, wind_mph)]
+    
+    @classmethod
+    def from_wind_speed_array(cls, winds_mph: Sequence[float]) -> List['HurricaneCategory']:
+        """Determine categories for an array of wind speeds in one pass."""
+        indexes = np.searchsorted(_WIND_THRESHOLDS_MPH, np.asarray(winds_mph, dtype=float), side='right')
+        return [_WIND_CATEGORIES[i] for i in indexes.tolist()]
     
     @classmethod
     def from_ssnum(cls, ssnum: int) -> 'HurricaneCategory':
@@ -90,6 +95,19 @@ class HurricaneCategory(Enum):
         return descriptions.get(self, "Unknown")
 
 
+# Lower wind bounds (mph) of each category above Tropical Depression
+_WIND_THRESHOLDS_MPH = (39, 74, 96, 111, 130, 157)
+_WIND_CATEGORIES = (
+    HurricaneCategory.TROPICAL_DEPRESSION,
+    HurricaneCategory.TROPICAL_STORM,
+    HurricaneCategory.CATEGORY_1,
+    HurricaneCategory.CATEGORY_2,
+    HurricaneCategory.CATEGORY_3,
+    HurricaneCategory.CATEGORY_4,
+    HurricaneCategory.CATEGORY_5,
+)
+
+
 class TornadoScale(Enum):
     """
     Enhanced Fujita (EF) Scale for tornado intensity.
@@ -164,7 +182,7 @@ class WildfireSize(Enum):
 # Data Classes - Location
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class Location:
     """
     A geographic location for disaster queries.
@@ -200,7 +218,7 @@ class Location:
 # Data Classes - Disaster Results
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class DisasterResult:
     """
     Base class for all disaster result types.
@@ -216,21 +234,33 @@ class DisasterResult:
     details: Dict[str, Any] = field(default_factory=dict)
     last_updated: Optional[datetime] = None
     
-    def to_dict(self) -> dict:
-        """Convert to dictionary for JSON serialization."""
+    def to_dict(self, round_output: bool = True) -> dict:
+        """
+        Convert to dictionary for JSON serialization.
+        
+        Args:
+            round_output: Round distances and coordinates for display
+                (default: True); pass False to keep full precision
+        """
+        if round_output:
+            distance = round(self.distance_miles, 2)
+            latitude = round(self.latitude, 4)
+            longitude = round(self.longitude, 4)
+        else:
+            distance, latitude, longitude = self.distance_miles, self.latitude, self.longitude
         return {
             'disaster_type': self.disaster_type.value,
             'name': self.name,
-            'distance_miles': round(self.distance_miles, 2),
-            'latitude': round(self.latitude, 4),
-            'longitude': round(self.longitude, 4),
+            'distance_miles': distance,
+            'latitude': latitude,
+            'longitude': longitude,
             'severity': self.severity,
             'details': self.details,
             'last_updated': self.last_updated.isoformat() if self.last_updated else None
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class HurricaneResult(DisasterResult):
     """
     Result for a hurricane/cyclone query.
@@ -251,9 +281,9 @@ class HurricaneResult(DisasterResult):
         """Ensure disaster_type is set correctly."""
         self.disaster_type = DisasterType.HURRICANE
     
-    def to_dict(self) -> dict:
+    def to_dict(self, round_output: bool = True) -> dict:
         """Convert to dictionary for JSON serialization."""
-        base = super().to_dict()
+        base = DisasterResult.to_dict(self, round_output)
         base.update({
             'category': self.category.value if self.category else None,
             'max_wind_mph': self.max_wind_mph,
@@ -268,7 +298,7 @@ class HurricaneResult(DisasterResult):
         return base
 
 
-@dataclass
+@dataclass(slots=True)
 class TornadoResult(DisasterResult):
     """
     Result for a tornado query.
@@ -287,9 +317,9 @@ class TornadoResult(DisasterResult):
         """Ensure disaster_type is set correctly."""
         self.disaster_type = DisasterType.TORNADO
     
-    def to_dict(self) -> dict:
+    def to_dict(self, round_output: bool = True) -> dict:
         """Convert to dictionary for JSON serialization."""
-        base = super().to_dict()
+        base = DisasterResult.to_dict(self, round_output)
         base.update({
             'ef_scale': f"EF{self.ef_scale.value}" if self.ef_scale else None,
             'max_wind_mph': self.max_wind_mph,
@@ -302,7 +332,7 @@ class TornadoResult(DisasterResult):
         return base
 
 
-@dataclass
+@dataclass(slots=True)
 class WildfireResult(DisasterResult):
     """
     Result for a wildfire query.
@@ -319,12 +349,12 @@ class WildfireResult(DisasterResult):
         """Ensure disaster_type is set correctly."""
         self.disaster_type = DisasterType.WILDFIRE
     
-    def to_dict(self) -> dict:
+    def to_dict(self, round_output: bool = True) -> dict:
         """Convert to dictionary for JSON serialization."""
-        base = super().to_dict()
+        base = DisasterResult.to_dict(self, round_output)
         base.update({
             'size_category': self.size_category.value if self.size_category else None,
-            'acres': round(self.acres, 1) if self.acres else None,
+            'acres': (round(self.acres, 1) if round_output else self.acres) if self.acres else None,
             'containment_percent': self.containment_percent,
             'inside_perimeter': self.inside_perimeter,
             'fire_id': self.fire_id
@@ -336,7 +366,7 @@ class WildfireResult(DisasterResult):
 # Data Classes - Aggregated Results
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class LocationResults:
     """
     Aggregated results for a single location query.
@@ -360,16 +390,26 @@ class LocationResults:
         """Whether any disasters were found."""
         return self.total_disasters > 0
     
-    def to_dict(self) -> dict:
-        """Convert to dictionary for JSON serialization."""
+    def to_dict(self, round_output: bool = True) -> dict:
+        """
+        Convert to dictionary for JSON serialization.
+        
+        Args:
+            round_output: Round the disaster results' distances and
+                coordinates for display (default: True)
+        """
+        return self._as_dict(lambda result: result.to_dict(round_output))
+    
+    def _as_dict(self, convert: Callable[[DisasterResult], Any]) -> dict:
+        """Build the to_dict() layout, converting each disaster result with convert."""
         return {
             'query_time': self.query_time.isoformat() if self.query_time else None,
             'location': self.location.to_dict(),
             'radius_miles': self.radius_miles,
             'results': {
-                'hurricanes': [h.to_dict() for h in self.hurricanes],
-                'tornadoes': [t.to_dict() for t in self.tornadoes],
-                'wildfires': [w.to_dict() for w in self.wildfires]
+                'hurricanes': [convert(h) for h in self.hurricanes],
+                'tornadoes': [convert(t) for t in self.tornadoes],
+                'wildfires': [convert(w) for w in self.wildfires]
             },
             'summary': {
                 'total_disasters': self.total_disasters,
@@ -379,3 +419,71 @@ class LocationResults:
             }
         }
 
+
+# =============================================================================
+# Serialization
+# =============================================================================
+
+def serialize(data: Any, indent: bool = True) -> bytes:
+    """
+    Serialize results to UTF-8 encoded JSON.
+    
+    Model objects are converted with their to_dict() methods, so the output
+    follows the same schema (rounding, enum values) as to_dict(). Passing
+    LocationResults objects rather than their to_dict() output lets each
+    disaster result be converted only as it is encoded. NaN and infinite
+    values are written as null. Encoding uses orjson when it is installed
+    and the standard library json module otherwise.
+    
+    Args:
+        data: A to_dict() result, a model object, or a container of either
+        indent: Pretty-print with two-space indentation (default: True)
+        
+    Returns:
+        JSON document as bytes
+        
+    Example:
+        >>> results = get_nearby_disasters(29.7604, -95.3698)
+        >>> Path("results.json").write_bytes(serialize(results))
+    """
+    if ORJSON_AVAILABLE:
+        # Pass dataclasses and datetimes to _json_default so both encoders
+        # produce the same document
+        option = orjson.OPT_PASSTHROUGH_DATACLASS | orjson.OPT_PASSTHROUGH_DATETIME
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, default=_json_default, option=option)
+    # Match orjson's output: UTF-8 text rather than \u escapes, no spaces
+    # after separators in the compact form, and null for NaN and infinity
+    # (which json would write as the invalid tokens NaN and Infinity)
+    separators = None if indent else (',', ':')
+    return json.dumps(
+        _finite_or_none(data), indent=2 if indent else None, separators=separators,
+        ensure_ascii=False, allow_nan=False,
+        default=lambda obj: _finite_or_none(_json_default(obj))
+    ).encode('utf-8')
+
+
+def _finite_or_none(obj: Any) -> Any:
+    """Replace NaN and infinite floats in JSON-native containers with None."""
+    if isinstance(obj, float):
+        return obj if math.isfinite(obj) else None
+    if isinstance(obj, dict):
+        return {key: _finite_or_none(value) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_finite_or_none(value) for value in obj]
+    return obj
+
+
+def _json_default(obj: Any) -> Any:
+    """Convert values the JSON encoders do not handle natively."""
+    if isinstance(obj, LocationResults):
+        # Leave the disaster results as objects; the encoder calls back for
+        # each one as it reaches it, so only one result dict exists at a time
+        return obj._as_dict(lambda result: result)
+    if hasattr(obj, 'to_dict'):
+        return obj.to_dict()
+    if isinstance(obj, float):
+        # float subclasses such as numpy.float64 stay numbers
+        return float(obj)
+    return str(obj)
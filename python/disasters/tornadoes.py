@@ -9,12 +9,20 @@ This module provides functions to:
 
 import logging
 from datetime import datetime, timedelta
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
-import requests
+import numpy as np
+import pandas as pd
 
 from .models import TornadoResult, TornadoScale
-from .utils import haversine, create_retry_session
+from .utils import (
+    haversine_batch,
+    points_near_point,
+    get_shared_session,
+    fetch_arcgis_layers,
+    ttl_cache,
+    STALE_IF_ERROR_SECONDS
+)
 
 # Configure module logger
 logger = logging.getLogger(__name__)
@@ -22,17 +30,37 @@ logger = logging.getLogger(__name__)
 # API Configuration
 TORNADO_API_URL = "https://services.dat.noaa.gov/arcgis/rest/services/nws_damageassessmenttoolkit/DamageViewer/FeatureServer/1/query"
 
+# Attributes read when building a TornadoResult, looked up once each
+_FIELDS = (
+    'efnum', 'stormdate', 'maxwind', 'length', 'width', 'fatalities', 'injuries',
+    'objectid', 'event_id', 'endlat', 'endlon', 'efscale', 'comments',
+)
 
+# Feature list last passed to _start_coordinates and its parsed start points
+_start_coordinates_cache: Tuple[Optional[List[dict]], np.ndarray, np.ndarray] = (
+    None, np.empty(0), np.empty(0)
+)
+
+
+def _fetch_succeeded(features: Optional[List[dict]]) -> bool:
+    """Whether a fetch_recent_tornadoes result should be cached."""
+    return features is not None
+
+
+@ttl_cache(cache_if=_fetch_succeeded, stale_if_error=STALE_IF_ERROR_SECONDS)
 def fetch_recent_tornadoes(
     days_ago: int = 14,
     min_ef_scale: int = 0,
     max_retries: int = 3
-) -> List[dict]:
+) -> Optional[List[dict]]:
     """
     Fetch recent tornado reports from NOAA.
     
     Queries the NOAA Damage Assessment Toolkit for tornado reports
-    within the specified date range and minimum EF scale.
+    within the specified date range and minimum EF scale. Results,
+    including empty ones, are cached for 10 minutes per (days_ago,
+    min_ef_scale) combination, and returned for up to an hour more if a
+    refresh fails.
     
     Args:
         days_ago: Number of days in the past to search (default: 14)
@@ -40,7 +68,8 @@ def fetch_recent_tornadoes(
         max_retries: Maximum number of retry attempts
         
     Returns:
-        List of tornado feature dictionaries from the API
+        List of tornado feature dictionaries from the API (attributes only,
+        without track geometry), or None if the data could not be fetched
         
     Example:
         >>> tornadoes = fetch_recent_tornadoes(days_ago=30, min_ef_scale=2)
@@ -56,50 +85,22 @@ def fetch_recent_tornadoes(
     if min_ef_scale > 0:
         where_clause += f" AND efnum >= {min_ef_scale}"
     
+    # Results are built from the start/end point attributes, so the track
+    # geometry (most of each response) is not requested
     params = {
         'where': where_clause,
         'outFields': '*',
-        'returnGeometry': 'true',
+        'returnGeometry': 'false',
         'f': 'json',
-        'resultOffset': 0,
         'resultRecordCount': 1000
     }
     
-    all_features = []
-    session = create_retry_session(retries=max_retries)
+    session = get_shared_session(retries=max_retries)
+    (all_features,) = fetch_arcgis_layers(session, [TORNADO_API_URL], params)
     
-    while True:
-        logger.debug(f"Fetching tornadoes with offset: {params['resultOffset']}")
-        
-        try:
-            response = session.get(TORNADO_API_URL, params=params, timeout=30)
-            
-            if response.status_code != 200:
-                logger.error(f"API error: Status {response.status_code}")
-                break
-            
-            data = response.json()
-            
-            if 'error' in data:
-                logger.error(f"API error: {data['error']}")
-                break
-            
-            if 'features' not in data:
-                logger.warning("No features in response")
-                break
-            
-            features = data['features']
-            all_features.extend(features)
-            logger.debug(f"Fetched {len(features)} features")
-            
-            if len(features) < params['resultRecordCount']:
-                break
-                
-            params['resultOffset'] += params['resultRecordCount']
-            
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Request error: {str(e)}")
-            break
+    if all_features is None:
+        logger.error("Failed to fetch tornado data")
+        return None
     
     logger.info(f"Total tornadoes fetched: {len(all_features)}")
     return all_features
@@ -144,32 +145,35 @@ def get_tornadoes_near_location(
         logger.info("No tornado data available")
         return results
     
-    for feature in tornado_features:
+    # A bounding-box test rejects most start points without any trig; exact
+    # distances are computed only for the rest, and only tornadoes within
+    # the radius go on to build results
+    start_lats, start_lons = _start_coordinates(tornado_features)
+    candidates = np.flatnonzero(points_near_point(lon, lat, start_lons, start_lats, radius_miles))
+    distances = haversine_batch(lon, lat, start_lons[candidates], start_lats[candidates])
+    within = np.flatnonzero(distances <= radius_miles)
+    
+    # Build results in distance order (stable, so ties keep feed order),
+    # which leaves them sorted without a key-function sort afterwards
+    nearest_first = within[np.argsort(distances[within], kind='stable')]
+    
+    # All results from one scan share the same retrieval time
+    now = datetime.now()
+    
+    for i, distance in zip(candidates[nearest_first].tolist(), distances[nearest_first].tolist()):
         try:
-            attrs = feature.get('attributes', {})
-            
-            # Get tornado start position
-            start_lat = attrs.get('startlat')
-            start_lon = attrs.get('startlon')
-            
-            if start_lat is None or start_lon is None:
-                continue
-            
-            # Calculate distance
-            distance = haversine(lon, lat, float(start_lon), float(start_lat))
-            
-            if distance > radius_miles:
-                continue
+            attrs = tornado_features[i].get('attributes', {})
+            (efnum, stormdate, maxwind, length, width, fatalities, injuries,
+             objectid, event_id, endlat, endlon, efscale, comments) = map(attrs.get, _FIELDS)
             
             # Parse EF scale
-            efnum = attrs.get('efnum')
             ef_scale = TornadoScale.from_efnum(int(efnum)) if efnum is not None else None
             
             # Parse storm date
             storm_date = None
-            if attrs.get('stormdate'):
+            if stormdate:
                 try:
-                    storm_date = datetime.fromtimestamp(attrs['stormdate'] / 1000)
+                    storm_date = datetime.fromtimestamp(stormdate / 1000)
                 except (ValueError, TypeError, OSError):
                     pass
             
@@ -182,24 +186,24 @@ def get_tornadoes_near_location(
                 disaster_type=None,  # Set by __post_init__
                 name=f"Tornado {ef_str}",
                 distance_miles=distance,
-                latitude=float(start_lat),
-                longitude=float(start_lon),
+                latitude=float(start_lats[i]),
+                longitude=float(start_lons[i]),
                 severity=severity,
                 ef_scale=ef_scale,
-                max_wind_mph=float(attrs.get('maxwind')) if attrs.get('maxwind') and attrs.get('maxwind') > 0 else None,
-                path_length_miles=float(attrs.get('length')) if attrs.get('length') and attrs.get('length') > 0 else None,
-                path_width_yards=float(attrs.get('width')) if attrs.get('width') and attrs.get('width') > 0 else None,
-                fatalities=int(attrs.get('fatalities')) if attrs.get('fatalities') is not None else None,
-                injuries=int(attrs.get('injuries')) if attrs.get('injuries') is not None else None,
+                max_wind_mph=_positive_float(maxwind),
+                path_length_miles=_positive_float(length),
+                path_width_yards=_positive_float(width),
+                fatalities=int(fatalities) if fatalities is not None else None,
+                injuries=int(injuries) if injuries is not None else None,
                 storm_date=storm_date,
-                last_updated=datetime.now(),
+                last_updated=now,
                 details={
-                    'objectid': attrs.get('objectid'),
-                    'event_id': attrs.get('event_id'),
-                    'end_lat': attrs.get('endlat'),
-                    'end_lon': attrs.get('endlon'),
-                    'ef_scale_text': attrs.get('efscale'),
-                    'comments': attrs.get('comments'),
+                    'objectid': objectid,
+                    'event_id': event_id,
+                    'end_lat': endlat,
+                    'end_lon': endlon,
+                    'ef_scale_text': efscale,
+                    'comments': comments,
                 }
             )
             
@@ -209,9 +213,45 @@ def get_tornadoes_near_location(
             logger.error(f"Error processing tornado: {str(e)}")
             continue
     
-    # Sort by distance
-    results.sort(key=lambda x: x.distance_miles)
-    
     logger.info(f"Found {len(results)} tornadoes within {radius_miles} miles")
     return results
 
+
+def _positive_float(value) -> Optional[float]:
+    """Convert a measurement to float, treating missing or non-positive values as unknown."""
+    return float(value) if value and value > 0 else None
+
+
+def _start_coordinates(tornado_features: List[dict]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Extract tornado start points as latitude and longitude arrays.
+    
+    fetch_recent_tornadoes returns the same cached list to every query
+    while it is fresh, so the arrays for the most recent list are kept and
+    reused rather than re-parsed for each location.
+    
+    Args:
+        tornado_features: Tornado feature dictionaries from the API
+        
+    Returns:
+        Tuple of read-only (start_lats, start_lons) arrays; missing or
+        unparseable coordinates are NaN, so they never fall within a radius
+    """
+    global _start_coordinates_cache
+    features, start_lats, start_lons = _start_coordinates_cache
+    if features is tornado_features:
+        return start_lats, start_lons
+    
+    attributes = [feature.get('attributes', {}) for feature in tornado_features]
+    start_lats = pd.to_numeric(
+        pd.Series([attrs.get('startlat') for attrs in attributes], dtype=object), errors='coerce'
+    )
+    start_lons = pd.to_numeric(
+        pd.Series([attrs.get('startlon') for attrs in attributes], dtype=object), errors='coerce'
+    )
+    start_lats = start_lats.to_numpy(dtype=float)
+    start_lons = start_lons.to_numpy(dtype=float)
+    start_lats.flags.writeable = False
+    start_lons.flags.writeable = False
+    _start_coordinates_cache = (tornado_features, start_lats, start_lons)
+    return start_lats, start_lons
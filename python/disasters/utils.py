@@ -5,27 +5,51 @@ This module provides common functions used across all disaster type modules:
 - Distance calculations (haversine formula)
 - Polygon containment checks (ray-casting algorithm)
 - HTTP session management with retry logic
+- Parallel paginated ArcGIS layer queries
 - Coordinate validation
 - CSV file loading
+- Time-limited caching of API fetches
 """
 
-import csv
+import functools
+import json
 import math
 import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Tuple, Union, Optional
+from typing import Any, Callable, List, Tuple, Union, Optional
 
 import numpy as np
+import pandas as pd
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
+# orjson is optional; without it API responses are decoded with stdlib json
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# Numba is optional; without it the NumPy implementations are used
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
 # Configure module logger
 logger = logging.getLogger(__name__)
 
 # Constants
 EARTH_RADIUS_MILES = 3956
 DEFAULT_DISTANCE_MILES = 100.0
+CACHE_TTL_SECONDS = 600
+STALE_IF_ERROR_SECONDS = 3600
+HTTP_POOL_SIZE = 32  # Matches the concurrent query pool so connections are reused
 
 
 # =============================================================================
@@ -91,16 +115,231 @@ def haversine_vectorized(
     """
     try:
         lon1, lat1, lon2, lat2 = map(np.radians, [lon1, lat1, lon2, lat2])
-        dlon = lon2 - lon1
-        dlat = lat2 - lat1
-        a = np.sin(dlat / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin(dlon / 2) ** 2
-        c = 2 * np.arcsin(np.sqrt(a))
-        return EARTH_RADIUS_MILES * c
+        
+        # Same operations as the textbook expression, evaluated in place in
+        # two full-size buffers instead of a fresh temporary per step
+        shape = np.broadcast_shapes(np.shape(lon1), np.shape(lat1), np.shape(lon2), np.shape(lat2))
+        a = np.subtract(lat2, lat1, out=np.empty(shape))
+        a /= 2
+        np.sin(a, out=a)
+        a *= a
+        term = np.subtract(lon2, lon1, out=np.empty(shape))
+        term /= 2
+        np.sin(term, out=term)
+        term *= term
+        np.multiply(np.cos(lat1) * np.cos(lat2), term, out=term)
+        a += term
+        np.sqrt(a, out=a)
+        np.arcsin(a, out=a)
+        a *= 2
+        a *= EARTH_RADIUS_MILES
+        return a[()] if a.ndim == 0 else a
     except Exception as e:
         logger.error(f"Error in haversine_vectorized: {str(e)}")
         raise
 
 
+def haversine_batch(
+    lon1: float,
+    lat1: float,
+    lons: np.ndarray,
+    lats: np.ndarray,
+    out: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """
+    Haversine distances from one point to an array of points.
+    
+    With Numba installed this runs as a single compiled loop instead of the
+    chain of temporary arrays built by haversine_vectorized; otherwise it
+    falls back to haversine_vectorized. NaN coordinates give NaN distances.
+    
+    Args:
+        lon1: Longitude of the reference point (decimal degrees)
+        lat1: Latitude of the reference point (decimal degrees)
+        lons: Longitudes of the other points (decimal degrees)
+        lats: Latitudes of the other points (decimal degrees)
+        out: Optional preallocated float array to write the distances into
+        
+    Returns:
+        Array of distances in miles (out, if given)
+        
+    Example:
+        >>> distances = haversine_batch(-97.5164, 35.4676, start_lons, start_lats)
+        >>> nearby = np.flatnonzero(distances <= 100)
+    """
+    try:
+        lons = np.ascontiguousarray(lons, dtype=float)
+        lats = np.ascontiguousarray(lats, dtype=float)
+        if out is None:
+            out = np.empty(lons.shape)
+        
+        if NUMBA_AVAILABLE:
+            _haversine_batch_numba(float(lon1), float(lat1), lons.ravel(), lats.ravel(), out.reshape(-1))
+        else:
+            out[...] = haversine_vectorized(lon1, lat1, lons, lats)
+        return out
+    except Exception as e:
+        logger.error(f"Error in haversine_batch: {str(e)}")
+        raise
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _haversine_batch_numba(
+        lon1: float,
+        lat1: float,
+        lons: np.ndarray,
+        lats: np.ndarray,
+        out: np.ndarray
+    ) -> None:
+        """Numba implementation of haversine_batch."""
+        lon1 = math.radians(lon1)
+        lat1 = math.radians(lat1)
+        cos_lat1 = math.cos(lat1)
+        for i in range(len(lons)):
+            lat2 = math.radians(lats[i])
+            a = (
+                math.sin((lat2 - lat1) / 2) ** 2
+                + cos_lat1 * math.cos(lat2) * math.sin((math.radians(lons[i]) - lon1) / 2) ** 2
+            )
+            out[i] = EARTH_RADIUS_MILES * (2 * math.asin(math.sqrt(a)))
+
+
+def haversine_prepare(
+    lons: Union[float, np.ndarray],
+    lats: Union[float, np.ndarray]
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Precompute the per-point terms of the haversine formula.
+    
+    Points that are measured against many others (e.g. polygon vertices
+    reused across every CSV location) can be prepared once, so the pairwise
+    pass in haversine_from_prep skips the radian conversion and one cos().
+    
+    Args:
+        lons: Longitude(s) (decimal degrees)
+        lats: Latitude(s) (decimal degrees)
+        
+    Returns:
+        Tuple of (lon_radians, lat_radians, cos_lat) arrays
+        
+    Example:
+        >>> vertices = haversine_prepare(storm_lons, storm_lats)
+        >>> user = haversine_prepare(user_lon, user_lat)
+        >>> distances = haversine_from_prep(user, vertices)
+    """
+    lon_rad = np.radians(lons)
+    lat_rad = np.radians(lats)
+    return lon_rad, lat_rad, np.cos(lat_rad)
+
+
+def haversine_from_prep(
+    prep1: Tuple[np.ndarray, np.ndarray, np.ndarray],
+    prep2: Tuple[np.ndarray, np.ndarray, np.ndarray]
+) -> np.ndarray:
+    """
+    Haversine distances between points prepared with haversine_prepare.
+    
+    Broadcasts like haversine_vectorized and gives identical results.
+    
+    Args:
+        prep1: Prepared first point(s)
+        prep2: Prepared second point(s)
+        
+    Returns:
+        Array of distances in miles
+    """
+    lon1, lat1, cos_lat1 = prep1
+    lon2, lat2, cos_lat2 = prep2
+    a = np.sin((lat2 - lat1) / 2) ** 2 + cos_lat1 * cos_lat2 * np.sin((lon2 - lon1) / 2) ** 2
+    return EARTH_RADIUS_MILES * (2 * np.arcsin(np.sqrt(a)))
+
+
+def haversine_min_by_group(
+    prep1: Tuple[np.ndarray, np.ndarray, np.ndarray],
+    prep2: Tuple[np.ndarray, np.ndarray, np.ndarray],
+    starts: np.ndarray,
+    max_miles: float = np.inf
+) -> np.ndarray:
+    """
+    Minimum haversine distance from each point to each group of points.
+    
+    The second set of points is split into consecutive groups (e.g. the
+    vertices of several polygons concatenated together). With Numba
+    installed, a compiled loop skips the trig for any pair whose latitude
+    difference alone already puts it beyond max_miles; the meridian distance
+    is a lower bound on the great-circle distance, so minimums within
+    max_miles are exact.
+    
+    Args:
+        prep1: 1-D query points prepared with haversine_prepare
+        prep2: Concatenated group points prepared with haversine_prepare
+        starts: Index of each group's first point (groups must be non-empty)
+        max_miles: Distances beyond this are reported as inf (default: no limit)
+        
+    Returns:
+        Array of shape (n_points, n_groups) with distances in miles
+        
+    Example:
+        >>> users = haversine_prepare(user_lons, user_lats)
+        >>> vertices = haversine_prepare(vertex_lons, vertex_lats)
+        >>> nearest = haversine_min_by_group(users, vertices, starts, max_miles=100)
+    """
+    try:
+        prep1 = tuple(np.atleast_1d(np.asarray(term, dtype=float)) for term in prep1)
+        prep2 = tuple(np.asarray(term, dtype=float) for term in prep2)
+        starts = np.asarray(starts, dtype=np.intp)
+        
+        if NUMBA_AVAILABLE:
+            return _haversine_min_by_group_numba(*prep1, *prep2, starts, max_miles)
+        
+        # The (points x vertices) array is the working set here; float32
+        # halves it and is still accurate to well under 0.01 miles. A single
+        # query point has no grid to shrink, so it keeps full precision
+        dtype = np.float32 if len(prep1[0]) > 1 else float
+        distances = haversine_from_prep(
+            tuple(term[:, np.newaxis].astype(dtype) for term in prep1),
+            tuple(term.astype(dtype) for term in prep2)
+        )
+        result = np.minimum.reduceat(distances, starts, axis=1).astype(float)
+        result[result > max_miles] = np.inf
+        return result
+    except Exception as e:
+        logger.error(f"Error in haversine_min_by_group: {str(e)}")
+        raise
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _haversine_min_by_group_numba(
+        lon1: np.ndarray,
+        lat1: np.ndarray,
+        cos_lat1: np.ndarray,
+        lon2: np.ndarray,
+        lat2: np.ndarray,
+        cos_lat2: np.ndarray,
+        starts: np.ndarray,
+        max_miles: float
+    ) -> np.ndarray:
+        """Numba implementation of haversine_min_by_group."""
+        n_groups = len(starts)
+        max_lat_diff = max_miles / EARTH_RADIUS_MILES
+        result = np.full((len(lon1), n_groups), np.inf)
+        for n in range(len(lon1)):
+            for g in range(n_groups):
+                end = starts[g + 1] if g + 1 < n_groups else len(lon2)
+                nearest = np.inf
+                for v in range(starts[g], end):
+                    dlat = lat2[v] - lat1[n]
+                    if abs(dlat) > max_lat_diff:
+                        continue
+                    a = np.sin(dlat / 2) ** 2 + cos_lat1[n] * cos_lat2[v] * np.sin((lon2[v] - lon1[n]) / 2) ** 2
+                    nearest = min(nearest, EARTH_RADIUS_MILES * (2 * np.arcsin(np.sqrt(a))))
+                if nearest <= max_miles:
+                    result[n, g] = nearest
+        return result
+
+
 # =============================================================================
 # Polygon Operations
 # =============================================================================
@@ -115,6 +354,7 @@ def is_point_in_polygon_vectorized(
     
     Uses a vectorized implementation with bounding box pre-filtering for
     performance. Handles edge cases including points on vertices and edges.
+    When Numba is installed a compiled per-point loop is used instead.
     
     Args:
         x: X coordinate(s) / longitude(s) to check
@@ -141,6 +381,13 @@ def is_point_in_polygon_vectorized(
         if len(x) == 0:
             return inside_or_on_edge
         
+        if NUMBA_AVAILABLE and n > 0:
+            result = _points_in_polygons_numba(
+                x, y, np.ascontiguousarray(polygon[:, 0]), np.ascontiguousarray(polygon[:, 1]),
+                np.zeros(1, dtype=np.intp)
+            )
+            return result[:, 0]
+        
         # Bounding box check for early filtering
         min_x, min_y = np.min(polygon, axis=0)
         max_x, max_y = np.max(polygon, axis=0)
@@ -153,45 +400,74 @@ def is_point_in_polygon_vectorized(
         if len(x_in_bbox) == 0:
             return inside_or_on_edge
         
-        inside_or_on_edge_bbox = np.zeros(len(x_in_bbox), dtype=bool)
+        # Edge hits and ray-cast parity are tracked separately so a point's
+        # parity can flip back to outside on a later crossing
+        m = len(x_in_bbox)
+        on_edge_bbox = np.zeros(m, dtype=bool)
+        crossings_bbox = np.zeros(m, dtype=bool)
+        
+        # Per-edge terms are computed once up front, and the per-point work
+        # reuses a fixed set of scratch buffers instead of allocating fresh
+        # temporaries on every edge
+        xs, ys = polygon[:, 0], polygon[:, 1]
+        xs_next, ys_next = np.roll(xs, -1), np.roll(ys, -1)
+        edge_xs = xs_next - xs
+        edge_ys = ys_next - ys
+        edge_length_sqs = edge_xs ** 2 + edge_ys ** 2
+        with np.errstate(divide='ignore', invalid='ignore'):
+            slopes = edge_xs / edge_ys
+        # A point within 1e-6 of an edge (the 1e-12 squared tolerance) lies
+        # in the edge's bounding box grown by 1e-6; padded further for rounding
+        edge_min_xs = np.minimum(xs, xs_next) - 1e-5
+        edge_max_xs = np.maximum(xs, xs_next) + 1e-5
+        edge_min_ys = np.minimum(ys, ys_next) - 1e-5
+        edge_max_ys = np.maximum(ys, ys_next) + 1e-5
+        
+        dx, dy, scratch = (np.empty(m) for _ in range(3))
+        hit, test = np.empty(m, dtype=bool), np.empty(m, dtype=bool)
         
         for i in range(n):
-            j = (i + 1) % n
-            xi, yi = polygon[i]
-            xj, yj = polygon[j]
+            xi, yi, yj = xs[i], ys[i], ys[(i + 1) % n]
+            edge_x, edge_y = edge_xs[i], edge_ys[i]
+            np.subtract(x_in_bbox, xi, out=dx)
+            np.subtract(y_in_bbox, yi, out=dy)
             
             # Check if point is on vertex
-            on_vertex = (np.abs(x_in_bbox - xi) < 1e-9) & (np.abs(y_in_bbox - yi) < 1e-9)
-            inside_or_on_edge_bbox |= on_vertex
-
-            # Check if point is on edge
-            edge_x = xj - xi
-            edge_y = yj - yi
-            edge_length_sq = edge_x ** 2 + edge_y ** 2
+            np.less(np.abs(dx, out=scratch), 1e-9, out=hit)
+            hit &= np.less(np.abs(dy, out=scratch), 1e-9, out=test)
+            on_edge_bbox |= hit
             
-            if edge_length_sq > 0:
-                t = ((x_in_bbox - xi) * edge_x + (y_in_bbox - yi) * edge_y) / edge_length_sq
-                px = xi + t * edge_x
-                py = yi + t * edge_y
-                distance_sq = (x_in_bbox - px) ** 2 + (y_in_bbox - py) ** 2
-                tolerance = 1e-12
-                edge_check = (distance_sq < tolerance) & (t >= 0) & (t <= 1)
-                inside_or_on_edge_bbox |= edge_check
+            # Check if point is on edge: squared distance to its projection
+            # onto the edge, for projections that land within the edge. Only
+            # points inside the edge's own (padded) bounding box can pass,
+            # so the projection is computed just for those
+            if edge_length_sqs[i] > 0:
+                np.greater_equal(x_in_bbox, edge_min_xs[i], out=hit)
+                hit &= np.less_equal(x_in_bbox, edge_max_xs[i], out=test)
+                hit &= np.greater_equal(y_in_bbox, edge_min_ys[i], out=test)
+                hit &= np.less_equal(y_in_bbox, edge_max_ys[i], out=test)
+                near = np.flatnonzero(hit)
+                if len(near) > 0:
+                    t = (dx[near] * edge_x + dy[near] * edge_y) / edge_length_sqs[i]
+                    px = xi + t * edge_x
+                    py = yi + t * edge_y
+                    distance_sq = (x_in_bbox[near] - px) ** 2 + (y_in_bbox[near] - py) ** 2
+                    on_edge_bbox[near] |= (distance_sq < 1e-12) & (t >= 0) & (t <= 1)
             
             # Ray-casting algorithm for points not on the edge
-            mask = ~inside_or_on_edge_bbox & (yi != yj)
-            yj_gt_yi = yj > yi
-            intersect = mask & (
-                ((yi <= y_in_bbox) & (y_in_bbox < yj) & yj_gt_yi) |
-                ((yj <= y_in_bbox) & (y_in_bbox < yi) & ~yj_gt_yi)
-            )
-            with np.errstate(divide='ignore', invalid='ignore'):
-                slope = edge_x / edge_y
-                intersect &= x_in_bbox < xi + (y_in_bbox - yi) * slope
-            inside_or_on_edge_bbox[mask] ^= intersect[mask]
+            if yi == yj:
+                continue
+            low, high = (yi, yj) if yj > yi else (yj, yi)
+            np.greater_equal(y_in_bbox, low, out=hit)
+            hit &= np.less(y_in_bbox, high, out=test)
+            hit &= np.logical_not(on_edge_bbox, out=test)
+            np.multiply(dy, slopes[i], out=scratch)
+            scratch += xi
+            hit &= np.less(x_in_bbox, scratch, out=test)
+            crossings_bbox ^= hit
         
         # Assign results back to the original boolean array
-        inside_or_on_edge[bbox_check] = inside_or_on_edge_bbox
+        inside_or_on_edge[bbox_check] = on_edge_bbox | crossings_bbox
         
         return inside_or_on_edge
     except Exception as e:
@@ -199,6 +475,605 @@ def is_point_in_polygon_vectorized(
         raise
 
 
+def is_point_in_polygons(
+    x: Union[float, np.ndarray],
+    y: Union[float, np.ndarray],
+    poly_x: np.ndarray,
+    poly_y: np.ndarray,
+    starts: np.ndarray
+) -> np.ndarray:
+    """
+    Check if one or more points are inside each of several polygons.
+    
+    The polygons are passed as one concatenated vertex array, so the
+    ray-casting for all of them runs as a single vectorized pass over every
+    (point, edge) pair instead of one call per polygon. Semantics match
+    is_point_in_polygon_vectorized, including the vertex and edge tolerance.
+    When Numba is installed a compiled crossing-number loop is used instead,
+    which avoids building the (point, edge) arrays.
+    
+    Args:
+        x: X coordinate(s) / longitude(s) to check
+        y: Y coordinate(s) / latitude(s) to check
+        poly_x: Concatenated X coordinates of all polygon vertices
+        poly_y: Concatenated Y coordinates of all polygon vertices
+        starts: Index of each polygon's first vertex (polygons must be non-empty)
+        
+    Returns:
+        Boolean array, one entry per polygon (shape (n_points, n_polygons)
+        for array input), True if the point is inside or on the polygon edge
+        
+    Example:
+        >>> square = [(-100, 25), (-100, 35), (-90, 35), (-90, 25)]
+        >>> diamond = [(0, 1), (1, 0), (0, -1), (-1, 0)]
+        >>> vertices = np.array(square + diamond)
+        >>> is_point_in_polygons(-95, 30, vertices[:, 0], vertices[:, 1], np.array([0, 4]))
+        >>> # Returns: array([True, False])
+    """
+    try:
+        scalar_input = np.ndim(x) == 0
+        x = np.atleast_1d(np.asarray(x, dtype=float))
+        y = np.atleast_1d(np.asarray(y, dtype=float))
+        poly_x = np.asarray(poly_x, dtype=float)
+        poly_y = np.asarray(poly_y, dtype=float)
+        starts = np.asarray(starts, dtype=np.intp)
+        
+        if NUMBA_AVAILABLE:
+            result = _points_in_polygons_numba(x, y, poly_x, poly_y, starts)
+        else:
+            result = _points_in_polygons_numpy(x, y, poly_x, poly_y, starts)
+        return result[0] if scalar_input else result
+    except Exception as e:
+        logger.error(f"Error in is_point_in_polygons: {str(e)}")
+        raise
+
+
+def _points_in_polygons_numpy(
+    x: np.ndarray,
+    y: np.ndarray,
+    poly_x: np.ndarray,
+    poly_y: np.ndarray,
+    starts: np.ndarray
+) -> np.ndarray:
+    """NumPy implementation of is_point_in_polygons over 1-D point arrays."""
+    x = x[:, np.newaxis]
+    y = y[:, np.newaxis]
+    
+    # Each vertex's successor, wrapping to the start of its own polygon
+    ends = np.append(starts[1:], len(poly_x))
+    nxt = np.arange(1, len(poly_x) + 1)
+    nxt[ends - 1] = starts
+    xi, yi = poly_x, poly_y
+    xj, yj = poly_x[nxt], poly_y[nxt]
+    
+    # Bounding box check per polygon
+    in_bbox = (
+        (np.minimum.reduceat(poly_x, starts) <= x) & (x <= np.maximum.reduceat(poly_x, starts)) &
+        (np.minimum.reduceat(poly_y, starts) <= y) & (y <= np.maximum.reduceat(poly_y, starts))
+    )
+    
+    # Check if point is on a vertex or edge
+    on_edge = (np.abs(x - xi) < 1e-9) & (np.abs(y - yi) < 1e-9)
+    edge_x = xj - xi
+    edge_y = yj - yi
+    edge_length_sq = edge_x ** 2 + edge_y ** 2
+    with np.errstate(divide='ignore', invalid='ignore'):
+        t = ((x - xi) * edge_x + (y - yi) * edge_y) / edge_length_sq
+        distance_sq = (x - (xi + t * edge_x)) ** 2 + (y - (yi + t * edge_y)) ** 2
+        on_edge |= (edge_length_sq > 0) & (distance_sq < 1e-12) & (t >= 0) & (t <= 1)
+        
+        # Ray-casting: count edge crossings to the right of the point
+        crosses = (yi != yj) & (((yi <= y) & (y < yj)) | ((yj <= y) & (y < yi)))
+        crosses &= x < xi + (y - yi) * (edge_x / edge_y)
+    
+    # Crossing parity is an XOR reduction, which works on the boolean array
+    # directly instead of counting through an (n_points, n_edges) int copy
+    on_polygon_edge = np.logical_or.reduceat(on_edge, starts, axis=1)
+    odd_crossings = np.logical_xor.reduceat(crosses, starts, axis=1)
+    return in_bbox & (on_polygon_edge | odd_crossings)
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _point_in_polygon_numba(
+        px: float,
+        py: float,
+        poly_x: np.ndarray,
+        poly_y: np.ndarray,
+        start: int,
+        end: int
+    ) -> bool:
+        """Crossing-number test for one point against poly_x[start:end]."""
+        # Bounding box check
+        min_x = max_x = poly_x[start]
+        min_y = max_y = poly_y[start]
+        for i in range(start + 1, end):
+            min_x = min(min_x, poly_x[i])
+            max_x = max(max_x, poly_x[i])
+            min_y = min(min_y, poly_y[i])
+            max_y = max(max_y, poly_y[i])
+        if px < min_x or px > max_x or py < min_y or py > max_y:
+            return False
+        
+        inside = False
+        for i in range(start, end):
+            j = i + 1 if i + 1 < end else start
+            xi, yi = poly_x[i], poly_y[i]
+            xj, yj = poly_x[j], poly_y[j]
+            
+            # On a vertex or edge counts as inside
+            if abs(px - xi) < 1e-9 and abs(py - yi) < 1e-9:
+                return True
+            edge_x = xj - xi
+            edge_y = yj - yi
+            edge_length_sq = edge_x ** 2 + edge_y ** 2
+            # Only points in the edge's padded bounding box can be on it
+            near_edge = (
+                min(xi, xj) - 1e-5 <= px <= max(xi, xj) + 1e-5
+                and min(yi, yj) - 1e-5 <= py <= max(yi, yj) + 1e-5
+            )
+            if edge_length_sq > 0 and near_edge:
+                t = ((px - xi) * edge_x + (py - yi) * edge_y) / edge_length_sq
+                if 0 <= t <= 1:
+                    distance_sq = (px - (xi + t * edge_x)) ** 2 + (py - (yi + t * edge_y)) ** 2
+                    if distance_sq < 1e-12:
+                        return True
+            
+            if yi != yj and ((yi <= py < yj) or (yj <= py < yi)):
+                if px < xi + (py - yi) * (edge_x / edge_y):
+                    inside = not inside
+        return inside
+    
+    # Not parallel=True: this runs on the disaster-query pool threads, and
+    # Numba's default threading layer aborts on concurrent parallel launches
+    @njit(cache=True)
+    def _points_in_polygons_numba(
+        x: np.ndarray,
+        y: np.ndarray,
+        poly_x: np.ndarray,
+        poly_y: np.ndarray,
+        starts: np.ndarray
+    ) -> np.ndarray:
+        """Numba implementation of is_point_in_polygons over 1-D point arrays."""
+        n_polygons = len(starts)
+        result = np.zeros((len(x), n_polygons), dtype=np.bool_)
+        for n in range(len(x)):
+            for p in range(n_polygons):
+                end = starts[p + 1] if p + 1 < n_polygons else len(poly_x)
+                result[n, p] = _point_in_polygon_numba(
+                    x[n], y[n], poly_x, poly_y, starts[p], end
+                )
+        return result
+
+
+def points_near_point(
+    lon: float,
+    lat: float,
+    lons: np.ndarray,
+    lats: np.ndarray,
+    max_miles: float
+) -> np.ndarray:
+    """
+    Cheaply find which points could be within a distance of a reference point.
+    
+    Compares only degree offsets against the bounding box of the circle of
+    radius max_miles around (lon, lat), so no trig is done per point. The
+    box is exact rather than the usual miles-per-degree estimate: latitudes
+    within max_miles / EARTH_RADIUS_MILES radians, and longitudes within
+    asin(sin(angle) / cos(lat)) of the reference point, compared modulo 360
+    degrees. Points outside it are certainly farther than max_miles; NaN
+    coordinates are never near.
+    
+    Args:
+        lon: Longitude of the reference point (decimal degrees)
+        lat: Latitude of the reference point (decimal degrees)
+        lons: Longitudes of the other points (decimal degrees)
+        lats: Latitudes of the other points (decimal degrees)
+        max_miles: Distance to test against
+        
+    Returns:
+        Boolean array, False where the point is certainly farther than max_miles
+        
+    Example:
+        >>> candidates = np.flatnonzero(points_near_point(-97.5, 35.5, lons, lats, 100))
+        >>> distances = haversine_batch(-97.5, 35.5, lons[candidates], lats[candidates])
+    """
+    lons = np.asarray(lons, dtype=float)
+    lats = np.asarray(lats, dtype=float)
+    angle = max_miles / EARTH_RADIUS_MILES
+    # Small slack so rounding never rejects a point right on the circle
+    max_lat_gap = math.degrees(angle) + 1e-9
+    
+    near = np.abs(lats - lat) <= max_lat_gap
+    sin_angle = math.sin(min(angle, np.pi / 2))
+    cos_lat = math.cos(math.radians(lat))
+    if sin_angle < cos_lat:
+        max_lon_gap = math.degrees(math.asin(sin_angle / cos_lat)) + 1e-9
+        near &= np.abs((lons - lon + 180) % 360 - 180) <= max_lon_gap
+    return near
+
+
+def points_near_bboxes(
+    lons: np.ndarray,
+    lats: np.ndarray,
+    bboxes: np.ndarray,
+    max_miles: float
+) -> np.ndarray:
+    """
+    Cheaply find which (point, bounding box) pairs could be within a distance.
+    
+    Uses lower bounds on the great-circle distance from a point to anything
+    inside a lon/lat box: the meridian distance to its latitude band, and the
+    distance to the nearest meridian of its longitude span. Pairs that fail
+    either bound are certainly farther than max_miles, so the polygon work for
+    them can be skipped. Longitude spans are compared modulo 360 degrees.
+    
+    Args:
+        lons: Longitudes of the query points (decimal degrees)
+        lats: Latitudes of the query points (decimal degrees)
+        bboxes: Array of shape (n_boxes, 4) with min_lon, min_lat, max_lon, max_lat
+        max_miles: Distance to test against
+        
+    Returns:
+        Boolean array of shape (n_points, n_boxes), False where the box is
+        certainly farther than max_miles
+        
+    Example:
+        >>> boxes = np.array([[-96.0, 28.0, -94.0, 30.0]])
+        >>> points_near_bboxes(np.array([-95.0, -60.0]), np.array([29.0, 29.0]), boxes, 100)
+        >>> # Returns: array([[ True], [False]])
+    """
+    angle = max_miles / EARTH_RADIUS_MILES
+    if angle >= np.pi / 2:
+        return np.ones((len(lons), len(bboxes)), dtype=bool)
+    
+    lon = np.radians(np.asarray(lons, dtype=float))[:, np.newaxis]
+    lat = np.radians(np.asarray(lats, dtype=float))[:, np.newaxis]
+    return _near_bbox(lon, lat, np.radians(np.asarray(bboxes, dtype=float)).T, angle)
+
+
+def bbox_index(bboxes: np.ndarray) -> Tuple[np.ndarray, np.ndarray, float]:
+    """
+    Build the latitude index bbox_candidates searches.
+    
+    Boxes that are queried repeatedly (e.g. fire perimeters reused by every
+    location while the fetch cache is fresh) can be indexed once and the
+    result passed to each bbox_candidates call.
+    
+    Args:
+        bboxes: Array of shape (n_boxes, 4) with min_lon, min_lat, max_lon, max_lat
+        
+    Returns:
+        Tuple of (order, sorted_min_lat, tallest): box indices sorted by
+        minimum latitude, those latitudes, and the largest latitude span
+        (radians)
+        
+    Example:
+        >>> index = bbox_index(fire_bboxes)
+        >>> points, boxes = bbox_candidates(lons, lats, fire_bboxes, 100, index=index)
+    """
+    boxes = np.radians(np.asarray(bboxes, dtype=float).reshape(-1, 4))
+    order = np.argsort(boxes[:, 1], kind='stable')
+    tallest = float(np.max(boxes[:, 3] - boxes[:, 1])) if len(boxes) else 0.0
+    return order, boxes[order, 1], tallest
+
+
+def bbox_candidates(
+    lons: np.ndarray,
+    lats: np.ndarray,
+    bboxes: np.ndarray,
+    max_miles: float,
+    index: Optional[Tuple[np.ndarray, np.ndarray, float]] = None
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Find the (point, bounding box) pairs that could be within a distance.
+    
+    Sparse, indexed version of points_near_bboxes for many boxes: boxes are
+    sorted by minimum latitude, so each point only tests the window of boxes
+    whose latitude band can reach it (found by binary search) rather than
+    every box.
+    
+    Args:
+        lons: Longitudes of the query points (decimal degrees)
+        lats: Latitudes of the query points (decimal degrees)
+        bboxes: Array of shape (n_boxes, 4) with min_lon, min_lat, max_lon, max_lat
+        max_miles: Distance to test against
+        index: bbox_index(bboxes), for boxes that are queried repeatedly
+            (default: built here)
+        
+    Returns:
+        Tuple of (point_indices, box_indices) arrays listing candidate pairs,
+        grouped by point
+        
+    Example:
+        >>> points, boxes = bbox_candidates(lons, lats, fire_bboxes, 100)
+        >>> for p, b in zip(points, boxes):
+        ...     check_precisely(p, b)
+    """
+    lons = np.asarray(lons, dtype=float)
+    lats = np.asarray(lats, dtype=float)
+    bboxes = np.asarray(bboxes, dtype=float).reshape(-1, 4)
+    angle = max_miles / EARTH_RADIUS_MILES
+    if len(bboxes) == 0 or len(lats) == 0:
+        return np.empty(0, dtype=np.intp), np.empty(0, dtype=np.intp)
+    
+    lat = np.radians(lats)
+    if angle >= np.pi / 2:
+        window_lo = np.zeros(len(lat), dtype=np.intp)
+        window_hi = np.full(len(lat), len(bboxes), dtype=np.intp)
+        order = np.arange(len(bboxes))
+    else:
+        # A box can only reach a point if its min latitude lies within
+        # [lat - angle - tallest box, lat + angle]
+        order, sorted_min_lat, tallest = bbox_index(bboxes) if index is None else index
+        window_lo = np.searchsorted(sorted_min_lat, lat - angle - tallest, side='left')
+        window_hi = np.searchsorted(sorted_min_lat, lat + angle, side='right')
+    
+    counts = window_hi - window_lo
+    point_idx = np.repeat(np.arange(len(lat)), counts)
+    offsets = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+    box_idx = order[np.repeat(window_lo, counts) + offsets]
+    
+    if angle < np.pi / 2:
+        near = _near_bbox(
+            np.radians(lons)[point_idx], lat[point_idx], np.radians(bboxes[box_idx]).T, angle
+        )
+        point_idx, box_idx = point_idx[near], box_idx[near]
+    return point_idx, box_idx
+
+
+def _near_bbox(
+    lon: np.ndarray,
+    lat: np.ndarray,
+    bbox: np.ndarray,
+    angle: float
+) -> np.ndarray:
+    """Broadcast lower-bound test of points (radians) against box rows of bbox."""
+    min_lon, min_lat, max_lon, max_lat = bbox
+    
+    # Meridian distance to the box's latitude band
+    lat_gap = np.maximum(np.maximum(min_lat - lat, lat - max_lat), 0)
+    near_lat = lat_gap <= angle
+    
+    # Distance to the nearest meridian of the box's longitude span is
+    # asin(cos(lat) * sin(lon_gap)), and never more than the distance to a
+    # meridian 90 degrees away
+    center = (min_lon + max_lon) / 2
+    half_span = (max_lon - min_lon) / 2
+    lon_offset = np.abs((lon - center + np.pi) % (2 * np.pi) - np.pi)
+    lon_gap = np.clip(lon_offset - half_span, 0, np.pi / 2)
+    near_lon = np.cos(lat) * np.sin(lon_gap) <= np.sin(angle) + 1e-12
+    
+    return near_lat & near_lon
+
+
+def great_circle_edges(
+    poly_x: np.ndarray,
+    poly_y: np.ndarray,
+    starts: np.ndarray
+) -> np.ndarray:
+    """
+    Precompute the great-circle edges of polygons for polygon_distances.
+    
+    Each row describes the edge from a vertex to the next vertex of its
+    polygon (the last vertex wraps to the first) as three unit-sphere
+    vectors: the normal n of the edge's great circle, and n x A and B x n,
+    which point along the circle from each endpoint towards the other. A
+    point P then lies within the arc's span exactly when P . (n x A) and
+    P . (B x n) are both non-negative, and its distance to the arc is
+    asin(|P . n|).
+    
+    Args:
+        poly_x: Concatenated longitudes of all polygon vertices
+        poly_y: Concatenated latitudes of all polygon vertices
+        starts: Index of each polygon's first vertex (polygons must be non-empty)
+        
+    Returns:
+        Array of shape (n_vertices, 9); rows for zero-length edges (such as
+        the closing edge of a ring that repeats its first vertex) are NaN
+        
+    Example:
+        >>> edges = great_circle_edges(vx, vy, starts)
+        >>> distances, inside = polygon_distances(lons, lats, vx, vy, starts, 100, edges=edges)
+    """
+    lon = np.radians(np.asarray(poly_x, dtype=float))
+    lat = np.radians(np.asarray(poly_y, dtype=float))
+    starts = np.asarray(starts, dtype=np.intp)
+    n_vertices = len(lon)
+    if n_vertices == 0:
+        return np.empty((0, 9))
+    
+    cos_lat = np.cos(lat)
+    a = np.column_stack([cos_lat * np.cos(lon), cos_lat * np.sin(lon), np.sin(lat)])
+    following = np.arange(1, n_vertices + 1)
+    following[np.append(starts[1:], n_vertices) - 1] = starts
+    b = a[following]
+    
+    normal = np.cross(a, b)
+    length = np.linalg.norm(normal, axis=1)
+    degenerate = length < 1e-12
+    normal /= np.where(degenerate, 1.0, length)[:, np.newaxis]
+    edges = np.hstack([normal, np.cross(normal, a), np.cross(b, normal)])
+    edges[degenerate] = np.nan
+    return edges
+
+
+def _edge_min_by_group(
+    lons: np.ndarray,
+    lats: np.ndarray,
+    edges: np.ndarray,
+    starts: np.ndarray
+) -> np.ndarray:
+    """NumPy distance from each point to the nearest edge interior of each group."""
+    lon = np.radians(lons)
+    lat = np.radians(lats)
+    cos_lat = np.cos(lat)
+    points = np.column_stack([cos_lat * np.cos(lon), cos_lat * np.sin(lon), np.sin(lat)])
+    
+    # NaN rows (degenerate edges) fail both span tests
+    within = (points @ edges[:, 3:6].T >= 0) & (points @ edges[:, 6:9].T >= 0)
+    cross_track = np.abs(points @ edges[:, 0:3].T)
+    distances = np.full(within.shape, np.inf)
+    distances[within] = EARTH_RADIUS_MILES * np.arcsin(np.minimum(cross_track[within], 1.0))
+    return np.minimum.reduceat(distances, starts, axis=1)
+
+
+def polygon_distances(
+    lons: np.ndarray,
+    lats: np.ndarray,
+    poly_x: np.ndarray,
+    poly_y: np.ndarray,
+    starts: np.ndarray,
+    max_miles: float = np.inf,
+    vertex_prep: Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]] = None,
+    edges: Optional[np.ndarray] = None
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Nearest-vertex distance and containment for points against polygons.
+    
+    Combines is_point_in_polygons and haversine_min_by_group. With Numba
+    installed both are computed in one fused loop, so each polygon's
+    vertices are walked once per point rather than once per test. When
+    edges are given, the distance is to the nearest point on the polygon
+    boundary instead, which can lie in the middle of an edge.
+    
+    Args:
+        lons: Longitudes of the query points (decimal degrees)
+        lats: Latitudes of the query points (decimal degrees)
+        poly_x: Concatenated longitudes of all polygon vertices
+        poly_y: Concatenated latitudes of all polygon vertices
+        starts: Index of each polygon's first vertex (polygons must be non-empty)
+        max_miles: Distances beyond this are reported as inf (default: no limit)
+        vertex_prep: The vertices prepared with haversine_prepare, for callers
+            that reuse the same polygons across calls (default: prepared here)
+        edges: Polygon edges from great_circle_edges (default: measure to
+            vertices only)
+        
+    Returns:
+        Tuple of (distance_miles, inside) arrays of shape (n_points, n_polygons)
+        
+    Example:
+        >>> distances, inside = polygon_distances(lons, lats, vx, vy, starts, 100)
+    """
+    try:
+        lons = np.atleast_1d(np.asarray(lons, dtype=float))
+        lats = np.atleast_1d(np.asarray(lats, dtype=float))
+        poly_x = np.asarray(poly_x, dtype=float)
+        poly_y = np.asarray(poly_y, dtype=float)
+        starts = np.asarray(starts, dtype=np.intp)
+        user_prep = haversine_prepare(lons, lats)
+        if vertex_prep is None:
+            vertex_prep = haversine_prepare(poly_x, poly_y)
+        else:
+            vertex_prep = tuple(np.asarray(term, dtype=float) for term in vertex_prep)
+        
+        edges = np.empty((0, 9)) if edges is None else np.asarray(edges, dtype=float)
+        
+        if not NUMBA_AVAILABLE:
+            inside = _points_in_polygons_numpy(lons, lats, poly_x, poly_y, starts)
+            distances = haversine_min_by_group(user_prep, vertex_prep, starts, max_miles)
+            if len(edges):
+                distances = np.minimum(distances, _edge_min_by_group(lons, lats, edges, starts))
+                distances[distances > max_miles] = np.inf
+            return distances, inside
+        
+        bbox = np.array([
+            np.minimum.reduceat(poly_x, starts), np.minimum.reduceat(poly_y, starts),
+            np.maximum.reduceat(poly_x, starts), np.maximum.reduceat(poly_y, starts),
+        ])
+        return _polygon_distances_numba(
+            lons, lats, *user_prep, poly_x, poly_y, *vertex_prep, starts, bbox, edges, max_miles
+        )
+    except Exception as e:
+        logger.error(f"Error in polygon_distances: {str(e)}")
+        raise
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _polygon_distances_numba(
+        x: np.ndarray,
+        y: np.ndarray,
+        lon1: np.ndarray,
+        lat1: np.ndarray,
+        cos_lat1: np.ndarray,
+        poly_x: np.ndarray,
+        poly_y: np.ndarray,
+        lon2: np.ndarray,
+        lat2: np.ndarray,
+        cos_lat2: np.ndarray,
+        starts: np.ndarray,
+        bbox: np.ndarray,
+        edges: np.ndarray,
+        max_miles: float
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Fused Numba implementation of polygon_distances."""
+        n_polygons = len(starts)
+        use_edges = len(edges) > 0
+        max_lat_diff = max_miles / EARTH_RADIUS_MILES
+        distances = np.full((len(x), n_polygons), np.inf)
+        inside = np.zeros((len(x), n_polygons), dtype=np.bool_)
+        for n in range(len(x)):
+            px, py = x[n], y[n]
+            lon_n, lat_n, cos_lat_n = lon1[n], lat1[n], cos_lat1[n]
+            ux = cos_lat_n * np.cos(lon_n)
+            uy = cos_lat_n * np.sin(lon_n)
+            uz = np.sin(lat_n)
+            for p in range(n_polygons):
+                start = starts[p]
+                end = starts[p + 1] if p + 1 < n_polygons else len(poly_x)
+                test_inside = (
+                    bbox[0, p] <= px <= bbox[2, p] and bbox[1, p] <= py <= bbox[3, p]
+                )
+                on_edge = False
+                crossings = False
+                nearest = np.inf
+                for i in range(start, end):
+                    # Nearest vertex, skipping pairs too far apart in latitude
+                    dlat = lat2[i] - lat_n
+                    if abs(dlat) <= max_lat_diff:
+                        a = np.sin(dlat / 2) ** 2 + cos_lat_n * cos_lat2[i] * np.sin((lon2[i] - lon_n) / 2) ** 2
+                        nearest = min(nearest, EARTH_RADIUS_MILES * (2 * np.arcsin(np.sqrt(a))))
+                    
+                    # Nearest point inside the edge to the next vertex, when
+                    # the point lies within the edge's span (NaN rows for
+                    # degenerate edges fail both tests)
+                    if use_edges:
+                        if (ux * edges[i, 3] + uy * edges[i, 4] + uz * edges[i, 5] >= 0
+                                and ux * edges[i, 6] + uy * edges[i, 7] + uz * edges[i, 8] >= 0):
+                            cross_track = abs(ux * edges[i, 0] + uy * edges[i, 1] + uz * edges[i, 2])
+                            nearest = min(nearest, EARTH_RADIUS_MILES * np.arcsin(min(cross_track, 1.0)))
+                    
+                    if not test_inside or on_edge:
+                        continue
+                    
+                    # Ray-casting with vertex and edge tolerance
+                    j = i + 1 if i + 1 < end else start
+                    xi, yi = poly_x[i], poly_y[i]
+                    xj, yj = poly_x[j], poly_y[j]
+                    if abs(px - xi) < 1e-9 and abs(py - yi) < 1e-9:
+                        on_edge = True
+                        continue
+                    edge_x = xj - xi
+                    edge_y = yj - yi
+                    edge_length_sq = edge_x ** 2 + edge_y ** 2
+                    if edge_length_sq > 0:
+                        t = ((px - xi) * edge_x + (py - yi) * edge_y) / edge_length_sq
+                        if 0 <= t <= 1:
+                            distance_sq = (px - (xi + t * edge_x)) ** 2 + (py - (yi + t * edge_y)) ** 2
+                            if distance_sq < 1e-12:
+                                on_edge = True
+                                continue
+                    if yi != yj and ((yi <= py < yj) or (yj <= py < yi)):
+                        if px < xi + (py - yi) * (edge_x / edge_y):
+                            crossings = not crossings
+                
+                inside[n, p] = test_inside and (on_edge or crossings)
+                if nearest <= max_miles:
+                    distances[n, p] = nearest
+        return distances, inside
+
+
 def is_point_in_polygon(x: float, y: float, polygon: List[Tuple[float, float]]) -> bool:
     """
     Check if a single point is inside a polygon.
@@ -252,7 +1127,8 @@ class CustomRetry(Retry):
 def create_retry_session(
     retries: int = 3,
     backoff_factor: float = 0.3,
-    status_forcelist: Tuple[int, ...] = (429, 500, 502, 503, 504)
+    status_forcelist: Tuple[int, ...] = (429, 500, 502, 503, 504),
+    pool_maxsize: int = 10
 ) -> requests.Session:
     """
     Create an HTTP session with automatic retry logic.
@@ -264,6 +1140,7 @@ def create_retry_session(
         retries: Maximum number of retry attempts
         backoff_factor: Multiplier for exponential backoff (0.3 = 0.3s, 0.9s, 2.7s...)
         status_forcelist: HTTP status codes that trigger a retry
+        pool_maxsize: Maximum number of kept-alive connections per host
         
     Returns:
         Configured requests.Session object
@@ -282,12 +1159,236 @@ def create_retry_session(
         allowed_methods=frozenset(['GET', 'POST']),
         raise_on_status=False
     )
-    adapter = HTTPAdapter(max_retries=retry)
+    adapter = HTTPAdapter(
+        max_retries=retry,
+        pool_connections=pool_maxsize,
+        pool_maxsize=pool_maxsize
+    )
     session.mount('http://', adapter)
     session.mount('https://', adapter)
     return session
 
 
+@functools.lru_cache(maxsize=None)
+def get_shared_session(retries: int = 3) -> requests.Session:
+    """
+    Get a process-wide retry session, creating it on first use.
+    
+    Reusing one session keeps connections to each API host alive, so TLS
+    handshakes are paid once per host rather than once per fetch. Sessions
+    are cached per retry count.
+    
+    Args:
+        retries: Maximum number of retry attempts
+        
+    Returns:
+        Shared requests.Session object
+        
+    Example:
+        >>> session = get_shared_session(retries=5)
+        >>> response = session.get('https://api.example.com/data')
+    """
+    return create_retry_session(retries=retries, pool_maxsize=HTTP_POOL_SIZE)
+
+
+# =============================================================================
+# ArcGIS Queries
+# =============================================================================
+
+# Page requests are leaf tasks on their own pool, so fetches running on the
+# disaster query pool can fan out without waiting on their own workers
+_page_executor = ThreadPoolExecutor(
+    max_workers=HTTP_POOL_SIZE,
+    thread_name_prefix='arcgis-page'
+)
+
+
+def decode_json_response(response: requests.Response) -> Any:
+    """
+    Decode a JSON response body straight from its raw bytes.
+    
+    Uses orjson when it is installed, which is faster than response.json()
+    and skips decoding the body to text first.
+    
+    Args:
+        response: Response to decode
+        
+    Returns:
+        Decoded JSON document
+    """
+    return _json_loads(response.content)
+
+
+def _arcgis_get(session: requests.Session, url: str, params: dict) -> Optional[dict]:
+    """
+    Issue one ArcGIS query request, waiting out rate limits.
+    
+    Args:
+        session: Session to send the request with
+        url: Layer query URL
+        params: Query parameters
+        
+    Returns:
+        Decoded JSON response, or None on a request or API error
+    """
+    while True:
+        try:
+            response = session.get(url, params=params, timeout=30)
+            data = decode_json_response(response)
+        except Exception as e:
+            logger.error(f"Request error: {str(e)}")
+            return None
+        
+        if 'error' not in data:
+            return data
+        
+        error = data['error']
+        logger.error(f"API error: {error}")
+        
+        # Handle rate limiting
+        if error.get('code') != 429:
+            return None
+        details = error.get('details', ['wait 60 seconds'])
+        try:
+            retry_after = int(details[0].split()[-2])
+        except (IndexError, ValueError):
+            retry_after = 60
+        logger.info(f"Rate limited. Waiting {retry_after} seconds...")
+        time.sleep(retry_after)
+
+
+def _fetch_page(
+    session: requests.Session,
+    url: str,
+    params: dict,
+    offset: int,
+    limit: Optional[int]
+) -> Optional[List[dict]]:
+    """
+    Fetch up to limit features starting at offset (all remaining if None).
+    
+    Keeps requesting from where the last response stopped, so pages the
+    server truncates below the requested size are completed rather than
+    leaving a gap before the next page.
+    """
+    features = []
+    page_size = params['resultRecordCount']
+    while limit is None or len(features) < limit:
+        count = page_size if limit is None else min(page_size, limit - len(features))
+        page_offset = offset + len(features)
+        logger.debug(f"Fetching from {url} with offset: {page_offset}")
+        
+        data = _arcgis_get(
+            session, url, {**params, 'resultOffset': page_offset, 'resultRecordCount': count}
+        )
+        if data is None:
+            return None
+        if 'features' not in data:
+            logger.warning("No features in response")
+            break
+        
+        page = data['features']
+        logger.debug(f"Fetched {len(page)} features")
+        features.extend(page)
+        if not page or (limit is None and len(page) < count):
+            break
+    
+    return features
+
+
+def fetch_arcgis_layers(
+    session: requests.Session,
+    urls: List[str],
+    params: dict
+) -> List[Optional[List[dict]]]:
+    """
+    Fetch every feature from one or more ArcGIS layers, pages in parallel.
+    
+    A returnCountOnly probe gives each layer's feature count up front, so all
+    pages of all layers can be requested concurrently instead of walking the
+    offsets one round trip at a time. Layers whose count probe fails are
+    paged serially instead.
+    
+    Args:
+        session: Session to send the requests with
+        urls: Layer query URLs
+        params: Query parameters shared by all layers; resultRecordCount
+            sets the page size
+        
+    Returns:
+        One feature list per URL, or None for layers whose fetch failed
+        
+    Example:
+        >>> session = get_shared_session()
+        >>> params = {'where': '1=1', 'outFields': '*', 'f': 'json', 'resultRecordCount': 2000}
+        >>> cones, points = fetch_arcgis_layers(session, [cone_url, points_url], params)
+    """
+    count_params = {
+        key: value for key, value in params.items()
+        if key not in ('resultOffset', 'resultRecordCount')
+    }
+    count_params.update(returnCountOnly='true', returnGeometry='false')
+    count_futures = [
+        _page_executor.submit(_arcgis_get, session, url, count_params)
+        for url in urls
+    ]
+    
+    page_size = params['resultRecordCount']
+    page_futures = []
+    for url, count_future in zip(urls, count_futures):
+        data = count_future.result()
+        count = data.get('count') if data else None
+        if count is None:
+            logger.warning(f"Count query failed for {url}, paging serially")
+            ranges = [(0, None)]
+        else:
+            ranges = [
+                (offset, min(page_size, count - offset))
+                for offset in range(0, count, page_size)
+            ]
+        page_futures.append([
+            _page_executor.submit(_fetch_page, session, url, params, offset, limit)
+            for offset, limit in ranges
+        ])
+    
+    layers = []
+    for futures in page_futures:
+        pages = [future.result() for future in futures]
+        if any(page is None for page in pages):
+            layers.append(None)
+        else:
+            layers.append([feature for page in pages for feature in page])
+    return layers
+
+
+def features_to_dataframe(features: List[dict]) -> pd.DataFrame:
+    """
+    Build a DataFrame from the attributes of ArcGIS features.
+    
+    Features from one layer share the same attribute keys, so the columns are
+    built directly from the first feature's keys without creating an
+    intermediate dict per row. Layers with mismatched keys fall back to
+    record-wise construction, which fills missing values with NaN.
+    
+    Args:
+        features: ArcGIS feature dictionaries with an 'attributes' key
+        
+    Returns:
+        DataFrame with one row per feature and one column per attribute
+        
+    Example:
+        >>> df = features_to_dataframe(data['features'])
+    """
+    attributes = [feature['attributes'] for feature in features]
+    if not attributes:
+        return pd.DataFrame()
+    
+    keys = attributes[0].keys()
+    if all(attrs.keys() == keys for attrs in attributes):
+        return pd.DataFrame({key: [attrs[key] for attrs in attributes] for key in keys})
+    return pd.DataFrame(attributes)
+
+
 # =============================================================================
 # Coordinate Validation
 # =============================================================================
@@ -355,7 +1456,9 @@ def load_locations_from_csv(filepath: str) -> List[dict]:
     """
     Load location data from a CSV file.
     
-    CSV must have columns: name (or location), latitude, longitude
+    CSV must have columns: name (or location), latitude, longitude. Rows
+    with missing or out-of-range coordinates are skipped with a warning.
+    The file is parsed and validated by load_locations_frame.
     
     Args:
         filepath: Path to the CSV file
@@ -372,53 +1475,174 @@ def load_locations_from_csv(filepath: str) -> List[dict]:
         >>> for loc in locations:
         ...     print(f"{loc['name']}: ({loc['latitude']}, {loc['longitude']})")
     """
+    return load_locations_frame(filepath).to_dict('records')
+
+
+def load_locations_frame(filepath: str) -> pd.DataFrame:
+    """
+    Load location data from a CSV file into a DataFrame.
+    
+    The file is parsed by pandas' C engine and coordinates are converted
+    and validated as whole columns, so batch queries can take the
+    latitude/longitude arrays directly. Invalid rows are skipped with a
+    warning.
+    
+    Args:
+        filepath: Path to the CSV file
+        
+    Returns:
+        DataFrame with 'name', 'latitude' and 'longitude' columns
+        
+    Raises:
+        FileNotFoundError: If CSV file doesn't exist
+        ValueError: If required columns are missing
+        
+    Example:
+        >>> frame = load_locations_frame('data/test_locations.csv')
+        >>> lats, lons = frame['latitude'].to_numpy(), frame['longitude'].to_numpy()
+    """
     filepath = Path(filepath)
     
     if not filepath.exists():
         raise FileNotFoundError(f"CSV file not found: {filepath}")
     
-    locations = []
+    df = pd.read_csv(filepath, dtype=str, na_filter=False, engine='c', encoding='utf-8')
+    
+    # Check for required columns
+    has_name = 'name' in df.columns or 'location' in df.columns
+    has_lat = 'latitude' in df.columns
+    has_lon = 'longitude' in df.columns
+    
+    if not (has_name and has_lat and has_lon):
+        missing = []
+        if not has_name:
+            missing.append('name (or location)')
+        if not has_lat:
+            missing.append('latitude')
+        if not has_lon:
+            missing.append('longitude')
+        raise ValueError(f"CSV missing required columns: {', '.join(missing)}")
+    
+    row_nums = pd.Series(range(2, len(df) + 2), index=df.index)  # Header is row 1
+    if 'location' in df.columns:
+        fallback_names = df['location']
+    else:
+        fallback_names = 'Location ' + row_nums.astype(str)
+    names = df['name'].where(df['name'] != '', fallback_names) if 'name' in df.columns else fallback_names
+    
+    lats = pd.to_numeric(df['latitude'], errors='coerce')
+    lons = pd.to_numeric(df['longitude'], errors='coerce')
+    unparsed = lats.isna() | lons.isna()
+    valid = ~unparsed & lats.between(-90, 90) & lons.between(-180, 180)
     
-    with open(filepath, 'r', newline='', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
+    for row_num in row_nums[unparsed]:
+        logger.warning(f"Row {row_num}: Error parsing row - invalid latitude/longitude")
+    for row_num, lat, lon in zip(row_nums[~unparsed & ~valid], lats[~unparsed & ~valid], lons[~unparsed & ~valid]):
+        logger.warning(f"Row {row_num}: Invalid coordinates ({lat}, {lon}) - skipping")
+    
+    locations = pd.DataFrame({
+        'name': names[valid].str.strip(),
+        'latitude': lats[valid].astype(float),
+        'longitude': lons[valid].astype(float),
+    }).reset_index(drop=True)
+    
+    logger.info(f"Loaded {len(locations)} locations from {filepath}")
+    return locations
+
+
+# =============================================================================
+# Caching
+# =============================================================================
+
+def ttl_cache(
+    seconds: float = CACHE_TTL_SECONDS,
+    cache_if: Optional[Callable[[Any], bool]] = None,
+    stale_if_error: float = 0
+) -> Callable:
+    """
+    Decorator that caches a function's results for a limited time.
+    
+    Results are keyed on the call arguments. Concurrent callers for the same
+    key wait for the first call to finish instead of issuing duplicate
+    requests. Cached results are shared, so callers must not mutate them.
+    
+    Args:
+        seconds: How long a cached result stays valid (default: 600)
+        cache_if: Optional predicate; results for which it returns False
+            (e.g. failed fetches) are returned but not cached
+        stale_if_error: How long past expiry a cached result may still be
+            returned when the refresh is rejected by cache_if (default: 0)
+        
+    Returns:
+        Decorator adding the cache; the wrapped function gains a
+        cache_clear() method
         
-        # Check for required columns
-        fieldnames = reader.fieldnames or []
-        has_name = 'name' in fieldnames or 'location' in fieldnames
-        has_lat = 'latitude' in fieldnames
-        has_lon = 'longitude' in fieldnames
+    Example:
+        >>> @ttl_cache(seconds=300)
+        ... def fetch_feed():
+        ...     return session.get(url).json()
+    """
+    max_age = seconds + stale_if_error
+    
+    def decorator(func: Callable) -> Callable:
+        cache = {}
+        # Per-key [lock, waiter count]; entries are dropped once no caller
+        # holds or waits on them, so this only tracks in-flight keys
+        key_locks = {}
+        guard = threading.Lock()
         
-        if not (has_name and has_lat and has_lon):
-            missing = []
-            if not has_name:
-                missing.append('name (or location)')
-            if not has_lat:
-                missing.append('latitude')
-            if not has_lon:
-                missing.append('longitude')
-            raise ValueError(f"CSV missing required columns: {', '.join(missing)}")
+        def acquire_key_lock(key) -> threading.Lock:
+            with guard:
+                entry = key_locks.setdefault(key, [threading.Lock(), 0])
+                entry[1] += 1
+                return entry[0]
         
-        for row_num, row in enumerate(reader, start=2):  # Start at 2 (header is row 1)
+        def release_key_lock(key) -> None:
+            with guard:
+                entry = key_locks[key]
+                entry[1] -= 1
+                if entry[1] == 0:
+                    del key_locks[key]
+        
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            key = (args, tuple(sorted(kwargs.items())))
+            key_lock = acquire_key_lock(key)
             try:
-                name = row.get('name') or row.get('location', f'Location {row_num}')
-                lat = float(row['latitude'])
-                lon = float(row['longitude'])
-                
-                if validate_coordinates(lat, lon):
-                    locations.append({
-                        'name': name.strip(),
-                        'latitude': lat,
-                        'longitude': lon
-                    })
-                else:
-                    logger.warning(f"Row {row_num}: Invalid coordinates ({lat}, {lon}) - skipping")
+                with key_lock:
+                    with guard:
+                        entry = cache.get(key)
+                    if entry is not None and time.monotonic() - entry[0] < seconds:
+                        logger.debug(f"Using cached result for {func.__name__}")
+                        return entry[1]
                     
-            except (ValueError, KeyError) as e:
-                logger.warning(f"Row {row_num}: Error parsing row - {e}")
-                continue
+                    result = func(*args, **kwargs)
+                    now = time.monotonic()
+                    if cache_if is None or cache_if(result):
+                        with guard:
+                            # Drop expired entries so old keys don't accumulate
+                            for stale in [k for k, (t, _) in cache.items() if now - t >= max_age]:
+                                del cache[stale]
+                            cache[key] = (now, result)
+                    elif entry is not None and now - entry[0] < max_age:
+                        logger.warning(
+                            f"{func.__name__} failed, using cached result from "
+                            f"{now - entry[0]:.0f} seconds ago"
+                        )
+                        return entry[1]
+                    return result
+            finally:
+                release_key_lock(key)
+        
+        def cache_clear() -> None:
+            """Discard all cached results."""
+            with guard:
+                cache.clear()
+        
+        wrapper.cache_clear = cache_clear
+        return wrapper
     
-    logger.info(f"Loaded {len(locations)} locations from {filepath}")
-    return locations
+    return decorator
 
 
 # =============================================================================
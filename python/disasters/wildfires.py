@@ -8,19 +8,25 @@ This module provides functions to:
 """
 
 import math
-import time
 import logging
 from datetime import datetime, timedelta
-from typing import List, Optional, Tuple
+from typing import List, NamedTuple, Optional, Tuple
 
 import numpy as np
 import pandas as pd
 
 from .models import WildfireResult, WildfireSize
 from .utils import (
-    haversine_vectorized,
-    is_point_in_polygon_vectorized,
-    create_retry_session
+    haversine_prepare,
+    great_circle_edges,
+    bbox_index,
+    bbox_candidates,
+    polygon_distances,
+    get_shared_session,
+    fetch_arcgis_layers,
+    features_to_dataframe,
+    ttl_cache,
+    STALE_IF_ERROR_SECONDS
 )
 
 # Configure module logger
@@ -29,23 +35,69 @@ logger = logging.getLogger(__name__)
 # API Configuration
 WILDFIRE_API_URL = 'https://services3.arcgis.com/T4QMspbfLg3qTGWY/ArcGIS/rest/services/WFIGS_Interagency_Perimeters_YearToDate/FeatureServer/0/query'
 
+# fires_df columns read when building a WildfireResult, with the value
+# used when a column is absent
+_RESULT_COLUMNS = {
+    'poly_IncidentName': 'Unknown Fire',
+    'poly_IRWINID': None,
+    'attr_IncidentSize': None,
+    'attr_PercentContained': None,
+    'attr_ModifiedOnDateTime_dt': None,
+    'attr_FireBehaviorGeneral': None,
+    'attr_FireDiscoveryDateTime': None,
+    'attr_FireCause': None,
+    'attr_POOState': None,
+    'attr_POOCounty': None,
+    'attr_POOLatitude': None,
+    'attr_POOLongitude': None,
+}
 
+
+class _FirePerimeters(NamedTuple):
+    """Usable perimeter rings of every fire, concatenated into flat arrays."""
+    n_fires: int
+    vertex_lons: np.ndarray    # Longitudes of every ring's vertices, back to back
+    vertex_lats: np.ndarray    # Latitudes of every ring's vertices, back to back
+    vertex_prep: Tuple[np.ndarray, np.ndarray, np.ndarray]  # haversine_prepare terms
+    edges: np.ndarray          # great_circle_edges rows, one per vertex
+    ring_lengths: np.ndarray   # Vertices in each ring
+    ring_fires: np.ndarray     # Fire each ring belongs to
+    ring_is_outer: np.ndarray  # True for outer boundaries, False for holes
+    ring_bboxes: np.ndarray    # (n_rings, 4) min_lon, min_lat, max_lon, max_lat
+    ring_index: Tuple[np.ndarray, np.ndarray, float]  # bbox_index(ring_bboxes)
+    centroids: List[Optional[Tuple[float, float]]]  # (lat, lon) per fire, None without an outer ring
+
+
+# DataFrame last passed to _fire_perimeters and its flattened rings
+_perimeters_cache: Tuple[Optional[pd.DataFrame], Optional[_FirePerimeters]] = (None, None)
+
+
+def _fetch_succeeded(fires_df: Optional[pd.DataFrame]) -> bool:
+    """Whether a fetch_active_wildfires result should be cached."""
+    return fires_df is not None
+
+
+@ttl_cache(cache_if=_fetch_succeeded, stale_if_error=STALE_IF_ERROR_SECONDS)
 def fetch_active_wildfires(
     days_recent: int = 7,
     max_retries: int = 5
-) -> pd.DataFrame:
+) -> Optional[pd.DataFrame]:
     """
     Fetch active wildfire perimeters from WFIGS.
     
     Retrieves wildfire perimeter polygons from the WFIGS ArcGIS service
-    and filters to recently active fires.
+    and filters to recently active fires. Results, including empty ones,
+    are cached for 10 minutes per days_recent value, and returned for up to
+    an hour more if a refresh fails; callers must not modify the returned
+    DataFrame.
     
     Args:
         days_recent: Only include fires modified within this many days (default: 7)
         max_retries: Maximum number of retry attempts for API calls
         
     Returns:
-        DataFrame with wildfire perimeter data and geometry
+        DataFrame with wildfire perimeter data and geometry (empty if no
+        fires are active), or None if the data could not be fetched
         
     Example:
         >>> fires_df = fetch_active_wildfires(days_recent=14)
@@ -61,50 +113,12 @@ def fetch_active_wildfires(
         'resultRecordCount': 2000
     }
     
-    all_features = []
-    offset = 0
-    session = create_retry_session(retries=max_retries)
+    session = get_shared_session(retries=max_retries)
+    (all_features,) = fetch_arcgis_layers(session, [WILDFIRE_API_URL], params)
     
-    while True:
-        params['resultOffset'] = offset
-        logger.debug(f"Fetching wildfires with offset: {offset}")
-        
-        try:
-            response = session.get(WILDFIRE_API_URL, params=params, timeout=30)
-            data = response.json()
-            
-            if 'error' in data:
-                error = data['error']
-                logger.error(f"API error: {error}")
-                
-                # Handle rate limiting
-                if error.get('code') == 429:
-                    details = error.get('details', ['wait 60 seconds'])
-                    try:
-                        retry_after = int(details[0].split()[-2])
-                    except (IndexError, ValueError):
-                        retry_after = 60
-                    logger.info(f"Rate limited. Waiting {retry_after} seconds...")
-                    time.sleep(retry_after)
-                    continue
-                return pd.DataFrame()
-            
-            if 'features' not in data:
-                logger.warning("No features in response")
-                break
-            
-            features = data['features']
-            logger.debug(f"Fetched {len(features)} features")
-            all_features.extend(features)
-            
-            if len(features) < params['resultRecordCount']:
-                break
-                
-            offset += len(features)
-            
-        except Exception as e:
-            logger.error(f"Request error: {str(e)}")
-            return pd.DataFrame()
+    if all_features is None:
+        logger.error("Failed to fetch wildfire data")
+        return None
     
     if not all_features:
         logger.info("No wildfire data found")
@@ -112,8 +126,8 @@ def fetch_active_wildfires(
     
     logger.info(f"Total features fetched: {len(all_features)}")
     
-    # Convert to DataFrame
-    df = pd.DataFrame([feature['attributes'] for feature in all_features])
+    # Convert to DataFrame, column by column
+    df = features_to_dataframe(all_features)
     
     # Extract geometry (polygon rings)
     df['geometry_rings'] = [
@@ -179,22 +193,36 @@ def get_wildfires_near_location(
     
     fires_df = fetch_active_wildfires(days_recent=days_recent)
     
-    if fires_df.empty:
+    if fires_df is None or fires_df.empty:
         logger.info("No active wildfires to process")
         return results
     
-    for _, fire in fires_df.iterrows():
+    # Distance to every fire perimeter in one vectorized pass
+    perimeters = _fire_perimeters(fires_df)
+    distances, insides = _calculate_distances_to_fires(lat, lon, perimeters, radius_miles)
+    
+    # Only fires within the radius (or containing the point) go on to build
+    # results, in distance order (stable, so ties keep feed order), which
+    # leaves them sorted without a key-function sort afterwards
+    within = np.flatnonzero((distances <= radius_miles) | insides)
+    nearest_first = within[np.argsort(distances[within], kind='stable')]
+    
+    # Plain per-column lists of just those fires, so the loop below indexes
+    # values directly instead of building a pandas Series for every fire
+    columns = {
+        name: _column_values(fires_df, name, default, nearest_first)
+        for name, default in _RESULT_COLUMNS.items()
+    }
+    
+    for j, i in enumerate(nearest_first.tolist()):
         try:
-            # Calculate distance to fire
-            distance, inside = _calculate_distance_to_fire(lat, lon, fire)
-            
-            if distance > radius_miles and not inside:
-                continue
+            distance = float(distances[i])
+            inside = bool(insides[i])
             
             # Get fire info
-            fire_name = fire.get('poly_IncidentName', 'Unknown Fire')
-            fire_id = fire.get('poly_IRWINID')
-            acres = fire.get('attr_IncidentSize')
+            fire_name = columns['poly_IncidentName'][j]
+            fire_id = columns['poly_IRWINID'][j]
+            acres = columns['attr_IncidentSize'][j]
             
             # Determine size category
             size_category = None
@@ -206,7 +234,7 @@ def get_wildfires_near_location(
                     acres = None
             
             # Get containment
-            containment = fire.get('attr_PercentContained')
+            containment = columns['attr_PercentContained'][j]
             if containment is not None:
                 try:
                     containment = float(containment)
@@ -225,7 +253,10 @@ def get_wildfires_near_location(
                 severity += f" ({containment:.0f}% contained)"
             
             # Get fire centroid for coordinates
-            fire_lat, fire_lon = _get_fire_centroid(fire)
+            fire_lat, fire_lon = _get_fire_centroid(
+                perimeters.centroids[i],
+                columns['attr_POOLatitude'][j], columns['attr_POOLongitude'][j]
+            )
             
             result = WildfireResult(
                 disaster_type=None,  # Set by __post_init__
@@ -239,13 +270,13 @@ def get_wildfires_near_location(
                 containment_percent=containment,
                 inside_perimeter=inside,
                 fire_id=fire_id,
-                last_updated=fire.get('attr_ModifiedOnDateTime_dt'),
+                last_updated=columns['attr_ModifiedOnDateTime_dt'][j],
                 details={
-                    'fire_behavior': fire.get('attr_FireBehaviorGeneral'),
-                    'discovery_date': fire.get('attr_FireDiscoveryDateTime'),
-                    'cause': fire.get('attr_FireCause'),
-                    'state': fire.get('attr_POOState'),
-                    'county': fire.get('attr_POOCounty'),
+                    'fire_behavior': columns['attr_FireBehaviorGeneral'][j],
+                    'discovery_date': columns['attr_FireDiscoveryDateTime'][j],
+                    'cause': columns['attr_FireCause'][j],
+                    'state': columns['attr_POOState'][j],
+                    'county': columns['attr_POOCounty'][j],
                 }
             )
             
@@ -255,119 +286,224 @@ def get_wildfires_near_location(
             logger.error(f"Error processing wildfire: {str(e)}")
             continue
     
-    # Sort by distance
-    results.sort(key=lambda x: x.distance_miles)
-    
     logger.info(f"Found {len(results)} wildfires within {radius_miles} miles")
     return results
 
 
-def _calculate_distance_to_fire(
-    user_lat: float,
-    user_lon: float,
-    fire: pd.Series
-) -> Tuple[float, bool]:
+def _column_values(
+    fires_df: pd.DataFrame,
+    name: str,
+    default=None,
+    rows: Optional[np.ndarray] = None
+) -> list:
+    """Values of a fires_df column (at rows, if given) as a list, all default if the column is absent."""
+    n_rows = len(fires_df) if rows is None else len(rows)
+    if name not in fires_df.columns:
+        return [default] * n_rows
+    values = fires_df[name]
+    return (values if rows is None else values.take(rows)).tolist()
+
+
+def _fire_perimeters(fires_df: pd.DataFrame) -> _FirePerimeters:
     """
-    Calculate distance from a point to a fire perimeter.
+    Flatten the perimeter rings of a fires DataFrame.
+    
+    fetch_active_wildfires returns the same cached DataFrame to every query
+    while it is fresh, so the arrays for the most recent DataFrame are kept
+    and reused rather than rebuilt from the rings for each location.
     
     Args:
-        user_lat: User's latitude
-        user_lon: User's longitude
-        fire: DataFrame row containing fire data and geometry
+        fires_df: DataFrame from fetch_active_wildfires
         
     Returns:
-        Tuple of (distance_miles, is_inside_perimeter)
+        _FirePerimeters with read-only arrays
     """
-    try:
-        rings = fire.get('geometry_rings', [])
-        
-        if not rings:
-            # No polygon geometry, return infinity
-            return float('inf'), False
-        
-        # In ArcGIS geometry:
-        # - rings[0] is the outer boundary
-        # - rings[1:] are interior rings (holes - unburned areas)
-        # A point is inside the fire perimeter if:
-        # - It IS inside the outer boundary (rings[0])
-        # - It is NOT inside any hole ring (rings[1:])
-        
-        inside_outer = False
-        inside_hole = False
-        min_distance = float('inf')
+    global _perimeters_cache
+    cached_df, perimeters = _perimeters_cache
+    if cached_df is fires_df:
+        return perimeters
+    
+    perimeters = _parse_fire_perimeters(_column_values(fires_df, 'geometry_rings', []))
+    for array in (
+        perimeters.vertex_lons, perimeters.vertex_lats, *perimeters.vertex_prep,
+        perimeters.edges, perimeters.ring_lengths, perimeters.ring_fires,
+        perimeters.ring_is_outer, perimeters.ring_bboxes, *perimeters.ring_index[:2],
+    ):
+        array.flags.writeable = False
+    _perimeters_cache = (fires_df, perimeters)
+    return perimeters
+
+
+def _parse_fire_perimeters(fire_rings: List[list]) -> _FirePerimeters:
+    """
+    Convert ArcGIS geometry rings to _FirePerimeters.
+    
+    In ArcGIS geometry rings[0] is the outer boundary and rings[1:] are
+    interior rings (holes - unburned areas). Empty rings and rings with
+    fewer than 3 points are skipped, as are fires whose rings cannot be
+    parsed. Each fire's reported location, the mean of its outer ring's
+    vertices, is computed here too.
+    
+    Args:
+        fire_rings: Perimeter polygon rings of each fire
         
-        for i, ring in enumerate(rings):
-            if not ring:
-                continue
-                
-            poly_points = np.array(ring)
-            
-            if len(poly_points) < 3:
-                continue
-            
-            # Check if inside this ring
-            ring_inside = is_point_in_polygon_vectorized(
-                np.array([user_lon]),
-                np.array([user_lat]),
-                poly_points
-            )
-            
-            if ring_inside[0]:
+    Returns:
+        _FirePerimeters holding the usable rings of all fires
+    """
+    ring_points = []
+    ring_fires = []
+    ring_is_outer = []
+    centroids = []
+    for f, rings in enumerate(fire_rings):
+        centroid = None
+        try:
+            fire_ring_points = []
+            is_outer = []
+            for i, ring in enumerate(rings or []):
+                if not ring:
+                    continue
                 if i == 0:
-                    # Inside outer boundary
-                    inside_outer = True
-                else:
-                    # Inside a hole (unburned area)
-                    inside_hole = True
-            
-            # Calculate minimum distance to ring boundary
-            distances = haversine_vectorized(
-                user_lon,
-                user_lat,
-                poly_points[:, 0],
-                poly_points[:, 1]
-            )
-            
-            ring_min_distance = float(np.min(distances))
-            min_distance = min(min_distance, ring_min_distance)
-        
-        # Point is inside fire perimeter only if inside outer boundary
-        # AND not inside any hole
-        inside = inside_outer and not inside_hole
-        
-        if inside:
-            return 0.0, True
+                    centroid = (0.0, 0.0)  # Unless the outer ring parses
+                poly_points = np.array(ring, dtype=float)
+                if i == 0:
+                    centroid = (
+                        float(np.mean(poly_points[:, 1])), float(np.mean(poly_points[:, 0]))
+                    )
+                if len(poly_points) < 3:
+                    continue
+                fire_ring_points.append(poly_points[:, :2])
+                is_outer.append(i == 0)
+        except Exception as e:
+            logger.error(f"Error calculating fire distance: {str(e)}")
+            continue
+        finally:
+            centroids.append(centroid)
         
-        return min_distance, False
+        ring_points.extend(fire_ring_points)
+        ring_fires.extend([f] * len(fire_ring_points))
+        ring_is_outer.extend(is_outer)
+    
+    ring_lengths = np.array([len(points) for points in ring_points], dtype=np.intp)
+    if ring_points:
+        # Separate contiguous lon and lat arrays, the layout the distance
+        # kernels read
+        vertices = np.concatenate(ring_points)
+        vertex_lons = np.ascontiguousarray(vertices[:, 0])
+        vertex_lats = np.ascontiguousarray(vertices[:, 1])
+        starts = np.cumsum(ring_lengths) - ring_lengths
+        ring_bboxes = np.column_stack([
+            np.minimum.reduceat(vertex_lons, starts), np.minimum.reduceat(vertex_lats, starts),
+            np.maximum.reduceat(vertex_lons, starts), np.maximum.reduceat(vertex_lats, starts),
+        ])
+    else:
+        vertex_lons = np.empty(0)
+        vertex_lats = np.empty(0)
+        starts = np.empty(0, dtype=np.intp)
+        ring_bboxes = np.empty((0, 4))
+    
+    return _FirePerimeters(
+        n_fires=len(fire_rings),
+        vertex_lons=vertex_lons,
+        vertex_lats=vertex_lats,
+        vertex_prep=haversine_prepare(vertex_lons, vertex_lats),
+        edges=great_circle_edges(vertex_lons, vertex_lats, starts),
+        ring_lengths=ring_lengths,
+        ring_fires=np.array(ring_fires, dtype=np.intp),
+        ring_is_outer=np.array(ring_is_outer, dtype=bool),
+        ring_bboxes=ring_bboxes,
+        ring_index=bbox_index(ring_bboxes),
+        centroids=centroids,
+    )
+
+
+def _calculate_distances_to_fires(
+    user_lat: float,
+    user_lon: float,
+    perimeters: _FirePerimeters,
+    max_miles: float = np.inf
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Calculate distances from a point to every fire perimeter.
+    
+    Rings whose bounding box rules them out are dropped, and the rest are
+    passed to polygon_distances, which computes containment and the
+    distance to the nearest point on the boundary (a vertex or anywhere
+    along an edge) for every ring in a single pass (one compiled loop
+    when Numba is installed). Ring results are then folded into
+    per-fire results: a point is inside the fire perimeter if it IS inside
+    the outer boundary and NOT inside any hole.
+    
+    Args:
+        user_lat: User's latitude
+        user_lon: User's longitude
+        perimeters: Fire rings from _fire_perimeters
+        max_miles: Distances beyond this may be reported as inf
+            (default: no limit)
         
-    except Exception as e:
-        logger.error(f"Error calculating fire distance: {str(e)}")
-        return float('inf'), False
+    Returns:
+        Tuple of (distances_miles, inside_perimeter) arrays with one entry
+        per fire; fires without usable rings are infinitely far
+    """
+    n_fires = perimeters.n_fires
+    distances = np.full(n_fires, np.inf)
+    
+    # Rings whose bounding box is already beyond max_miles can neither
+    # contain the point nor come within range, so only the rest go through
+    # the vertex-level pass. The prebuilt latitude index limits even the
+    # bounding-box test to rings in the point's latitude band
+    _, near_rings = bbox_candidates(
+        [user_lon], [user_lat], perimeters.ring_bboxes, max_miles, index=perimeters.ring_index
+    )
+    if len(near_rings) == 0:
+        return distances, np.zeros(n_fires, dtype=bool)
+    near = np.zeros(len(perimeters.ring_lengths), dtype=bool)
+    near[near_rings] = True
+    
+    near_vertices = np.repeat(near, perimeters.ring_lengths)
+    ring_lengths = perimeters.ring_lengths[near]
+    starts = np.cumsum(ring_lengths) - ring_lengths
+    ring_distances, ring_inside = polygon_distances(
+        [user_lon], [user_lat],
+        perimeters.vertex_lons[near_vertices], perimeters.vertex_lats[near_vertices],
+        starts, max_miles,
+        vertex_prep=tuple(term[near_vertices] for term in perimeters.vertex_prep),
+        edges=perimeters.edges[near_vertices]
+    )
+    
+    ring_fires = perimeters.ring_fires[near]
+    ring_is_outer = perimeters.ring_is_outer[near]
+    np.minimum.at(distances, ring_fires, ring_distances[0])
+    inside_outer = np.zeros(n_fires, dtype=bool)
+    inside_hole = np.zeros(n_fires, dtype=bool)
+    inside_outer[ring_fires[ring_inside[0] & ring_is_outer]] = True
+    inside_hole[ring_fires[ring_inside[0] & ~ring_is_outer]] = True
+    
+    inside = inside_outer & ~inside_hole
+    distances[inside] = 0.0
+    return distances, inside
 
 
-def _get_fire_centroid(fire: pd.Series) -> Tuple[float, float]:
+def _get_fire_centroid(
+    centroid: Optional[Tuple[float, float]],
+    poo_lat: Optional[float],
+    poo_lon: Optional[float]
+) -> Tuple[float, float]:
     """
-    Calculate the centroid of a fire perimeter.
+    Choose the coordinates reported for a fire.
     
     Args:
-        fire: DataFrame row containing fire geometry
+        centroid: Outer ring centroid from _parse_fire_perimeters, if any
+        poo_lat: Point of origin latitude, used when there is no perimeter
+        poo_lon: Point of origin longitude, used when there is no perimeter
         
     Returns:
         Tuple of (latitude, longitude) for fire center
     """
+    if centroid is not None:
+        return centroid
+    
     try:
-        rings = fire.get('geometry_rings', [])
-        
-        if rings and rings[0]:
-            poly_points = np.array(rings[0])
-            centroid_lon = np.mean(poly_points[:, 0])
-            centroid_lat = np.mean(poly_points[:, 1])
-            return float(centroid_lat), float(centroid_lon)
-        
         # Fallback to POO (Point of Origin) if available
-        poo_lat = fire.get('attr_POOLatitude')
-        poo_lon = fire.get('attr_POOLongitude')
-        
         if poo_lat is not None and poo_lon is not None:
             return float(poo_lat), float(poo_lon)
         
@@ -376,4 +512,3 @@ def _get_fire_centroid(fire: pd.Series) -> Tuple[float, float]:
     except Exception as e:
         logger.error(f"Error calculating fire centroid: {str(e)}")
         return 0.0, 0.0
-
@@ -12,7 +12,8 @@ Run without arguments to start the interactive session:
 import re
 import sys
 import logging
-from typing import List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor, TimeoutError
+from typing import TYPE_CHECKING, List, Optional, Tuple
 
 # Rich for beautiful terminal output
 from rich.console import Console
@@ -27,16 +28,20 @@ from rich import box
 import questionary
 from questionary import Style as QStyle
 
-from disasters import (
-    get_nearby_disasters,
-    DisasterType,
-    LocationResults,
-    configure_logging,
-)
+# The disasters package (NumPy, pandas, requests) is imported where it is
+# first needed, so the banner appears without waiting for it
+if TYPE_CHECKING:
+    from disasters import DisasterType, LocationResults
+    from disasters.models import HurricaneResult, TornadoResult, WildfireResult
 
 # Initialize Rich console
 console = Console()
 
+# Queries run on a worker thread so the spinner is only shown for those
+# still running after SPINNER_DELAY_SECONDS (cached results return sooner)
+SPINNER_DELAY_SECONDS = 0.1
+_query_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='query')
+
 # Custom questionary style - cyberpunk/terminal aesthetic
 PROMPT_STYLE = QStyle([
     ('qmark', 'fg:#ff6b6b bold'),        # Question mark
@@ -64,6 +69,23 @@ COLORS = {
     'wildfire': '#ff9f43',
 }
 
+# "lat, lon" or "lat lon", with optional surrounding whitespace. Compiled
+# once, since questionary validates the input on every keystroke
+_COORDINATE_PATTERN = re.compile(r'\s*(-?\d+\.?\d*)\s*[,\s]\s*(-?\d+\.?\d*)\s*')
+
+# Alert labels for the Status columns; shared by every row that shows
+# one, so their markup is parsed once rather than per row
+_INSIDE_CONE = Text.from_markup("[bold #ffe66d]⚠️ INSIDE CONE[/]")
+_INSIDE_PERIMETER = Text.from_markup("[bold #ff6b6b]🚨 INSIDE PERIMETER[/]")
+
+# Rule printed between queries in a session
+_SEPARATOR = Text("─" * 65, style="#6c757d")
+
+# Coordinates text last passed to _parse_coordinates and its result
+_coordinates_cache: Tuple[Optional[str], Tuple[bool, Optional[float], Optional[float]]] = (
+    None, (False, None, None)
+)
+
 ASCII_BANNER = r"""
     [#ff6b6b]⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠹⣦⣀⠀⠀⠀⠀⠀⠀⢲⣄⡀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⣠⡆⠀⠀⠀⠀⠀⠀⠀⠛⣦⣄⣀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
     ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠙⣿⣷⣤⠀⠀⠀⠀⠀⢻⣿⣷⣄⢀⠀⠀⠀⠀⠀⠀⢀⣴⣿⡟⠀⠀⠀⠀⠀⠀⠀⠀⠀⠈⢻⣿⣷⣦⡀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
@@ -106,9 +128,13 @@ ASCII_BANNER = r"""
 """
 
 
+# The banner never changes, so its markup is parsed once at import
+_BANNER_TEXT = Text.from_markup(ASCII_BANNER)
+
+
 def show_banner():
     """Display the ASCII art banner."""
-    console.print(ASCII_BANNER)
+    console.print(_BANNER_TEXT)
 
 
 def validate_coordinate_format(text: str) -> Tuple[bool, Optional[float], Optional[float]]:
@@ -122,38 +148,48 @@ def validate_coordinate_format(text: str) -> Tuple[bool, Optional[float], Option
     Returns:
         Tuple of (is_valid, latitude, longitude)
     """
-    if not text or not text.strip():
+    if not text:
         return False, None, None
     
-    # Clean the input
-    text = text.strip()
-    
-    # Try comma-separated format
-    pattern = r'^(-?\d+\.?\d*)\s*,\s*(-?\d+\.?\d*)$'
-    match = re.match(pattern, text)
-    
-    if not match:
-        # Try space-separated format
-        pattern = r'^(-?\d+\.?\d*)\s+(-?\d+\.?\d*)$'
-        match = re.match(pattern, text)
-    
+    match = _COORDINATE_PATTERN.fullmatch(text)
     if not match:
         return False, None, None
     
-    try:
-        lat = float(match.group(1))
-        lon = float(match.group(2))
-        
-        # Validate ranges
-        if not (-90 <= lat <= 90):
-            return False, None, None
-        if not (-180 <= lon <= 180):
-            return False, None, None
-        
+    # The pattern only matches valid float syntax, so float() cannot fail
+    lat = float(match.group(1))
+    lon = float(match.group(2))
+    
+    # Validate ranges
+    if -90 <= lat <= 90 and -180 <= lon <= 180:
         return True, lat, lon
-        
-    except ValueError:
-        return False, None, None
+    return False, None, None
+
+
+def _parse_coordinates(text: str) -> Tuple[bool, Optional[float], Optional[float]]:
+    """
+    validate_coordinate_format, reusing the result for the last text parsed.
+    
+    questionary validates the answer once more when it is submitted, so the
+    text get_coordinates reads back has always just been parsed.
+    """
+    global _coordinates_cache
+    cached_text, result = _coordinates_cache
+    if cached_text != text:
+        result = validate_coordinate_format(text)
+        _coordinates_cache = (text, result)
+    return result
+
+
+def _validate_coordinates(text: str):
+    """questionary validator for the coordinates prompt."""
+    return _parse_coordinates(text)[0] or "Invalid format. Use: lat, lon (e.g., 29.7604, -95.3698)"
+
+
+def _validate_radius(text: str):
+    """questionary validator for the custom radius prompt (a positive whole number)."""
+    # isdecimal() rather than isdigit(), which also accepts characters
+    # like '²' that int() and float() reject
+    return text.isdecimal() and text.lstrip('0') != '' or "Enter a positive number"
 
 
 def get_coordinates() -> Tuple[float, float, str]:
@@ -172,13 +208,13 @@ def get_coordinates() -> Tuple[float, float, str]:
         coords = questionary.text(
             "Coordinates:",
             style=PROMPT_STYLE,
-            validate=lambda x: validate_coordinate_format(x)[0] or "Invalid format. Use: lat, lon (e.g., 29.7604, -95.3698)"
+            validate=_validate_coordinates
         ).ask()
         
         if coords is None:  # User pressed Ctrl+C
             raise KeyboardInterrupt()
         
-        is_valid, lat, lon = validate_coordinate_format(coords)
+        is_valid, lat, lon = _parse_coordinates(coords)
         
         if is_valid:
             break
@@ -196,13 +232,15 @@ def get_coordinates() -> Tuple[float, float, str]:
     return lat, lon, name or "My Location"
 
 
-def get_disaster_types() -> List[DisasterType]:
+def get_disaster_types() -> List['DisasterType']:
     """
     Prompt user to select disaster types to query.
     
     Returns:
         List of selected DisasterType enums
     """
+    from disasters import DisasterType
+    
     console.print()
     
     choices = questionary.checkbox(
@@ -258,7 +296,7 @@ def get_radius() -> float:
     if radius == -1.0:
         custom = questionary.text(
             "Enter custom radius (miles):",
-            validate=lambda x: x.isdigit() and int(x) > 0 or "Enter a positive number",
+            validate=_validate_radius,
             style=PROMPT_STYLE
         ).ask()
         
@@ -270,114 +308,118 @@ def get_radius() -> float:
     return radius
 
 
-def display_results(results: LocationResults):
+def _hurricane_row(h: 'HurricaneResult') -> Tuple:
+    """Table cells for one hurricane."""
+    status = _INSIDE_CONE if h.inside_cone else ""
+    dist = f"{h.distance_miles:.1f} mi"
+    wind = f"{h.max_wind_mph:.0f} mph" if h.max_wind_mph else "N/A"
+    return h.name, dist, h.severity, wind, status
+
+
+def _tornado_row(t: 'TornadoResult') -> Tuple:
+    """Table cells for one tornado."""
+    ef_str = f"EF{t.ef_scale.value}" if t.ef_scale else "?"
+    dist = f"{t.distance_miles:.1f} mi"
+    date = t.storm_date.strftime("%Y-%m-%d") if t.storm_date else "Unknown"
+    path = f"{t.path_length_miles:.1f}mi × {t.path_width_yards:.0f}yd" if t.path_length_miles and t.path_width_yards else "N/A"
+    
+    casualties_parts = []
+    if t.fatalities:
+        casualties_parts.append(f"💀 {t.fatalities}")
+    if t.injuries:
+        casualties_parts.append(f"🤕 {t.injuries}")
+    casualties = " ".join(casualties_parts) if casualties_parts else "-"
+    
+    return ef_str, dist, date, path, casualties
+
+
+def _wildfire_row(w: 'WildfireResult') -> Tuple:
+    """Table cells for one wildfire."""
+    status = _INSIDE_PERIMETER if w.inside_perimeter else ""
+    dist = f"{w.distance_miles:.1f} mi"
+    size = f"{w.acres:,.0f} ac" if w.acres else "Unknown"
+    contained = f"{w.containment_percent:.0f}%" if w.containment_percent is not None else "?"
+    return w.name, dist, size, contained, status
+
+
+# Result sections in display order: (LocationResults attribute, color,
+# title, (column header, add_column options) pairs, row function,
+# message when there are none)
+_SECTIONS = (
+    ('hurricanes', '#ff6b6b', "🌀 HURRICANES", (
+        ("Name", {'style': "#ff6b6b bold"}),
+        ("Distance", {'justify': "right"}),
+        ("Category", {'justify': "center"}),
+        ("Wind", {'justify': "right"}),
+        ("Status", {}),
+    ), _hurricane_row, "🌀 No hurricanes within search radius"),
+    ('tornadoes', '#ffe66d', "🌪️  TORNADOES", (
+        ("Rating", {'style': "#ffe66d bold", 'justify': "center"}),
+        ("Distance", {'justify': "right"}),
+        ("Date", {}),
+        ("Path", {}),
+        ("Casualties", {'justify': "center"}),
+    ), _tornado_row, "🌪️  No recent tornadoes within search radius"),
+    ('wildfires', '#ff9f43', "🔥 WILDFIRES", (
+        ("Name", {'style': "#ff9f43 bold"}),
+        ("Distance", {'justify': "right"}),
+        ("Size", {'justify': "right"}),
+        ("Contained", {'justify': "center"}),
+        ("Status", {}),
+    ), _wildfire_row, "🔥 No active wildfires within search radius"),
+)
+
+
+def display_results(results: 'LocationResults'):
     """Display query results with rich formatting."""
-    console.print()
-    
-    # Header panel
-    header = Table.grid(padding=1)
-    header.add_column(justify="center")
-    header.add_row(f"[bold #4ecdc4]📍 {results.location.name}[/]")
-    header.add_row(f"[#6c757d]({results.location.latitude}, {results.location.longitude})[/]")
-    header.add_row(f"[#6c757d]Search radius: {results.radius_miles} miles[/]")
-    
-    console.print(Panel(header, border_style="#4ecdc4", box=box.DOUBLE))
-    
-    # Hurricanes
-    if results.hurricanes:
+    # Rich buffers everything printed inside the with block and writes it
+    # to the terminal in one go, instead of once per print call
+    with console:
         console.print()
-        console.print(f"[bold #ff6b6b]🌀 HURRICANES ({len(results.hurricanes)} found)[/]")
-        
-        table = Table(box=box.ROUNDED, border_style="#ff6b6b", show_header=True)
-        table.add_column("Name", style="#ff6b6b bold")
-        table.add_column("Distance", justify="right")
-        table.add_column("Category", justify="center")
-        table.add_column("Wind", justify="right")
-        table.add_column("Status")
         
-        for h in results.hurricanes:
-            status = "[bold #ffe66d]⚠️ INSIDE CONE[/]" if h.inside_cone else ""
-            dist = f"{h.distance_miles:.1f} mi"
-            wind = f"{h.max_wind_mph:.0f} mph" if h.max_wind_mph else "N/A"
-            table.add_row(h.name, dist, h.severity, wind, status)
-        
-        console.print(table)
-    else:
-        console.print()
-        console.print("[#6c757d]🌀 No hurricanes within search radius[/]")
-    
-    # Tornadoes
-    if results.tornadoes:
-        console.print()
-        console.print(f"[bold #ffe66d]🌪️  TORNADOES ({len(results.tornadoes)} found)[/]")
+        # Header panel
+        header = Table.grid(padding=1)
+        header.add_column(justify="center")
+        header.add_row(f"[bold #4ecdc4]📍 {results.location.name}[/]")
+        header.add_row(f"[#6c757d]({results.location.latitude}, {results.location.longitude})[/]")
+        header.add_row(f"[#6c757d]Search radius: {results.radius_miles} miles[/]")
         
-        table = Table(box=box.ROUNDED, border_style="#ffe66d", show_header=True)
-        table.add_column("Rating", style="#ffe66d bold", justify="center")
-        table.add_column("Distance", justify="right")
-        table.add_column("Date")
-        table.add_column("Path")
-        table.add_column("Casualties", justify="center")
+        console.print(Panel(header, border_style="#4ecdc4", box=box.DOUBLE))
         
-        for t in results.tornadoes:
-            ef_str = f"EF{t.ef_scale.value}" if t.ef_scale else "?"
-            dist = f"{t.distance_miles:.1f} mi"
-            date = t.storm_date.strftime("%Y-%m-%d") if t.storm_date else "Unknown"
-            path = f"{t.path_length_miles:.1f}mi × {t.path_width_yards:.0f}yd" if t.path_length_miles and t.path_width_yards else "N/A"
+        for attr, color, title, columns, format_row, empty in _SECTIONS:
+            items = getattr(results, attr)
+            console.print()
+            if not items:
+                console.print(f"[#6c757d]{empty}[/]")
+                continue
             
-            casualties_parts = []
-            if t.fatalities:
-                casualties_parts.append(f"💀 {t.fatalities}")
-            if t.injuries:
-                casualties_parts.append(f"🤕 {t.injuries}")
-            casualties = " ".join(casualties_parts) if casualties_parts else "-"
+            console.print(f"[bold {color}]{title} ({len(items)} found)[/]")
             
-            table.add_row(ef_str, dist, date, path, casualties)
-        
-        console.print(table)
-    else:
-        console.print()
-        console.print("[#6c757d]🌪️  No recent tornadoes within search radius[/]")
-    
-    # Wildfires
-    if results.wildfires:
-        console.print()
-        console.print(f"[bold #ff9f43]🔥 WILDFIRES ({len(results.wildfires)} found)[/]")
-        
-        table = Table(box=box.ROUNDED, border_style="#ff9f43", show_header=True)
-        table.add_column("Name", style="#ff9f43 bold")
-        table.add_column("Distance", justify="right")
-        table.add_column("Size", justify="right")
-        table.add_column("Contained", justify="center")
-        table.add_column("Status")
-        
-        for w in results.wildfires:
-            status = "[bold #ff6b6b]🚨 INSIDE PERIMETER[/]" if w.inside_perimeter else ""
-            dist = f"{w.distance_miles:.1f} mi"
-            size = f"{w.acres:,.0f} ac" if w.acres else "Unknown"
-            contained = f"{w.containment_percent:.0f}%" if w.containment_percent is not None else "?"
-            table.add_row(w.name, dist, size, contained, status)
+            table = Table(box=box.ROUNDED, border_style=color, show_header=True)
+            for heading, options in columns:
+                table.add_column(heading, **options)
+            
+            for item in items:
+                table.add_row(*format_row(item))
+            
+            console.print(table)
         
-        console.print(table)
-    else:
+        # Summary
         console.print()
-        console.print("[#6c757d]🔥 No active wildfires within search radius[/]")
-    
-    # Summary
-    console.print()
-    total = results.total_disasters
-    if total > 0:
-        style = "#ff6b6b bold" if total >= 5 else "#ffe66d bold" if total >= 2 else "#95e1d3 bold"
-        console.print(Panel(
-            f"[{style}]⚡ {total} TOTAL DISASTERS WITHIN {results.radius_miles} MILES[/]",
-            border_style=style,
-            box=box.DOUBLE
-        ))
-    else:
-        console.print(Panel(
-            "[#95e1d3 bold]✅ NO DISASTERS WITHIN SEARCH RADIUS[/]",
-            border_style="#95e1d3",
-            box=box.DOUBLE
-        ))
+        total = results.total_disasters
+        if total > 0:
+            style = "#ff6b6b bold" if total >= 5 else "#ffe66d bold" if total >= 2 else "#95e1d3 bold"
+            console.print(Panel(
+                f"[{style}]⚡ {total} TOTAL DISASTERS WITHIN {results.radius_miles} MILES[/]",
+                border_style=style,
+                box=box.DOUBLE
+            ))
+        else:
+            console.print(Panel(
+                "[#95e1d3 bold]✅ NO DISASTERS WITHIN SEARCH RADIUS[/]",
+                border_style="#95e1d3",
+                box=box.DOUBLE
+            ))
 
 
 def ask_continue() -> bool:
@@ -396,8 +438,23 @@ def ask_continue() -> bool:
     return choice == "again"
 
 
-def run_query(lat: float, lon: float, name: str, radius: float, types: List[DisasterType]) -> LocationResults:
-    """Execute the disaster query with a loading spinner."""
+def run_query(lat: float, lon: float, name: str, radius: float, types: List['DisasterType']) -> 'LocationResults':
+    """Execute the disaster query, with a loading spinner if it takes a while."""
+    from disasters import get_nearby_disasters
+    
+    future = _query_executor.submit(
+        get_nearby_disasters,
+        latitude=lat,
+        longitude=lon,
+        radius_miles=radius,
+        disaster_types=types,
+        name=name
+    )
+    try:
+        return future.result(timeout=SPINNER_DELAY_SECONDS)
+    except TimeoutError:
+        pass
+    
     with Progress(
         SpinnerColumn(style="#4ecdc4"),
         TextColumn("[#4ecdc4]{task.description}[/]"),
@@ -406,13 +463,7 @@ def run_query(lat: float, lon: float, name: str, radius: float, types: List[Disa
     ) as progress:
         task = progress.add_task("Scanning for nearby disasters...", total=None)
         
-        results = get_nearby_disasters(
-            latitude=lat,
-            longitude=lon,
-            radius_miles=radius,
-            disaster_types=types,
-            name=name
-        )
+        results = future.result()
         
         progress.update(task, description="Complete!")
     
@@ -421,16 +472,19 @@ def run_query(lat: float, lon: float, name: str, radius: float, types: List[Disa
 
 def interactive_session():
     """Run the main interactive session loop."""
-    # Suppress logging during interactive mode
-    configure_logging(logging.WARNING)
-    
-    # Clear screen and show banner
-    console.clear()
-    show_banner()
+    # Clear screen and show banner, written to the terminal in one go
+    with console:
+        console.clear()
+        show_banner()
+        
+        console.print()
+        console.print("[#4ecdc4]Welcome to the Natural Disaster Distance Monitor![/]")
+        console.print("[#6c757d]Track hurricanes, tornadoes, and wildfires near any location.[/]")
     
-    console.print()
-    console.print("[#4ecdc4]Welcome to the Natural Disaster Distance Monitor![/]")
-    console.print("[#6c757d]Track hurricanes, tornadoes, and wildfires near any location.[/]")
+    # Suppress logging during interactive mode (this is also where the
+    # disasters package is first loaded, after the banner is up)
+    from disasters import configure_logging
+    configure_logging(logging.WARNING)
     
     try:
         while True:
@@ -451,7 +505,7 @@ def interactive_session():
                 break
             
             console.print()
-            console.print("[#6c757d]─" * 65 + "[/]")
+            console.print(_SEPARATOR)
     
     except KeyboardInterrupt:
         pass
@@ -468,8 +522,9 @@ def interactive_session():
 
 def main():
     """Main entry point."""
-    # Fix Windows console encoding
-    if sys.platform == 'win32':
+    # Fix Windows console encoding (reconfigure flushes and rebuilds the
+    # stream, so skip it where the console is already UTF-8)
+    if sys.platform == 'win32' and (sys.stdout.encoding or '').lower() not in ('utf-8', 'utf8'):
         sys.stdout.reconfigure(encoding='utf-8')
     
     try:
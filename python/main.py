@@ -23,38 +23,37 @@ Usage Examples:
     
     # Output formats
     python main.py --lat 29.7604 --lon -95.3698 --json
+    python main.py --lat 29.7604 --lon -95.3698 --json --pretty
     python main.py --csv ../shared/data/test_locations.csv --output results.json
 """
 
 import argparse
-import json
 import sys
 import logging
 from datetime import datetime
-from typing import List, Optional
+from typing import TYPE_CHECKING, List, Optional
 
-from disasters import (
-    get_nearby_disasters,
-    query_locations_from_csv,
-    DisasterType,
-    LocationResults,
-    configure_logging,
-)
+# The disasters package (NumPy, pandas, requests) is imported once the
+# arguments are known to need a query, so interactive mode, --help and
+# usage errors start without loading it
+if TYPE_CHECKING:
+    from disasters import LocationResults
+
+# --type choices and the DisasterType values they select; values rather
+# than members so building this doesn't import the disasters package
+_TYPE_MAP = {
+    'hurricanes': 'hurricane',
+    'tornadoes': 'tornado',
+    'wildfires': 'wildfire',
+}
 
 
 def main():
     """Main entry point for the CLI."""
     # If no arguments provided, launch interactive mode
     if len(sys.argv) == 1:
-        try:
-            from interactive import main as interactive_main
-            interactive_main()
-            return
-        except ImportError as e:
-            print("Interactive mode requires 'rich' and 'questionary' packages.")
-            print("Install with: pip install rich questionary")
-            print(f"\nError: {e}")
-            sys.exit(1)
+        _launch_interactive()
+        return
     
     parser = argparse.ArgumentParser(
         description='Find natural disasters near a location',
@@ -94,7 +93,7 @@ def main():
         help='Search radius in miles (default: 100)'
     )
     parser.add_argument(
-        '--type', choices=['hurricanes', 'tornadoes', 'wildfires'],
+        '--type', choices=list(_TYPE_MAP),
         action='append', dest='types', metavar='TYPE',
         help='Disaster types to query (can repeat, default: all)'
     )
@@ -108,6 +107,10 @@ def main():
         '--output', '-o', type=str, metavar='FILE',
         help='Write JSON output to file'
     )
+    parser.add_argument(
+        '--pretty', action='store_true',
+        help='Indent JSON output (default: compact)'
+    )
     parser.add_argument(
         '--quiet', '-q', action='store_true',
         help='Suppress progress messages'
@@ -121,14 +124,8 @@ def main():
     
     # Handle interactive mode flag
     if args.interactive:
-        try:
-            from interactive import main as interactive_main
-            interactive_main()
-            return
-        except ImportError as e:
-            print("Interactive mode requires 'rich' and 'questionary' packages.")
-            print("Install with: pip install rich questionary")
-            sys.exit(1)
+        _launch_interactive()
+        return
     
     # Require either --lat or --csv if not interactive
     if args.lat is None and args.csv is None:
@@ -140,6 +137,13 @@ def main():
     if args.lon is not None and args.lat is None:
         parser.error('--lon requires --lat')
     
+    from disasters import (
+        get_nearby_disasters,
+        query_locations_from_csv,
+        DisasterType,
+        configure_logging,
+    )
+    
     # Configure logging
     if args.quiet:
         log_level = logging.WARNING
@@ -151,14 +155,7 @@ def main():
     configure_logging(log_level)
     
     # Convert type strings to enum
-    disaster_types = None
-    if args.types:
-        type_map = {
-            'hurricanes': DisasterType.HURRICANE,
-            'tornadoes': DisasterType.TORNADO,
-            'wildfires': DisasterType.WILDFIRE
-        }
-        disaster_types = [type_map[t] for t in args.types]
+    disaster_types = [DisasterType(_TYPE_MAP[t]) for t in args.types] if args.types else None
     
     # Execute query
     try:
@@ -180,7 +177,7 @@ def main():
         
         # Output results
         if args.json or args.output:
-            output_json(results, args.output)
+            output_json(results, args.output, pretty=args.pretty)
         else:
             output_table(results)
             
@@ -198,116 +195,153 @@ def main():
         sys.exit(1)
 
 
-def output_json(results: List[LocationResults], output_file: Optional[str] = None):
-    """Output results as JSON."""
+def _launch_interactive():
+    """Run the interactive session, or exit if its packages are missing."""
+    try:
+        from interactive import main as interactive_main
+    except ImportError as e:
+        print("Interactive mode requires 'rich' and 'questionary' packages.")
+        print("Install with: pip install rich questionary")
+        print(f"\nError: {e}")
+        sys.exit(1)
+    
+    interactive_main()
+
+
+def output_json(
+    results: List['LocationResults'],
+    output_file: Optional[str] = None,
+    pretty: bool = False
+):
+    """Output results as JSON, compact unless pretty is set."""
+    from disasters import serialize
+    
+    # LocationResults are passed as objects so serialize() converts each
+    # disaster result as it is encoded instead of building every dict first
     if len(results) == 1:
-        data = results[0].to_dict()
+        data = results[0]
     else:
         data = {
             'query_time': datetime.now().isoformat(),
-            'locations': [r.to_dict() for r in results],
+            'locations': results,
             'summary': {
                 'total_locations': len(results),
                 'total_disasters': sum(r.total_disasters for r in results)
             }
         }
     
-    json_str = json.dumps(data, indent=2, default=str)
+    json_bytes = serialize(data, indent=pretty)
     
     if output_file:
-        with open(output_file, 'w') as f:
-            f.write(json_str)
+        with open(output_file, 'wb') as f:
+            f.write(json_bytes)
         print(f"Results written to {output_file}")
     else:
-        print(json_str)
+        # Write the encoded document as is rather than decoding it for
+        # print() to encode again, unless stdout is a text-only stream
+        # (e.g. redirect_stdout(io.StringIO()) or some IDE consoles)
+        buffer = getattr(sys.stdout, 'buffer', None)
+        if buffer is None:
+            sys.stdout.write(json_bytes.decode('utf-8') + '\n')
+        else:
+            sys.stdout.flush()
+            buffer.write(json_bytes)
+            buffer.write(b'\n')
+            sys.stdout.flush()
 
 
-def output_table(results: List[LocationResults]):
+def output_table(results: List['LocationResults']):
     """Output results as formatted table."""
-    print()
-    print("=" * 60)
-    print("  NATURAL DISASTER DISTANCE MONITOR")
-    print("=" * 60)
+    # Lines are collected and printed together, so large batches make one
+    # write to stdout instead of several per disaster
+    lines = []
+    line = lines.append
+    
+    line("")
+    line("=" * 60)
+    line("  NATURAL DISASTER DISTANCE MONITOR")
+    line("=" * 60)
     
     for result in results:
-        print()
-        print(f"[*] Location: {result.location.name}")
-        print(f"    Coordinates: ({result.location.latitude}, {result.location.longitude})")
-        print(f"    Search Radius: {result.radius_miles} miles")
-        print()
+        line("")
+        line(f"[*] Location: {result.location.name}")
+        line(f"    Coordinates: ({result.location.latitude}, {result.location.longitude})")
+        line(f"    Search Radius: {result.radius_miles} miles")
+        line("")
         
         # Hurricanes
-        print(f"[HURRICANES] ({len(result.hurricanes)} found)")
+        line(f"[HURRICANES] ({len(result.hurricanes)} found)")
         if result.hurricanes:
             for h in result.hurricanes:
                 inside_str = " [INSIDE CONE]" if h.inside_cone else ""
-                print(f"    * {h.name} - {h.distance_miles:.1f} miles{inside_str}")
-                print(f"      {h.severity}")
+                line(f"    * {h.name} - {h.distance_miles:.1f} miles{inside_str}")
+                line(f"      {h.severity}")
                 if h.max_wind_mph:
                     wind_info = f"Max Wind: {h.max_wind_mph:.0f} mph"
                     if h.movement_direction and h.movement_speed_mph:
                         wind_info += f", Moving {h.movement_direction} at {h.movement_speed_mph:.0f} mph"
-                    print(f"      {wind_info}")
+                    line(f"      {wind_info}")
         else:
-            print("    No hurricanes within search radius.")
-        print()
+            line("    No hurricanes within search radius.")
+        line("")
         
         # Tornadoes
-        print(f"[TORNADOES] ({len(result.tornadoes)} found)")
+        line(f"[TORNADOES] ({len(result.tornadoes)} found)")
         if result.tornadoes:
             for t in result.tornadoes:
                 ef_str = f"EF{t.ef_scale.value}" if t.ef_scale else "Unknown"
                 date_str = t.storm_date.strftime("%Y-%m-%d") if t.storm_date else "Unknown date"
-                print(f"    * {ef_str} - {t.distance_miles:.1f} miles ({date_str})")
+                line(f"    * {ef_str} - {t.distance_miles:.1f} miles ({date_str})")
                 if t.path_length_miles and t.path_width_yards:
-                    print(f"      Path: {t.path_length_miles:.1f} mi x {t.path_width_yards:.0f} yds")
+                    line(f"      Path: {t.path_length_miles:.1f} mi x {t.path_width_yards:.0f} yds")
                 casualties = []
                 if t.fatalities:
                     casualties.append(f"{t.fatalities} fatalities")
                 if t.injuries:
                     casualties.append(f"{t.injuries} injuries")
                 if casualties:
-                    print(f"      Casualties: {', '.join(casualties)}")
+                    line(f"      Casualties: {', '.join(casualties)}")
         else:
-            print("    No recent tornadoes within search radius.")
-        print()
+            line("    No recent tornadoes within search radius.")
+        line("")
         
         # Wildfires
-        print(f"[WILDFIRES] ({len(result.wildfires)} found)")
+        line(f"[WILDFIRES] ({len(result.wildfires)} found)")
         if result.wildfires:
             for w in result.wildfires:
                 inside_str = " [INSIDE PERIMETER]" if w.inside_perimeter else ""
-                print(f"    * {w.name} - {w.distance_miles:.1f} miles{inside_str}")
+                line(f"    * {w.name} - {w.distance_miles:.1f} miles{inside_str}")
                 size_str = f"{w.acres:,.0f} acres" if w.acres else "Unknown size"
                 contain_str = f", {w.containment_percent:.0f}% contained" if w.containment_percent is not None else ""
-                print(f"      {size_str}{contain_str}")
+                line(f"      {size_str}{contain_str}")
         else:
-            print("    No active wildfires within search radius.")
+            line("    No active wildfires within search radius.")
         
-        print()
-        print("-" * 60)
-        print(f"    SUMMARY: {result.total_disasters} total disasters within {result.radius_miles} miles")
+        line("")
+        line("-" * 60)
+        line(f"    SUMMARY: {result.total_disasters} total disasters within {result.radius_miles} miles")
         if result.query_time:
-            print(f"    Query Time: {result.query_time.strftime('%Y-%m-%d %H:%M:%S')}")
-        print("-" * 60)
+            line(f"    Query Time: {result.query_time.strftime('%Y-%m-%d %H:%M:%S')}")
+        line("-" * 60)
     
     # Multi-location summary
     if len(results) > 1:
-        print()
-        print("=" * 60)
-        print("  BATCH SUMMARY")
-        print("=" * 60)
-        print(f"   Locations Queried: {len(results)}")
-        print(f"   Total Disasters Found: {sum(r.total_disasters for r in results)}")
+        line("")
+        line("=" * 60)
+        line("  BATCH SUMMARY")
+        line("=" * 60)
+        line(f"   Locations Queried: {len(results)}")
+        line(f"   Total Disasters Found: {sum(r.total_disasters for r in results)}")
         
         # Find location with most disasters
-        if results:
-            max_result = max(results, key=lambda r: r.total_disasters)
-            if max_result.total_disasters > 0:
-                print(f"   Most Affected: {max_result.location.name} ({max_result.total_disasters} disasters)")
-        print("=" * 60)
+        max_result = max(results, key=lambda r: r.total_disasters)
+        if max_result.total_disasters > 0:
+            line(f"   Most Affected: {max_result.location.name} ({max_result.total_disasters} disasters)")
+        line("=" * 60)
+    
+    line("")
     
-    print()
+    print('\n'.join(lines))
 
 
 if __name__ == '__main__':
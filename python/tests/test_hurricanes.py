@@ -0,0 +1,83 @@
+"""Tests for disasters.hurricanes."""
+
+import json
+import math
+
+import numpy as np
+import pandas as pd
+
+from disasters.hurricanes import _calculate_distances_to_cones, _latest_storm_positions
+from disasters.utils import haversine
+
+
+SQUARE = [[-96.0, 28.0], [-96.0, 30.0], [-94.0, 30.0], [-94.0, 28.0], [-96.0, 28.0]]
+CONES = [
+    {'geometry': {'rings': [SQUARE]}},
+    {'geometry': None, 'LAT': 25.0, 'LON': -80.0},
+    {'geometry': None},
+]
+
+
+def test_calculate_distances_to_cones():
+    lats = np.array([29.0, 35.0])
+    lons = np.array([-95.0, -95.0])
+
+    distances, inside = _calculate_distances_to_cones(lats, lons, CONES)
+
+    # Inside the polygon cone, the distance is zero
+    assert inside[0] == [True, False, False]
+    assert distances[0][0] == 0.0
+    # Outside, the distance is to the nearest cone vertex
+    expected = min(haversine(-95.0, 35.0, x, y) for x, y in SQUARE)
+    assert inside[1][0] is False
+    assert math.isclose(distances[1][0], expected)
+    # Cones without rings fall back to their point, or are unreachable
+    assert math.isclose(distances[1][1], haversine(-95.0, 35.0, -80.0, 25.0))
+    assert distances[1][2] == math.inf
+
+
+def test_calculate_distances_to_cones_accepts_json_geometry():
+    cones = [{'geometry': json.dumps({'rings': [SQUARE]})}]
+
+    distances, inside = _calculate_distances_to_cones(np.array([29.0]), np.array([-95.0]), cones)
+
+    assert inside == [[True]]
+    assert distances == [[0.0]]
+
+
+def test_calculate_distances_to_cones_batch_matches_single():
+    rng = np.random.default_rng(0)
+    lats = rng.uniform(20, 40, 50)
+    lons = rng.uniform(-110, -80, 50)
+
+    batch = _calculate_distances_to_cones(lats, lons, CONES)
+
+    for i in range(len(lats)):
+        distances, inside = _calculate_distances_to_cones(lats[i:i + 1], lons[i:i + 1], CONES)
+        assert inside[0] == batch[1][i]
+        np.testing.assert_allclose(distances[0], batch[0][i])
+
+
+def test_latest_storm_positions_uses_lowest_tau():
+    detailed_df = pd.DataFrame([
+        {'STORMNAME': 'ALPHA', 'STORMNUM': 1, 'TAU': 12, 'LAT': 2.0},
+        {'STORMNAME': 'ALPHA', 'STORMNUM': 1, 'TAU': 0, 'LAT': 1.0},
+        {'STORMNAME': 'ALPHA', 'STORMNUM': 1, 'TAU': 0, 'LAT': 9.0},
+        {'STORMNAME': 'BETA', 'STORMNUM': 2, 'TAU': None, 'LAT': 5.0},
+        {'STORMNAME': 'BETA', 'STORMNUM': 2, 'TAU': '24', 'LAT': 6.0},
+        {'STORMNAME': 'GAMMA', 'STORMNUM': 3, 'TAU': None, 'LAT': 7.0},
+    ])
+
+    positions = _latest_storm_positions(detailed_df)
+
+    # Ties keep the first record; missing TAUs are only used as a last resort
+    assert positions[('ALPHA', 1)]['LAT'] == 1.0
+    assert positions[('BETA', 2)]['LAT'] == 6.0
+    assert positions[('GAMMA', 3)]['LAT'] == 7.0
+    assert set(positions[('ALPHA', 1)]) == {'LAT'}
+
+
+def test_latest_storm_positions_without_key_columns():
+    positions = _latest_storm_positions(pd.DataFrame([{'TAU': 0, 'LAT': 1.0}]))
+
+    assert positions[(None, None)]['LAT'] == 1.0
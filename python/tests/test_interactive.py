@@ -0,0 +1,108 @@
+"""Tests for the interactive CLI."""
+
+import io
+import os
+import subprocess
+import sys
+
+import pytest
+from rich.console import Console
+
+import interactive
+from disasters.models import Location, LocationResults, WildfireResult
+
+
+class _CountingFile(io.StringIO):
+    """StringIO that counts write calls."""
+
+    def __init__(self):
+        super().__init__()
+        self.writes = 0
+
+    def write(self, text):
+        self.writes += 1
+        return super().write(text)
+
+
+@pytest.fixture
+def output(monkeypatch):
+    file = _CountingFile()
+    monkeypatch.setattr(interactive, 'console', Console(file=file, width=120, force_terminal=True))
+    return file
+
+
+def test_display_results_writes_once(output):
+    fire = WildfireResult(
+        disaster_type=None, name='Canyon Fire', distance_miles=12.3,
+        latitude=34.1, longitude=-118.1, severity='Large', acres=1234.0,
+        containment_percent=40.0, inside_perimeter=True
+    )
+    results = LocationResults(location=Location('LA', 34.05, -118.24), wildfires=[fire])
+
+    interactive.display_results(results)
+
+    text = output.getvalue()
+    assert output.writes == 1
+    assert 'Canyon Fire' in text and 'INSIDE PERIMETER' in text
+    assert 'No hurricanes within search radius' in text
+
+
+@pytest.mark.parametrize('text, expected', [
+    ('29.7604, -95.3698', (True, 29.7604, -95.3698)),
+    ('  29.7604 -95.3698 ', (True, 29.7604, -95.3698)),
+    ('29.,-95', (True, 29.0, -95.0)),
+    ('90 , 180', (True, 90.0, 180.0)),
+    ('', (False, None, None)),
+    ('   ', (False, None, None)),
+    ('29.7604', (False, None, None)),
+    ('29.7604,, -95.3698', (False, None, None)),
+    ('abc, def', (False, None, None)),
+    ('91, 0', (False, None, None)),
+    ('0, -180.5', (False, None, None)),
+])
+def test_validate_coordinate_format(text, expected):
+    assert interactive.validate_coordinate_format(text) == expected
+
+
+def test_show_banner_matches_markup_rendering(output):
+    interactive.show_banner()
+    reference = io.StringIO()
+    Console(file=reference, width=120, force_terminal=True).print(interactive.ASCII_BANNER)
+
+    assert output.getvalue() == reference.getvalue()
+
+
+def test_import_defers_disasters_package():
+    code = "import sys, interactive; sys.exit('disasters' in sys.modules)"
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+    assert subprocess.run([sys.executable, '-c', code], cwd=root).returncode == 0
+
+
+def test_run_query_skips_spinner_for_fast_queries(monkeypatch, output):
+    import disasters
+    results = LocationResults(location=Location('LA', 34.05, -118.24))
+    monkeypatch.setattr(disasters, 'get_nearby_disasters', lambda **kwargs: results)
+    monkeypatch.setattr(interactive, 'Progress', None)
+
+    assert interactive.run_query(34.05, -118.24, 'LA', 100, []) is results
+    assert output.getvalue() == ''
+
+
+@pytest.mark.parametrize('text, valid', [
+    ('25', True), ('007', True), ('0', False), ('000', False), ('', False),
+    ('-5', False), ('2.5', False), ('²', False),
+])
+def test_validate_radius(text, valid):
+    assert (interactive._validate_radius(text) is True) == valid
+
+
+def test_parse_coordinates_reuses_last_result(monkeypatch):
+    calls = []
+    parse = interactive.validate_coordinate_format
+    monkeypatch.setattr(interactive, 'validate_coordinate_format', lambda text: calls.append(text) or parse(text))
+
+    assert interactive._validate_coordinates('29.7604, -95.3698') is True
+    assert interactive._parse_coordinates('29.7604, -95.3698') == (True, 29.7604, -95.3698)
+    assert interactive._validate_coordinates('91, 0') is not True
+    assert calls == ['29.7604, -95.3698', '91, 0']
@@ -0,0 +1,74 @@
+"""Tests for the command-line entry point."""
+
+import contextlib
+import io
+import json
+import os
+import subprocess
+import sys
+
+import main
+from disasters.models import Location, LocationResults
+
+
+def test_output_json_writes_encoded_document_to_stdout(capsys):
+    results = LocationResults(location=Location('Zürich', 47.37, 8.54))
+
+    main.output_json([results])
+
+    out = capsys.readouterr().out
+    assert out.endswith('}\n') and '\n' not in out[:-1]
+    assert json.loads(out)['location']['name'] == 'Zürich'
+
+
+def test_output_table_prints_once(monkeypatch):
+    printed = []
+    monkeypatch.setattr('builtins.print', lambda *args: printed.append(args))
+    results = [LocationResults(location=Location('Houston', 29.76, -95.37)) for _ in range(3)]
+
+    main.output_table(results)
+
+    assert len(printed) == 1
+    assert printed[0][0].count('[*] Location: Houston') == 3
+
+
+def test_help_defers_disasters_package():
+    code = "import sys, main; sys.argv = ['main.py', '--help']\ntry:\n    main.main()\nexcept SystemExit:\n    pass\nsys.exit('disasters' in sys.modules)"
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+    assert subprocess.run([sys.executable, '-c', code], cwd=root, stdout=subprocess.DEVNULL).returncode == 0
+
+
+def test_type_arguments_select_disaster_types(monkeypatch, capsys):
+    import disasters
+    calls = []
+
+    def fake_query(**kwargs):
+        calls.append(kwargs['disaster_types'])
+        return LocationResults(location=Location(kwargs['name'], kwargs['latitude'], kwargs['longitude']))
+
+    monkeypatch.setattr(disasters, 'get_nearby_disasters', fake_query)
+    monkeypatch.setattr(disasters, 'configure_logging', lambda level: None)
+    monkeypatch.setattr(sys, 'argv', ['main.py', '--lat', '35', '--lon', '-97', '--type', 'tornadoes', '--type', 'wildfires'])
+
+    main.main()
+
+    assert calls == [[disasters.DisasterType.TORNADO, disasters.DisasterType.WILDFIRE]]
+    assert 'NATURAL DISASTER DISTANCE MONITOR' in capsys.readouterr().out
+
+
+def test_output_json_pretty_indents(capsys):
+    main.output_json([LocationResults(location=Location('Houston', 29.76, -95.37))], pretty=True)
+
+    out = capsys.readouterr().out
+    assert out.startswith('{\n  "query_time": null,\n  "location": {\n')
+
+
+def test_output_json_writes_to_text_only_stdout():
+    stdout = io.StringIO()
+
+    with contextlib.redirect_stdout(stdout):
+        main.output_json([LocationResults(location=Location('Houston', 29.76, -95.37))])
+
+    assert json.loads(stdout.getvalue())['location']['name'] == 'Houston'
+    assert stdout.getvalue().endswith('}\n')
@@ -0,0 +1,128 @@
+"""Tests for disasters.models."""
+
+import json
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+from disasters import models
+from disasters.models import (
+    DisasterType,
+    HurricaneCategory,
+    HurricaneResult,
+    Location,
+    LocationResults,
+    TornadoResult,
+    WildfireResult,
+)
+
+
+@pytest.mark.parametrize('wind, expected', [
+    (0, HurricaneCategory.TROPICAL_DEPRESSION),
+    (38.9, HurricaneCategory.TROPICAL_DEPRESSION),
+    (39, HurricaneCategory.TROPICAL_STORM),
+    (73, HurricaneCategory.TROPICAL_STORM),
+    (74, HurricaneCategory.CATEGORY_1),
+    (110, HurricaneCategory.CATEGORY_2),
+    (111, HurricaneCategory.CATEGORY_3),
+    (156.9, HurricaneCategory.CATEGORY_4),
+    (157, HurricaneCategory.CATEGORY_5),
+])
+def test_from_wind_speed(wind, expected):
+    assert HurricaneCategory.from_wind_speed(wind) is expected
+    assert HurricaneCategory.from_wind_speed_array([wind]) == [expected]
+
+
+@pytest.mark.parametrize('result_class, disaster_type', [
+    (HurricaneResult, DisasterType.HURRICANE),
+    (TornadoResult, DisasterType.TORNADO),
+    (WildfireResult, DisasterType.WILDFIRE),
+])
+def test_result_classes_use_slots(result_class, disaster_type):
+    result = result_class(
+        disaster_type=None, name='Test', distance_miles=12.345,
+        latitude=29.76041, longitude=-95.36981, severity='Severe'
+    )
+
+    assert not hasattr(result, '__dict__')
+    data = result.to_dict()
+    assert data['disaster_type'] == disaster_type.value
+    assert data['distance_miles'] == 12.35
+
+
+def test_to_dict_round_output_false_keeps_full_precision():
+    fire = WildfireResult(
+        disaster_type=None, name='Fire', distance_miles=12.34567,
+        latitude=34.123456, longitude=-118.123456, severity='Large', acres=1234.56
+    )
+    results = LocationResults(location=Location('LA', 34.05, -118.24), wildfires=[fire])
+
+    rounded = results.to_dict()['results']['wildfires'][0]
+    exact = results.to_dict(round_output=False)['results']['wildfires'][0]
+
+    assert (rounded['distance_miles'], rounded['latitude'], rounded['acres']) == (12.35, 34.1235, 1234.6)
+    assert (exact['distance_miles'], exact['latitude'], exact['acres']) == (12.34567, 34.123456, 1234.56)
+
+
+def test_location_classes_use_slots():
+    results = LocationResults(location=Location('Houston', 29.7604, -95.3698))
+
+    assert not hasattr(results, '__dict__')
+    assert not hasattr(results.location, '__dict__')
+    assert results.to_dict()['summary']['total_disasters'] == 0
+
+
+@pytest.mark.parametrize('use_orjson', [
+    False,
+    pytest.param(True, marks=pytest.mark.skipif(not models.ORJSON_AVAILABLE, reason='orjson not installed')),
+])
+def test_serialize_matches_to_dict(monkeypatch, use_orjson):
+    monkeypatch.setattr(models, 'ORJSON_AVAILABLE', use_orjson)
+    results = LocationResults(
+        location=Location('Houston', 29.7604, -95.3698),
+        hurricanes=[HurricaneResult(
+            disaster_type=None,
+            name='Alpha',
+            distance_miles=12.3456,
+            latitude=29.12345,
+            longitude=-94.98765,
+            severity='Tropical Storm',
+            category=HurricaneCategory.TROPICAL_STORM,
+            details={'pressure': np.float64(1002.5), 'issued': datetime(2026, 10, 1, 12, 30)},
+        )],
+        query_time=datetime(2026, 10, 1, 13, 0),
+    )
+
+    data = json.loads(models.serialize({'locations': [results]}))
+
+    expected = results.to_dict()
+    expected['results']['hurricanes'][0]['details'] = {'pressure': 1002.5, 'issued': '2026-10-01 12:30:00'}
+    assert data == {'locations': [expected]}
+
+
+@pytest.mark.skipif(not models.ORJSON_AVAILABLE, reason='orjson not installed')
+@pytest.mark.parametrize('indent', [True, False])
+def test_serialize_encoders_agree(monkeypatch, indent):
+    fire = WildfireResult(
+        disaster_type=None, name='Canyon Fire', distance_miles=float('nan'), latitude=34.1,
+        longitude=-118.1, severity='Large', acres=float('nan'), details={'size': np.float64('nan')},
+    )
+    data = {
+        'name': 'Zürich', 'values': [1, 2.5, None, float('nan'), float('inf'), (float('-inf'),)],
+        'nested': {'flag': True}, 'fire': fire,
+    }
+    with_orjson = models.serialize(data, indent=indent)
+    monkeypatch.setattr(models, 'ORJSON_AVAILABLE', False)
+
+    assert models.serialize(data, indent=indent) == with_orjson
+
+
+@pytest.mark.parametrize('use_orjson', [
+    False,
+    pytest.param(True, marks=pytest.mark.skipif(not models.ORJSON_AVAILABLE, reason='orjson not installed')),
+])
+def test_serialize_writes_non_finite_floats_as_null(monkeypatch, use_orjson):
+    monkeypatch.setattr(models, 'ORJSON_AVAILABLE', use_orjson)
+
+    assert models.serialize([float('nan'), np.float64('inf'), 1.5], indent=False) == b'[null,null,1.5]'
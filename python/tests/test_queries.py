@@ -0,0 +1,48 @@
+"""Tests for the query entry points in disasters/__init__.py."""
+
+import logging
+
+import pytest
+
+import disasters
+from disasters import DisasterType, query_locations_from_csv
+
+
+@pytest.fixture
+def locations_csv(tmp_path):
+    path = tmp_path / 'locations.csv'
+    path.write_text('name,latitude,longitude\nHouston,29.7604,-95.3698\nMiami,25.7617,-80.1918\n')
+    return str(path)
+
+
+def test_batch_failure_falls_back_to_per_location(monkeypatch, locations_csv, caplog):
+    def failing_batch(lats, lons, radius_miles):
+        raise RuntimeError('feed down')
+
+    def single(lat, lon, radius_miles):
+        if lat > 29:
+            raise RuntimeError('bad location')
+        return ['hurricane']
+
+    monkeypatch.setitem(disasters._BATCH_QUERIES, DisasterType.HURRICANE, ('hurricanes', failing_batch))
+    monkeypatch.setitem(disasters._QUERIES, DisasterType.HURRICANE, ('hurricanes', single))
+
+    with caplog.at_level(logging.ERROR, logger='disasters'):
+        houston, miami = query_locations_from_csv(locations_csv, disaster_types=[DisasterType.HURRICANE])
+
+    assert houston.hurricanes == []
+    assert miami.hurricanes == ['hurricane']
+    assert 'Error fetching hurricanes for Houston' in caplog.text
+
+
+def test_per_location_log_reports_merged_batch_counts(monkeypatch, locations_csv, caplog):
+    def batch(lats, lons, radius_miles):
+        return [['h1', 'h2'] for _ in lats]
+
+    monkeypatch.setitem(disasters._BATCH_QUERIES, DisasterType.HURRICANE, ('hurricanes', batch))
+
+    with caplog.at_level(logging.INFO, logger='disasters'):
+        query_locations_from_csv(locations_csv, disaster_types=[DisasterType.HURRICANE])
+
+    assert 'Query complete for Houston: 2 hurricanes' in caplog.text
+    assert '0 hurricanes' not in caplog.text
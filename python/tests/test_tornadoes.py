@@ -0,0 +1,69 @@
+"""Tests for disasters.tornadoes."""
+
+import math
+
+import numpy as np
+import pytest
+
+from disasters import tornadoes
+from disasters.utils import haversine
+
+
+OKC = (35.4676, -97.5164)
+
+
+def _feature(startlat, startlon, **attrs):
+    return {'attributes': {'startlat': startlat, 'startlon': startlon, 'efnum': 2, **attrs}}
+
+
+@pytest.fixture
+def features(monkeypatch):
+    features = [
+        _feature(36.0, -97.0, objectid=1),
+        _feature(None, -97.5, objectid=2),
+        _feature(35.5, -97.5, objectid=3),
+        _feature('bad', -97.5, objectid=4),
+        _feature(40.0, -80.0, objectid=5),
+    ]
+    monkeypatch.setattr(tornadoes, 'fetch_recent_tornadoes', lambda **kwargs: features)
+    return features
+
+
+def test_get_tornadoes_near_location_filters_and_sorts(features):
+    results = tornadoes.get_tornadoes_near_location(*OKC, radius_miles=100)
+
+    assert [r.details['objectid'] for r in results] == [3, 1]
+    assert math.isclose(results[0].distance_miles, haversine(OKC[1], OKC[0], -97.5, 35.5))
+    assert results[0].name == 'Tornado EF2'
+
+
+def test_start_coordinates_reuses_arrays_for_the_same_list(features):
+    first = tornadoes._start_coordinates(features)
+
+    assert all(a is b for a, b in zip(tornadoes._start_coordinates(features), first))
+    assert not first[0].flags.writeable
+    np.testing.assert_array_equal(first[0], [36.0, np.nan, 35.5, np.nan, 40.0])
+
+
+def test_fetch_caches_empty_feed_and_keeps_it_through_failures(monkeypatch):
+    responses = iter([[], None])
+    calls = []
+
+    def fetch_layers(session, urls, params):
+        calls.append(params)
+        return (next(responses),)
+
+    now = [1000.0]
+    monkeypatch.setattr(tornadoes, 'fetch_arcgis_layers', fetch_layers)
+    monkeypatch.setattr(tornadoes, 'get_shared_session', lambda retries: None)
+    monkeypatch.setattr('disasters.utils.time.monotonic', lambda: now[0])
+    tornadoes.fetch_recent_tornadoes.cache_clear()
+
+    assert tornadoes.fetch_recent_tornadoes() == []
+    assert tornadoes.fetch_recent_tornadoes() == []
+    assert len(calls) == 1
+    # After expiry a failed refresh falls back to the cached (empty) feed
+    now[0] += 700
+    assert tornadoes.fetch_recent_tornadoes() == []
+    assert len(calls) == 2
+    tornadoes.fetch_recent_tornadoes.cache_clear()
@@ -0,0 +1,482 @@
+"""Tests for disasters.utils."""
+
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from disasters import utils
+from disasters.utils import is_point_in_polygon_vectorized, is_point_in_polygons
+
+
+def _random_polygons(rng, count):
+    """Random star-shaped polygons as (concatenated x, concatenated y, starts)."""
+    polygons = []
+    for _ in range(count):
+        n = rng.integers(3, 30)
+        angles = np.sort(rng.uniform(0, 2 * np.pi, n))
+        radii = rng.uniform(0.5, 3.0, n)
+        center = rng.uniform(-5, 5, 2)
+        polygons.append(np.column_stack([
+            center[0] + radii * np.cos(angles),
+            center[1] + radii * np.sin(angles),
+        ]))
+    vertices = np.concatenate(polygons)
+    starts = np.cumsum([0] + [len(p) for p in polygons[:-1]])
+    return polygons, vertices[:, 0], vertices[:, 1], starts
+
+
+@pytest.mark.parametrize('implementation', [
+    '_points_in_polygons_numpy',
+    pytest.param('_points_in_polygons_numba', marks=pytest.mark.skipif(
+        not utils.NUMBA_AVAILABLE, reason='numba not installed'
+    )),
+])
+def test_points_in_polygons_matches_single_polygon_check(monkeypatch, implementation):
+    # Compare against the NumPy single-polygon implementation
+    monkeypatch.setattr(utils, 'NUMBA_AVAILABLE', False)
+    rng = np.random.default_rng(0)
+    polygons, poly_x, poly_y, starts = _random_polygons(rng, 5)
+    x = rng.uniform(-9, 9, 5000)
+    y = rng.uniform(-9, 9, 5000)
+    # Include the vertices themselves to exercise the edge tolerance
+    x = np.concatenate([x, poly_x])
+    y = np.concatenate([y, poly_y])
+
+    result = getattr(utils, implementation)(x, y, poly_x, poly_y, starts)
+
+    expected = np.column_stack([
+        is_point_in_polygon_vectorized(x, y, polygon) for polygon in polygons
+    ])
+    np.testing.assert_array_equal(result, expected)
+
+
+@pytest.mark.skipif(not utils.NUMBA_AVAILABLE, reason='numba not installed')
+def test_is_point_in_polygon_vectorized_numba_matches_numpy(monkeypatch):
+    rng = np.random.default_rng(1)
+    polygons, poly_x, poly_y, _ = _random_polygons(rng, 5)
+    x = np.concatenate([rng.uniform(-9, 9, 2000), poly_x])
+    y = np.concatenate([rng.uniform(-9, 9, 2000), poly_y])
+
+    compiled = [is_point_in_polygon_vectorized(x, y, polygon) for polygon in polygons]
+    monkeypatch.setattr(utils, 'NUMBA_AVAILABLE', False)
+    expected = [is_point_in_polygon_vectorized(x, y, polygon) for polygon in polygons]
+
+    np.testing.assert_array_equal(compiled, expected)
+
+
+def test_is_point_in_polygons_scalar_point():
+    square = [(-100, 25), (-100, 35), (-90, 35), (-90, 25)]
+    diamond = [(0, 1), (1, 0), (0, -1), (-1, 0)]
+    vertices = np.array(square + diamond, dtype=float)
+
+    result = is_point_in_polygons(-95, 30, vertices[:, 0], vertices[:, 1], np.array([0, 4]))
+
+    assert result.tolist() == [True, False]
+
+
+def _counting(result=None):
+    calls = []
+
+    def func(*args):
+        calls.append(args)
+        return result if result is not None else len(calls)
+
+    return func, calls
+
+
+def test_ttl_cache_expires_after_ttl(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(utils.time, 'monotonic', lambda: now[0])
+    func, calls = _counting()
+    cached = utils.ttl_cache(seconds=10)(func)
+
+    assert cached('a') == 1
+    now[0] += 9
+    assert cached('a') == 1
+    now[0] += 2
+    assert cached('a') == 2
+    assert len(calls) == 2
+
+
+def test_ttl_cache_skips_results_rejected_by_cache_if():
+    func, calls = _counting()
+    cached = utils.ttl_cache(cache_if=lambda result: result > 1)(func)
+
+    assert cached() == 1
+    assert cached() == 2
+    assert cached() == 2
+    assert len(calls) == 2
+
+
+def test_ttl_cache_serves_stale_result_when_refresh_fails(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(utils.time, 'monotonic', lambda: now[0])
+    results = iter(['fresh', None, None])
+    cached = utils.ttl_cache(seconds=10, cache_if=bool, stale_if_error=60)(lambda: next(results))
+
+    assert cached() == 'fresh'
+    now[0] += 30
+    assert cached() == 'fresh'
+    now[0] += 60
+    assert cached() is None
+
+
+def test_ttl_cache_clear_forces_refetch():
+    func, calls = _counting()
+    cached = utils.ttl_cache()(func)
+
+    cached()
+    cached.cache_clear()
+    cached()
+    assert len(calls) == 2
+
+
+def test_ttl_cache_concurrent_callers_fetch_once():
+    release = threading.Event()
+    calls = []
+
+    def slow_fetch():
+        calls.append(1)
+        release.wait(5)
+        return 'data'
+
+    cached = utils.ttl_cache()(slow_fetch)
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        futures = [pool.submit(cached) for _ in range(8)]
+        time.sleep(0.1)
+        release.set()
+        results = [future.result() for future in futures]
+
+    assert results == ['data'] * 8
+    assert len(calls) == 1
+
+
+@pytest.mark.parametrize('use_numba', [
+    False,
+    pytest.param(True, marks=pytest.mark.skipif(not utils.NUMBA_AVAILABLE, reason='numba not installed')),
+])
+def test_is_point_in_polygon_vectorized_even_crossings_are_outside(monkeypatch, use_numba):
+    monkeypatch.setattr(utils, 'NUMBA_AVAILABLE', use_numba)
+    # U shape: the notch at (1.5, 2) is outside, and its ray crosses two edges
+    u_shape = [(0, 0), (3, 0), (3, 3), (2, 3), (2, 1), (1, 1), (1, 3), (0, 3)]
+    lons = np.array([1.5, 0.5, 2.5, 1.5])
+    lats = np.array([2.0, 2.0, 2.0, 0.5])
+
+    result = is_point_in_polygon_vectorized(lons, lats, u_shape)
+
+    assert result.tolist() == [False, True, True, True]
+
+
+@pytest.mark.parametrize('use_numba', [
+    False,
+    pytest.param(True, marks=pytest.mark.skipif(not utils.NUMBA_AVAILABLE, reason='numba not installed')),
+])
+def test_is_point_in_polygon_vectorized_points_on_boundary(monkeypatch, use_numba):
+    monkeypatch.setattr(utils, 'NUMBA_AVAILABLE', use_numba)
+    square = [(0, 0), (0, 2), (2, 2), (2, 0)]
+    lons = np.array([0.0, 1.0, 2.0])
+    lats = np.array([0.0, 2.0, 1.0])
+
+    assert is_point_in_polygon_vectorized(lons, lats, square).all()
+
+
+def test_get_shared_session_reuses_pooled_session():
+    session = utils.get_shared_session(retries=2)
+
+    assert utils.get_shared_session(retries=2) is session
+    assert session.get_adapter('https://example.com')._pool_maxsize == utils.HTTP_POOL_SIZE
+
+
+class _FakeArcGISSession:
+    """Serves a fixed feature list, truncating pages to max_records."""
+
+    def __init__(self, total, max_records=None, count_supported=True):
+        self.features = [{'attributes': {'id': i}} for i in range(total)]
+        self.max_records = max_records
+        self.count_supported = count_supported
+
+    def get(self, url, params, timeout):
+        if params.get('returnCountOnly') == 'true':
+            body = {'count': len(self.features)} if self.count_supported else {'error': {'code': 400}}
+        else:
+            count = params['resultRecordCount']
+            if self.max_records:
+                count = min(count, self.max_records)
+            offset = params['resultOffset']
+            body = {'features': self.features[offset:offset + count]}
+        return _FakeResponse(body)
+
+
+class _FakeResponse:
+    def __init__(self, body):
+        self.content = json.dumps(body).encode()
+
+
+@pytest.mark.parametrize('session', [
+    _FakeArcGISSession(23),
+    _FakeArcGISSession(23, max_records=3),
+    _FakeArcGISSession(23, count_supported=False),
+    _FakeArcGISSession(0),
+])
+def test_fetch_arcgis_layers_returns_every_feature_in_order(session):
+    (features,) = utils.fetch_arcgis_layers(session, ['url'], {'f': 'json', 'resultRecordCount': 5})
+
+    assert [f['attributes']['id'] for f in features] == list(range(len(session.features)))
+
+
+def test_haversine_from_prep_matches_haversine_vectorized():
+    rng = np.random.default_rng(0)
+    lons, lats = rng.uniform(-180, 180, (2, 100))
+    user_lons, user_lats = rng.uniform(-180, 180, (2, 7))
+
+    result = utils.haversine_from_prep(
+        utils.haversine_prepare(user_lons[:, np.newaxis], user_lats[:, np.newaxis]),
+        utils.haversine_prepare(lons, lats)
+    )
+
+    expected = utils.haversine_vectorized(user_lons[:, np.newaxis], user_lats[:, np.newaxis], lons, lats)
+    np.testing.assert_array_equal(result, expected)
+
+
+@pytest.mark.parametrize('use_numba', [
+    False,
+    pytest.param(True, marks=pytest.mark.skipif(not utils.NUMBA_AVAILABLE, reason='numba not installed')),
+])
+def test_haversine_batch_matches_haversine_vectorized(monkeypatch, use_numba):
+    monkeypatch.setattr(utils, 'NUMBA_AVAILABLE', use_numba)
+    rng = np.random.default_rng(0)
+    lons, lats = rng.uniform(-180, 180, (2, 100))
+    lats[3] = np.nan
+    out = np.empty(100)
+
+    result = utils.haversine_batch(-97.5, 35.5, lons, lats, out=out)
+
+    assert result is out
+    np.testing.assert_allclose(result, utils.haversine_vectorized(-97.5, 35.5, lons, lats), rtol=1e-12)
+    assert np.isnan(result[3])
+
+
+@pytest.mark.parametrize('use_numba', [
+    False,
+    pytest.param(True, marks=pytest.mark.skipif(not utils.NUMBA_AVAILABLE, reason='numba not installed')),
+])
+def test_haversine_min_by_group(monkeypatch, use_numba):
+    monkeypatch.setattr(utils, 'NUMBA_AVAILABLE', use_numba)
+    rng = np.random.default_rng(0)
+    lons, lats = rng.uniform(-100, -80, (2, 60))
+    user_lons, user_lats = rng.uniform(-100, -80, (2, 20))
+    starts = np.array([0, 10, 35])
+
+    result = utils.haversine_min_by_group(
+        utils.haversine_prepare(user_lons, user_lats),
+        utils.haversine_prepare(lons, lats),
+        starts,
+        max_miles=60
+    )
+
+    full = utils.haversine_vectorized(user_lons[:, np.newaxis], user_lats[:, np.newaxis], lons, lats)
+    expected = np.minimum.reduceat(full, starts, axis=1)
+    within = expected <= 60
+    assert within.any() and not within.all()
+    np.testing.assert_allclose(result[within], expected[within], atol=1e-3)
+    assert np.isinf(result[~within]).all()
+
+
+@pytest.mark.parametrize('lon, lat', [(-97.5, 35.5), (179.5, 10.0), (0.0, 89.0)])
+def test_points_near_point_never_rejects_a_close_point(lon, lat):
+    rng = np.random.default_rng(0)
+    lons = rng.uniform(-180, 180, 5000)
+    lats = rng.uniform(-90, 90, 5000)
+
+    near = utils.points_near_point(lon, lat, lons, lats, 500)
+
+    within = utils.haversine_vectorized(lon, lat, lons, lats) <= 500
+    assert within.any() and not near.all()
+    assert near[within].all()
+
+
+def test_points_near_bboxes_never_rejects_a_close_pair():
+    rng = np.random.default_rng(0)
+    lons = rng.uniform(-180, 180, 400)
+    lats = rng.uniform(-89, 89, 400)
+    vertex_lons = rng.uniform(-180, 180, (30, 8))
+    vertex_lats = rng.uniform(-89, 89, (30, 8))
+    # Small boxes, including some straddling the antimeridian and near the poles
+    vertex_lons = vertex_lons[:, :1] + rng.uniform(-5, 5, (30, 8))
+    vertex_lats = np.clip(vertex_lats[:, :1] + rng.uniform(-5, 5, (30, 8)), -89.9, 89.9)
+    vertex_lons = (vertex_lons + 180) % 360 - 180
+    bboxes = np.column_stack([
+        vertex_lons.min(axis=1), vertex_lats.min(axis=1),
+        vertex_lons.max(axis=1), vertex_lats.max(axis=1),
+    ])
+
+    near = utils.points_near_bboxes(lons, lats, bboxes, 1500)
+
+    nearest = utils.haversine_vectorized(
+        lons[:, np.newaxis, np.newaxis], lats[:, np.newaxis, np.newaxis],
+        vertex_lons, vertex_lats
+    ).min(axis=2)
+    assert near[nearest <= 1500].all()
+    assert not near.all()
+
+
+def test_bbox_candidates_matches_dense_check():
+    rng = np.random.default_rng(1)
+    lons = rng.uniform(-180, 180, 300)
+    lats = rng.uniform(-89, 89, 300)
+    corner_lons = rng.uniform(-180, 175, 200)
+    corner_lats = rng.uniform(-89, 80, 200)
+    bboxes = np.column_stack([
+        corner_lons, corner_lats,
+        corner_lons + rng.uniform(0, 5, 200), corner_lats + rng.uniform(0, 9, 200),
+    ])
+
+    for max_miles in (50, 800, 9000):
+        points, boxes = utils.bbox_candidates(lons, lats, bboxes, max_miles)
+        dense = utils.points_near_bboxes(lons, lats, bboxes, max_miles)
+
+        assert sorted(zip(points, boxes)) == sorted(zip(*np.nonzero(dense)))
+
+        indexed = utils.bbox_candidates(lons, lats, bboxes, max_miles, index=utils.bbox_index(bboxes))
+        for result, reference in zip(indexed, (points, boxes)):
+            np.testing.assert_array_equal(result, reference)
+
+
+def test_features_to_dataframe_matches_record_construction():
+    uniform = [{'attributes': {'a': 1, 'b': 'x'}}, {'attributes': {'a': None, 'b': 'y'}}]
+    mixed = [{'attributes': {'a': 1}}, {'attributes': {'b': 'y'}}]
+
+    for features in (uniform, mixed):
+        expected = pd.DataFrame([feature['attributes'] for feature in features])
+        pd.testing.assert_frame_equal(utils.features_to_dataframe(features), expected)
+
+    assert utils.features_to_dataframe([]).empty
+
+
+@pytest.mark.parametrize('use_numba', [
+    False,
+    pytest.param(True, marks=pytest.mark.skipif(not utils.NUMBA_AVAILABLE, reason='numba not installed')),
+])
+def test_polygon_distances_matches_separate_checks(monkeypatch, use_numba):
+    monkeypatch.setattr(utils, 'NUMBA_AVAILABLE', use_numba)
+    rng = np.random.default_rng(2)
+    polygons, poly_x, poly_y, starts = _random_polygons(rng, 6)
+    x = np.concatenate([rng.uniform(-9, 9, 500), poly_x])
+    y = np.concatenate([rng.uniform(-9, 9, 500), poly_y])
+
+    distances, inside = utils.polygon_distances(x, y, poly_x, poly_y, starts, max_miles=150)
+
+    expected_inside = np.column_stack([
+        is_point_in_polygon_vectorized(x, y, polygon) for polygon in polygons
+    ])
+    full = utils.haversine_vectorized(x[:, np.newaxis], y[:, np.newaxis], poly_x, poly_y)
+    expected = np.minimum.reduceat(full, starts, axis=1)
+    within = expected <= 150
+    np.testing.assert_array_equal(inside, expected_inside)
+    np.testing.assert_allclose(distances[within], expected[within], atol=1e-3)
+    assert np.isinf(distances[~within]).all()
+
+
+@pytest.mark.parametrize('use_numba', [
+    False,
+    pytest.param(True, marks=pytest.mark.skipif(not utils.NUMBA_AVAILABLE, reason='numba not installed')),
+])
+def test_polygon_distances_accepts_prepared_vertices(monkeypatch, use_numba):
+    monkeypatch.setattr(utils, 'NUMBA_AVAILABLE', use_numba)
+    rng = np.random.default_rng(3)
+    _, poly_x, poly_y, starts = _random_polygons(rng, 4)
+    x, y = rng.uniform(-9, 9, 50), rng.uniform(-9, 9, 50)
+
+    expected = utils.polygon_distances(x, y, poly_x, poly_y, starts, max_miles=150)
+    prepared = utils.polygon_distances(
+        x, y, poly_x, poly_y, starts, max_miles=150,
+        vertex_prep=utils.haversine_prepare(poly_x, poly_y)
+    )
+
+    for result, reference in zip(prepared, expected):
+        np.testing.assert_array_equal(result, reference)
+
+
+@pytest.mark.parametrize('use_numba', [
+    False,
+    pytest.param(True, marks=pytest.mark.skipif(not utils.NUMBA_AVAILABLE, reason='numba not installed')),
+])
+def test_polygon_distances_with_edges_measures_to_the_boundary(monkeypatch, use_numba):
+    monkeypatch.setattr(utils, 'NUMBA_AVAILABLE', use_numba)
+    rng = np.random.default_rng(4)
+    polygons, poly_x, poly_y, starts = _random_polygons(rng, 3)
+    x, y = rng.uniform(-9, 9, 40), rng.uniform(-9, 9, 40)
+    edges = utils.great_circle_edges(poly_x, poly_y, starts)
+
+    distances, _ = utils.polygon_distances(x, y, poly_x, poly_y, starts, edges=edges)
+
+    # Reference: densely sampled points along each great-circle edge
+    t = np.linspace(0, 1, 2001)[:, np.newaxis]
+    for p, polygon in enumerate(polygons):
+        lon, lat = np.radians(polygon).T
+        xyz = np.column_stack([np.cos(lat) * np.cos(lon), np.cos(lat) * np.sin(lon), np.sin(lat)])
+        samples = []
+        for a, b in zip(xyz, np.roll(xyz, -1, axis=0)):
+            omega = np.arccos(np.clip(a @ b, -1, 1))
+            samples.append((np.sin((1 - t) * omega) * a + np.sin(t * omega) * b) / np.sin(omega))
+        samples = np.concatenate(samples)
+        sample_lons = np.degrees(np.arctan2(samples[:, 1], samples[:, 0]))
+        sample_lats = np.degrees(np.arcsin(samples[:, 2] / np.linalg.norm(samples, axis=1)))
+        reference = utils.haversine_vectorized(
+            x[:, np.newaxis], y[:, np.newaxis], sample_lons, sample_lats
+        ).min(axis=1)
+        assert (distances[:, p] <= reference + 1e-3).all()
+        np.testing.assert_allclose(distances[:, p], reference, atol=0.01)
+
+
+def test_great_circle_edges_marks_zero_length_edges():
+    # Closed ring: the last vertex repeats the first
+    ring_x = np.array([0.0, 0.0, 1.0, 0.0])
+    ring_y = np.array([0.0, 1.0, 1.0, 0.0])
+
+    edges = utils.great_circle_edges(ring_x, ring_y, [0])
+
+    assert np.isnan(edges[3]).all()
+    assert np.isfinite(edges[:3]).all()
+    assert utils.great_circle_edges(np.empty(0), np.empty(0), []).shape == (0, 9)
+
+
+@pytest.mark.parametrize('content, expected', [
+    (
+        'name,latitude,longitude\nHouston TX, 29.7604 ,-95.3698\nBad,abc,1\n,35.0,-97.0\nFar,91,0\nMiami ,25.7617,-80.1918\n',
+        [
+            {'name': 'Houston TX', 'latitude': 29.7604, 'longitude': -95.3698},
+            {'name': 'Location 4', 'latitude': 35.0, 'longitude': -97.0},
+            {'name': 'Miami', 'latitude': 25.7617, 'longitude': -80.1918},
+        ],
+    ),
+    (
+        'location,latitude,longitude\nHouston,29.7604,-95.3698\n',
+        [{'name': 'Houston', 'latitude': 29.7604, 'longitude': -95.3698}],
+    ),
+    (
+        'name,location,latitude,longitude\n,Fallback,29.7604,-95.3698\n',
+        [{'name': 'Fallback', 'latitude': 29.7604, 'longitude': -95.3698}],
+    ),
+])
+def test_load_locations(tmp_path, content, expected):
+    path = tmp_path / 'locations.csv'
+    path.write_text(content)
+
+    frame = utils.load_locations_frame(str(path))
+
+    assert frame.to_dict('records') == expected
+    assert utils.load_locations_from_csv(str(path)) == expected
+
+
+def test_load_locations_frame_requires_columns(tmp_path):
+    path = tmp_path / 'locations.csv'
+    path.write_text('name,lat,lon\nHouston,29.7604,-95.3698\n')
+
+    with pytest.raises(ValueError, match='latitude, longitude'):
+        utils.load_locations_frame(str(path))
@@ -0,0 +1,119 @@
+"""Tests for disasters.wildfires."""
+
+import math
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from disasters import wildfires
+from disasters.utils import EARTH_RADIUS_MILES
+
+
+def _square(lon, lat, half):
+    return [
+        [lon - half, lat - half], [lon - half, lat + half],
+        [lon + half, lat + half], [lon + half, lat - half], [lon - half, lat - half],
+    ]
+
+
+def _to_meridian(lat, dlon):
+    """Great-circle distance from a point to a meridian dlon degrees away."""
+    return EARTH_RADIUS_MILES * math.asin(math.cos(math.radians(lat)) * math.sin(math.radians(dlon)))
+
+
+@pytest.fixture
+def fires(monkeypatch):
+    fires_df = pd.DataFrame({
+        'poly_IncidentName': ['Around', 'Donut', 'Nearby', 'Far', 'No Perimeter'],
+        'poly_IRWINID': ['a', 'b', 'c', 'd', 'e'],
+        'attr_IncidentSize': [5000.0, 250.0, 50.0, 20000.0, 10.0],
+        'attr_PercentContained': [10.0, None, 100.0, 0.0, None],
+        'attr_POOLatitude': [34.0, 34.0, 34.0, 45.0, 34.0],
+        'attr_POOLongitude': [-118.0, -118.0, -117.0, -100.0, -118.0],
+        'geometry_rings': [
+            [_square(-118.0, 34.0, 0.5)],
+            [_square(-118.0, 34.0, 0.5), _square(-118.0, 34.0, 0.1)],
+            [_square(-117.0, 34.0, 0.2)],
+            [_square(-100.0, 45.0, 0.5)],
+            [],
+        ],
+    })
+    monkeypatch.setattr(wildfires, 'fetch_active_wildfires', lambda **kwargs: fires_df)
+    return fires_df
+
+
+def test_get_wildfires_near_location(fires):
+    results = wildfires.get_wildfires_near_location(34.0, -118.0, radius_miles=100)
+
+    by_name = {r.name: r for r in results}
+    assert set(by_name) == {'Around', 'Donut', 'Nearby'}
+    assert by_name['Around'].inside_perimeter and by_name['Around'].distance_miles == 0.0
+    # Inside the donut's hole: outside the burned area, distance to the hole ring.
+    # The nearest boundary points are mid-edge, not at the corners
+    assert not by_name['Donut'].inside_perimeter
+    assert math.isclose(by_name['Donut'].distance_miles, _to_meridian(34.0, 0.1))
+    assert math.isclose(by_name['Nearby'].distance_miles, _to_meridian(34.0, 0.8))
+    assert [r.name for r in results] == ['Around', 'Donut', 'Nearby']
+    assert by_name['Nearby'].severity == 'Small Fire (< 100 acres) (100% contained)'
+    assert (by_name['Around'].latitude, by_name['Around'].longitude) == pytest.approx((34.0, -118.0), abs=0.11)
+
+
+def test_calculate_distances_to_fires_folds_rings():
+    rings = [
+        [_square(-118.0, 34.0, 0.5), _square(-118.0, 34.0, 0.1)],
+        [_square(-118.0, 34.0, 0.5), _square(-117.0, 36.0, 0.1)],
+        [[[-118.0, 34.0], [-117.9, 34.0]]],
+        [_square(-100.0, 45.0, 0.5)],
+    ]
+
+    distances, inside = wildfires._calculate_distances_to_fires(
+        34.0, -118.0, wildfires._parse_fire_perimeters(rings), max_miles=100
+    )
+
+    # A hole only excludes points inside it; degenerate rings are skipped
+    assert inside.tolist() == [False, True, False, False]
+    assert distances[1] == 0.0
+    assert math.isclose(distances[0], _to_meridian(34.0, 0.1))
+    assert math.isinf(distances[2]) and math.isinf(distances[3])
+
+
+def test_fire_perimeters_reuses_arrays_for_the_same_frame(fires):
+    first = wildfires._fire_perimeters(fires)
+
+    assert wildfires._fire_perimeters(fires) is first
+    assert first.n_fires == 5
+    assert first.ring_fires.tolist() == [0, 1, 1, 2, 3]
+    assert first.ring_is_outer.tolist() == [True, True, False, True, True]
+    assert not first.vertex_lons.flags.writeable
+    np.testing.assert_allclose(first.ring_bboxes[2], [-118.1, 33.9, -117.9, 34.1])
+    # Mean of the outer ring's vertices, including the repeated closing vertex
+    assert first.centroids[2] == pytest.approx((34.0 - 0.2 / 5, -117.0 - 0.2 / 5))
+    assert first.centroids[4] is None
+
+
+def test_fetch_caches_empty_feed_and_reports_failures_as_none(monkeypatch):
+    responses = iter([[], None])
+    calls = []
+
+    def fetch_layers(session, urls, params):
+        calls.append(params)
+        return (next(responses),)
+
+    monkeypatch.setattr(wildfires, 'fetch_arcgis_layers', fetch_layers)
+    monkeypatch.setattr(wildfires, 'get_shared_session', lambda retries: None)
+    wildfires.fetch_active_wildfires.cache_clear()
+
+    assert wildfires.fetch_active_wildfires().empty
+    assert wildfires.fetch_active_wildfires().empty
+    assert len(calls) == 1
+
+    wildfires.fetch_active_wildfires.cache_clear()
+    assert wildfires.fetch_active_wildfires() is None
+    wildfires.fetch_active_wildfires.cache_clear()
+
+
+def test_get_wildfires_near_location_handles_failed_fetch(monkeypatch):
+    monkeypatch.setattr(wildfires, 'fetch_active_wildfires', lambda **kwargs: None)
+
+    assert wildfires.get_wildfires_near_location(34.0, -118.0) == []